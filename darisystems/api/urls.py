@@ -1,9 +1,12 @@
 from django.urls import path, include
 
+from common.views import SuggestView
+
 urlpatterns = [
     path("portfolio/", include("portfolio.urls")),
     path("content/", include("content.urls")),
     path("assets/", include("assets.urls")),
     path("marketing/", include("marketing.urls")),
     path("booking/", include("booking.urls")),
+    path("suggest/", SuggestView.as_view(), name="suggest"),
 ]
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class AssetsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'assets'
+
+    def ready(self):
+        from common import search, suggest
+        from .models import Asset, AssetStatus
+
+        # Must cover AssetViewSet.search_fields for the full-text path to be used (else icontains).
+        search.register(Asset, ["title", "description"])
+        suggest.register(Asset, "asset", filters={"status": AssetStatus.PUBLISHED})
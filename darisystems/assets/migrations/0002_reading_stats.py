@@ -0,0 +1,40 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:29
+
+from django.db import migrations, models
+
+from common.models import reading_stats
+
+READING_FIELDS = ("description",)
+
+
+def backfill_reading_stats(apps, schema_editor):
+    Asset = apps.get_model("assets", "Asset")
+    batch = []
+    for obj in Asset.objects.only("pk", *READING_FIELDS).iterator(chunk_size=500):
+        obj.word_count, obj.auto_excerpt = reading_stats(*(getattr(obj, f) for f in READING_FIELDS))
+        batch.append(obj)
+        if len(batch) >= 500:
+            Asset.objects.bulk_update(batch, ["word_count", "auto_excerpt"])
+            batch = []
+    Asset.objects.bulk_update(batch, ["word_count", "auto_excerpt"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='asset',
+            name='auto_excerpt',
+            field=models.CharField(blank=True, default='', editable=False, max_length=300),
+        ),
+        migrations.AddField(
+            model_name='asset',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_reading_stats, migrations.RunPython.noop),
+    ]
@@ -9,7 +9,7 @@ from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.db.models import Q
 from django.utils import timezone
-from common.models import TimeStampedModel,TagScope, PublishStatus
+from common.models import ReadingStatsModel, TimeStampedModel,TagScope, PublishStatus
 
 
 
@@ -32,7 +32,9 @@ class AssetStatus(models.TextChoices):
     ARCHIVED = "ARCHIVED", "Archived"
 
 
-class Asset(TimeStampedModel):
+class Asset(ReadingStatsModel):
+    reading_fields = ("description",)
+
     title = models.CharField(max_length=200)
     slug = models.SlugField(max_length=220, unique=True)
     description = models.TextField(blank=True, null=True)
@@ -1,14 +1,37 @@
 from rest_framework import serializers
+from common.search import SearchHitMixin
 from common.models import Tag, TagScope
 from .models import Asset, AssetTagMap, AssetStatus, AssetType
 
-class AssetReadSerializer(serializers.ModelSerializer):
+class AssetListSerializer(SearchHitMixin, serializers.ModelSerializer):
+    """List item: excerpt instead of the description; querysets defer Asset.reading_fields (see AssetViewSet)."""
+    excerpt = serializers.CharField(source="auto_excerpt", read_only=True)
+    tags = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Asset
+        fields = [
+            "id", "title", "slug", "excerpt",
+            "word_count", "reading_minutes",
+            "asset_type", "status",
+            "external_url", "download_url",
+            "is_featured", "published_at",
+            "created_at", "updated_at",
+            "tags",
+        ]
+
+    def get_tags(self, obj):
+        return [{"name": t.name, "slug": t.slug} for t in obj.tags.all()]
+
+
+class AssetReadSerializer(SearchHitMixin, serializers.ModelSerializer):
     tags = serializers.SerializerMethodField()
 
     class Meta:
         model = Asset
         fields = [
             "id", "title", "slug", "description",
+            "word_count", "reading_minutes",
             "asset_type", "status",
             "external_url", "download_url",
             "is_featured", "published_at",
@@ -1,7 +1,13 @@
+
+from django.conf import settings
+from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import AssetViewSet
+from .views import AssetViewSet, AssetListAsyncView
 
 router = DefaultRouter()
 router.register(r"", AssetViewSet, basename="assets")
 
 urlpatterns = router.urls
+
+if settings.ASYNC_PUBLIC_VIEWS:
+    urlpatterns = [path("", AssetListAsyncView.as_view(), name="assets-list-async")] + urlpatterns
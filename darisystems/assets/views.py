@@ -3,18 +3,24 @@ from django.shortcuts import render
 # Create your views here.
 from rest_framework.viewsets import ModelViewSet
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.filters import OrderingFilter
+
+from common.async_views import AsyncPublicListView
+from common.conditional import ConditionalGetMixin
+from common.search import FullTextSearchFilter
+from common.models import TagScope
 
 from .models import Asset, AssetStatus
-from .serializers import AssetReadSerializer, AssetWriteSerializer
+from .serializers import AssetListSerializer, AssetReadSerializer, AssetWriteSerializer
 from .permissions import IsAdminOrReadOnly
 from .filters import AssetFilter
 
-class AssetViewSet(ModelViewSet):
+class AssetViewSet(ConditionalGetMixin, ModelViewSet):
     permission_classes = [IsAdminOrReadOnly]
+    conditional_tag_scope = TagScope.ASSET
     lookup_field = "slug"  # slug-based detail URLs
 
-    filter_backends = [DjangoFilterBackend, OrderingFilter, SearchFilter]
+    filter_backends = [DjangoFilterBackend, OrderingFilter, FullTextSearchFilter]
     filterset_class = AssetFilter
 
     ordering_fields = ["published_at", "created_at", "updated_at", "title"]
@@ -28,9 +34,30 @@ class AssetViewSet(ModelViewSet):
         if not (user and user.is_staff):
             qs = qs.filter(status=AssetStatus.PUBLISHED)
 
+        if self.action == "list":
+            # List items carry the stored excerpt/word count; descriptions are never loaded.
+            qs = qs.defer(*Asset.reading_fields)
         return qs.order_by("-published_at", "-created_at")
 
     def get_serializer_class(self):
         if self.request.method in ("POST", "PUT", "PATCH"):
             return AssetWriteSerializer
+        if self.action == "list":
+            return AssetListSerializer
         return AssetReadSerializer
+
+
+class AssetListAsyncView(AsyncPublicListView):
+    """Async published asset list (ASGI); see common.async_views."""
+    fallback = AssetViewSet.as_view({"get": "list", "post": "create"})
+    serializer_class = AssetListSerializer
+    conditional_fields = ("updated_at",)
+    conditional_tag_scope = TagScope.ASSET
+
+    def get_queryset(self):
+        return (
+            Asset.objects.filter(status=AssetStatus.PUBLISHED)
+            .defer(*Asset.reading_fields)
+            .prefetch_related("tags")
+            .order_by("-published_at", "-created_at")
+        )
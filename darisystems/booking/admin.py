@@ -1,18 +1,30 @@
 from django.contrib import admin
 from .models import (
+    Resource,
     ConsultingService,
     BookingRequest,
     BookingSlot,
     AvailabilityRule,
     BlackoutPeriod,
+    RecurringBlackout,
+    ArchivedBookingRequest,
 )
 
+@admin.register(Resource)
+class ResourceAdmin(admin.ModelAdmin):
+    list_display = ("name", "slug", "kind", "priority", "is_active")
+    list_filter = ("kind", "is_active")
+    search_fields = ("name", "slug")
+    prepopulated_fields = {"slug": ("name",)}
+    ordering = ("priority", "id")
+
 @admin.register(ConsultingService)
 class ConsultingServiceAdmin(admin.ModelAdmin):
     list_display = ("name", "slug", "status", "default_duration_minutes", "updated_at")
     list_filter = ("status",)
     search_fields = ("name", "slug", "description")
     prepopulated_fields = {"slug": ("name",)}
+    filter_horizontal = ("resources",)
 
 @admin.register(BookingRequest)
 class BookingRequestAdmin(admin.ModelAdmin):
@@ -23,18 +35,38 @@ class BookingRequestAdmin(admin.ModelAdmin):
 
 @admin.register(BookingSlot)
 class BookingSlotAdmin(admin.ModelAdmin):
-    list_display = ("booking_request", "status", "start_at", "end_at", "hold_expires_at")
-    list_filter = ("status",)
+    list_display = ("booking_request", "resource", "status", "start_at", "end_at", "hold_expires_at")
+    list_filter = ("status", "resource")
     ordering = ("-start_at",)
 
 @admin.register(AvailabilityRule)
 class AvailabilityRuleAdmin(admin.ModelAdmin):
-    list_display = ("timezone", "day_of_week", "start_time_local", "end_time_local", "slot_granularity_minutes", "is_active")
-    list_filter = ("timezone", "day_of_week", "is_active")
+    list_display = ("resource", "timezone", "day_of_week", "start_time_local", "end_time_local", "slot_granularity_minutes", "is_active")
+    list_filter = ("resource", "timezone", "day_of_week", "is_active")
     ordering = ("day_of_week", "start_time_local")
 
 @admin.register(BlackoutPeriod)
 class BlackoutPeriodAdmin(admin.ModelAdmin):
-    list_display = ("start_at", "end_at", "reason", "created_by", "created_at")
+    list_display = ("start_at", "end_at", "resource", "reason", "created_by", "created_at")
     search_fields = ("reason",)
     ordering = ("-start_at",)
+
+@admin.register(RecurringBlackout)
+class RecurringBlackoutAdmin(admin.ModelAdmin):
+    list_display = ("frequency", "interval", "starts_on", "until", "timezone", "resource", "reason", "is_active")
+    list_filter = ("frequency", "is_active")
+    search_fields = ("reason",)
+    ordering = ("-is_active", "starts_on")
+
+@admin.register(ArchivedBookingRequest)
+class ArchivedBookingRequestAdmin(admin.ModelAdmin):
+    list_display = ("public_id", "service", "full_name", "email", "status", "requested_start_at", "archived_at")
+    list_filter = ("status", "service")
+    search_fields = ("public_id", "full_name", "email", "company")
+    ordering = ("-created_at",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,280 @@
+"""
+Helpers shared by the booking benchmark management commands.
+
+Benchmarks always run against a throwaway test database (same engine as the
+configured `default` alias), so they can be pointed at any environment safely.
+"""
+from __future__ import annotations
+
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time as perf
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import time, timedelta
+from typing import Callable, Sequence
+
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, connection
+from django.utils import timezone
+
+from .models import (
+    AvailabilityRule,
+    BlackoutPeriod,
+    BookingRequest,
+    BookingSlot,
+    BookingSlotStatus,
+    BookingStatus,
+    ConsultingService,
+    ConsultingServiceStatus,
+    MeetingMode,
+    Resource,
+)
+
+CONFIRM_LAYOUTS = ("disjoint", "same-day", "conflicting")
+
+
+@contextmanager
+def scratch_database(verbosity: int = 0, on_disk: bool = False):
+    """
+    Create (and always drop) a test database for the duration of the block.
+    `on_disk` forces a file for SQLite, which multi-threaded benchmarks need:
+    the default shared-cache in-memory DB uses table locks instead of the real
+    file locking behaviour.
+    """
+    old_name = connection.settings_dict["NAME"]
+    old_test = dict(connection.settings_dict["TEST"])
+    tmpdir = None
+    if on_disk and connection.vendor == "sqlite":
+        tmpdir = tempfile.mkdtemp(prefix="bench-")
+        connection.settings_dict["TEST"]["NAME"] = os.path.join(tmpdir, "bench.sqlite3")
+    connection.creation.create_test_db(verbosity=verbosity, autoclobber=True, serialize=False)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=verbosity)
+        connection.settings_dict["TEST"] = old_test
+        if tmpdir:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def percentile(sorted_samples: Sequence[float], pct: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    k = min(len(sorted_samples) - 1, max(0, round(pct / 100 * (len(sorted_samples) - 1))))
+    return sorted_samples[k]
+
+
+def summarize(samples: Sequence[float]) -> dict:
+    """Latency summary in milliseconds for a list of durations in seconds."""
+    ordered = sorted(samples)
+    n = len(ordered)
+    return {
+        "n": n,
+        "mean_ms": round(sum(ordered) / n * 1000, 3) if n else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if n else 0.0,
+    }
+
+
+def seed_calendar(
+    *,
+    days: int,
+    bookings_per_day: int = 6,
+    blackouts_per_week: int = 2,
+    tz_name: str = "Europe/Berlin",
+    seed: int = 42,
+) -> ConsultingService:
+    """
+    Working-week rules (Mon-Fri 09:00-17:00 local), a handful of blackouts per week and
+    `bookings_per_day` confirmed hour-long bookings on every working day of the horizon.
+    """
+    rng = random.Random(seed)
+    consultant, _ = Resource.objects.get_or_create(slug="bench-consultant", defaults={"name": "Bench consultant"})
+    service = ConsultingService.objects.create(
+        slug="bench-consult",
+        name="Benchmark consult",
+        default_duration_minutes=60,
+        allowed_durations_minutes=[30, 60, 90],
+        meeting_modes=[MeetingMode.GOOGLE_MEET],
+        status=ConsultingServiceStatus.PUBLISHED,
+    )
+    AvailabilityRule.objects.bulk_create([
+        AvailabilityRule(
+            resource=consultant,
+            timezone=tz_name,
+            day_of_week=dow,
+            start_time_local=time(9, 0),
+            end_time_local=time(17, 0),
+            slot_granularity_minutes=15,
+            buffer_before_minutes=10,
+            buffer_after_minutes=10,
+            min_lead_time_minutes=0,
+        )
+        for dow in range(5)
+    ])
+
+    origin = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    blackouts = []
+    requests = []
+    for d in range(days):
+        day = origin + timedelta(days=d)
+        if d % 7 == 0:
+            for _ in range(blackouts_per_week):
+                start = day + timedelta(days=rng.randrange(7), hours=rng.randrange(7, 16))
+                blackouts.append(BlackoutPeriod(
+                    resource=consultant, start_at=start, end_at=start + timedelta(hours=rng.choice([1, 2, 3])),
+                ))
+        if day.weekday() >= 5:
+            continue
+        for hour in sorted(rng.sample(range(7, 16), min(bookings_per_day, 9))):
+            start = day + timedelta(hours=hour)
+            requests.append(BookingRequest(
+                service=service,
+                status=BookingStatus.CONFIRMED,
+                full_name="Bench Client",
+                email=f"bench{len(requests)}@example.com",
+                duration_minutes=60,
+                requested_start_at=start,
+                requested_end_at=start + timedelta(minutes=60),
+                meeting_mode=MeetingMode.GOOGLE_MEET,
+            ))
+
+    BlackoutPeriod.objects.bulk_create(blackouts, batch_size=500)
+    BookingRequest.objects.bulk_create(requests, batch_size=500)
+    BookingSlot.objects.bulk_create(
+        [
+            BookingSlot(
+                booking_request=br,
+                resource=consultant,
+                start_at=br.requested_start_at,
+                end_at=br.requested_end_at,
+                status=BookingSlotStatus.CONFIRMED,
+            )
+            for br in BookingRequest.objects.filter(service=service)
+        ],
+        batch_size=500,
+    )
+    service.resources.add(consultant)
+    return service
+
+
+def seed_services(count: int) -> list[ConsultingService]:
+    """`count` extra published services with the usual duration / meeting-mode spread."""
+    modes = list(MeetingMode.values)
+    ConsultingService.objects.bulk_create([
+        ConsultingService(
+            slug=f"bench-service-{i}",
+            name=f"Benchmark service {i}",
+            description="Benchmark service. " * 20,
+            default_duration_minutes=60,
+            allowed_durations_minutes=[30, 60, 90],
+            meeting_modes=modes[: 1 + i % len(modes)],
+            status=ConsultingServiceStatus.PUBLISHED if i % 5 else ConsultingServiceStatus.DRAFT,
+        )
+        for i in range(count)
+    ])
+    return list(ConsultingService.objects.filter(slug__startswith="bench-service-"))
+
+
+def seed_confirm_contention(n: int, layout: str, offset_days: int = 1, resources: int = 1) -> list[int]:
+    """
+    `n` pending requests laid out so that concurrent confirms are disjoint, same-day or all
+    conflicting, starting `offset_days` from today (keep it past any seeded calendar). The
+    service is served by `resources` consultants, so up to that many conflicting confirms win.
+    """
+    service, _ = ConsultingService.objects.get_or_create(
+        slug="bench-confirm", defaults={"name": "Bench confirm", "status": ConsultingServiceStatus.PUBLISHED}
+    )
+    service.resources.set([
+        Resource.objects.get_or_create(slug=f"bench-confirm-{i}", defaults={"name": f"Bench confirm {i}"})[0]
+        for i in range(resources)
+    ])
+    base = timezone.now().replace(hour=10, minute=0, second=0, microsecond=0) + timedelta(days=offset_days)
+    requests = []
+    for i in range(n):
+        if layout == "disjoint":
+            start = base + timedelta(days=i)
+        elif layout == "same-day":
+            start = base + timedelta(minutes=30 * i)
+        else:
+            start = base
+        requests.append(BookingRequest(
+            service=service,
+            full_name=f"Bench {i}",
+            email=f"bench{i}@example.com",
+            duration_minutes=30,
+            requested_start_at=start,
+            requested_end_at=start + timedelta(minutes=30),
+            meeting_mode=MeetingMode.ZOOM,
+        ))
+    return [br.pk for br in BookingRequest.objects.bulk_create(requests)]
+
+
+def run_concurrent_confirms(pks: Sequence[int]) -> dict:
+    """Confirm every request at once (one thread each, released by a barrier)."""
+    barrier = threading.Barrier(len(pks))
+    lock = threading.Lock()
+    samples, outcomes = [], {"confirmed": 0, "conflicts": 0, "errors": 0}
+
+    def worker(pk):
+        barrier.wait()
+        t0 = perf.perf_counter()
+        try:
+            BookingRequest(pk=pk).confirm(approved_by=None)
+            outcome = "confirmed"
+        except ValidationError:
+            outcome = "conflicts"
+        except DatabaseError:
+            outcome = "errors"
+        finally:
+            connection.close()
+        elapsed = perf.perf_counter() - t0
+        with lock:
+            samples.append(elapsed)
+            outcomes[outcome] += 1
+
+    threads = [threading.Thread(target=worker, args=(pk,)) for pk in pks]
+    t0 = perf.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = perf.perf_counter() - t0
+
+    return {
+        **outcomes,
+        "wall_ms": round(wall * 1000, 3),
+        "throughput_per_s": round(len(pks) / wall, 1) if wall else 0.0,
+        "latency": summarize(samples),
+    }
+
+
+def run_concurrent(calls: Sequence[Callable[[], bool]], concurrency: int) -> dict:
+    """Run zero-argument callables (True = success) on `concurrency` threads; latency per call."""
+    def timed(call):
+        t0 = perf.perf_counter()
+        try:
+            ok = call()
+        finally:
+            elapsed = perf.perf_counter() - t0
+            # Outside the timing: thread-local connections must not outlive the pool.
+            connection.close()
+        return elapsed, ok
+
+    t0 = perf.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(timed, calls))
+    wall = perf.perf_counter() - t0
+
+    return {
+        "requests": len(outcomes),
+        "errors": sum(1 for _, ok in outcomes if not ok),
+        "wall_ms": round(wall * 1000, 3),
+        "throughput_per_s": round(len(outcomes) / wall, 1) if wall else 0.0,
+        "latency": summarize([elapsed for elapsed, _ in outcomes]),
+    }
@@ -0,0 +1,318 @@
+"""
+Batch admin actions on booking requests.
+
+Each action loads the whole batch in one locked query, decides every item in
+memory and writes the outcome with bulk_create/bulk_update in a single
+transaction, so triaging N requests costs a constant number of queries.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right, insort
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import (
+    ACTIVE_SLOT_STATUSES,
+    BlackoutPeriod,
+    BookingDayCounter,
+    BookingOutboxEvent,
+    BookingRequest,
+    BookingSlot,
+    BookingSlotStatus,
+    BookingStatus,
+    CalendarDayLock,
+    CalendarGeneration,
+    ConsultingService,
+    Resource,
+)
+from .slots import load_rules, recurring_blackout_intervals
+
+TERMINAL_STATUSES = {
+    BookingStatus.CANCELLED_BY_ADMIN,
+    BookingStatus.CANCELLED_BY_REQUESTER,
+    BookingStatus.DECLINED,
+    BookingStatus.COMPLETED,
+    BookingStatus.EXPIRED,
+}
+
+
+def _result(public_id: str, ok: bool, status: Optional[str] = None, detail: Optional[str] = None) -> dict:
+    return {"public_id": public_id, "ok": ok, "status": status, "detail": detail}
+
+
+def _load_batch(public_ids: Iterable[str]):
+    """Lock and return the requests in the batch plus a result slot for every requested id (input order)."""
+    public_ids = list(dict.fromkeys(public_ids))
+    found = {
+        br.public_id: br
+        for br in BookingRequest.objects.select_for_update().filter(public_id__in=public_ids)
+    }
+    results = {pid: _result(pid, False, detail="Not found.") for pid in public_ids if pid not in found}
+    return public_ids, found, results
+
+
+def _ordered(public_ids, results) -> list[dict]:
+    return [results[pid] for pid in public_ids]
+
+
+def _slots_of(requests) -> dict:
+    return {
+        s.booking_request_id: s
+        for s in BookingSlot.objects.filter(booking_request__in=requests).select_related("resource")
+    }
+
+
+def _blocks(slot, now) -> bool:
+    """Whether the slot still holds its time (and its day count): confirmed, or a hold that has not lapsed."""
+    if slot.status == BookingSlotStatus.CONFIRMED:
+        return True
+    return slot.status == BookingSlotStatus.HELD and (slot.hold_expires_at is None or slot.hold_expires_at > now)
+
+
+@transaction.atomic
+def bulk_confirm(public_ids: Iterable[str], approved_by, meeting_url: Optional[str] = None) -> list[dict]:
+    """
+    Confirm a batch of requests.
+
+    Candidates are checked against active slots *and* against each other: they are
+    processed in requested_start_at order (ties broken by created_at) and each one
+    takes the first eligible resource (blackout-free ones first) where it overlaps
+    nothing already taken, including an earlier request of the same batch, and
+    stays within the day's max_bookings_per_day. Requests no resource can take are
+    rejected with a per-item error.
+    """
+    public_ids, found, results = _load_batch(public_ids)
+    now = timezone.now()
+
+    candidates = []
+    for pid, br in found.items():
+        if br.status != BookingStatus.REQUESTED:
+            results[pid] = _result(pid, False, br.status, f"Booking cannot be confirmed from status {br.status}.")
+        else:
+            candidates.append(br)
+    if not candidates:
+        return _ordered(public_ids, results)
+
+    candidates.sort(key=lambda b: (b.requested_start_at, b.created_at))
+    lo = min(b.requested_start_at for b in candidates)
+    hi = max(b.requested_end_at for b in candidates)
+
+    existing = _slots_of(candidates)
+    # Own holds that lapsed are released below (uncounting their days); those requests are placed afresh.
+    lapsed = [s for s in existing.values() if s.status == BookingSlotStatus.HELD and not _blocks(s, now)]
+
+    # Resources each request may take: an active slot keeps its resource, otherwise the service's eligible ones.
+    active = list(Resource.objects.filter(is_active=True).order_by("priority", "pk"))
+    services = ConsultingService.objects.prefetch_related("resources").in_bulk({b.service_id for b in candidates})
+    eligible = {pk: service.eligible_resources(active) for pk, service in services.items()}
+    options, resources = {}, {}
+    for br in candidates:
+        slot = existing.get(br.pk)
+        if slot is not None and _blocks(slot, now):
+            options[br.pk] = [slot.resource]
+        else:
+            options[br.pk] = eligible[br.service_id]
+        resources.update((r.pk, r) for r in options[br.pk])
+    rids = list(resources)
+
+    # Lock every involved resource's days in the global (priority, id) order used by BookingRequest._occupy.
+    days = defaultdict(set)
+    for br in candidates:
+        for r in options[br.pk]:
+            days[r.pk].update(CalendarDayLock.days_spanned(br.requested_start_at, br.requested_end_at))
+    for s in lapsed:
+        days[s.resource_id].update(CalendarDayLock.days_spanned(s.start_at, s.end_at))
+    lock_order = {**resources, **{s.resource_id: s.resource for s in lapsed}}
+    for r in sorted(lock_order.values(), key=lambda r: (r.priority, r.pk)):
+        CalendarDayLock.acquire_days(r.pk, days[r.pk])
+    BookingSlot.release_expired_holds(
+        now,
+        start_at=min([lo] + [s.start_at for s in lapsed]),
+        end_at=max([hi] + [s.end_at for s in lapsed]),
+        resource_ids=list(lock_order),
+    )
+    # Re-read after the release: "already counted" must reflect the released holds.
+    existing = _slots_of(candidates)
+
+    # Active slots of one resource never overlap each other (DB guard), so sorting by start also
+    # sorts by end and each list can be bisected on ends. Accepted candidates are inserted as we go.
+    taken = defaultdict(list)
+    for start, end, booking_id, rid in (
+        BookingSlot.objects.active(now).filter(resource_id__in=rids).overlapping(lo, hi)
+        .values_list("start_at", "end_at", "booking_request_id", "resource_id")
+    ):
+        taken[rid].append((start, end, booking_id))
+    for entries in taken.values():
+        entries.sort()
+    ends = {rid: [end for _, end, _ in entries] for rid, entries in taken.items()}
+
+    blocked = defaultdict(list)
+    for start, end, rid in (
+        BlackoutPeriod.objects.filter(Q(resource_id__in=rids) | Q(resource__isnull=True), start_at__lt=hi, end_at__gt=lo)
+        .values_list("start_at", "end_at", "resource_id")
+    ):
+        blocked[rid].append((start, end))
+    for start, end, _, rid in recurring_blackout_intervals(lo, hi):
+        if rid is None or rid in resources:
+            blocked[rid].append((start, end))
+
+    # Daily caps: one lookup for the rules and counters of every resource and day in the batch, then tracked in memory.
+    caps = {rid: BookingDayCounter.caps_by_weekday(own) for rid, own in load_rules(rids).items()}
+    local_days = {br.pk: BookingDayCounter.local_day(br.requested_start_at) for br in candidates}
+    counts = {
+        (rid, day): n
+        for rid, day, n in BookingDayCounter.objects.filter(resource_id__in=rids, day__in=set(local_days.values()))
+        .values_list("resource_id", "day", "booking_count")
+    }
+
+    def overlaps(rid, br):
+        entries = taken[rid]
+        i = bisect_right(ends.get(rid, []), br.requested_start_at)
+        while i < len(entries) and entries[i][0] < br.requested_end_at:
+            if entries[i][2] != br.pk:
+                return True
+            i += 1
+        return False
+
+    def is_blocked(rid, br):
+        return any(
+            s < br.requested_end_at and e > br.requested_start_at
+            for s, e in blocked[rid] + blocked[None]
+        )
+
+    accepted, assigned = [], {}
+    for br in candidates:
+        slot = existing.get(br.pk)
+        counted = slot is not None and slot.status in ACTIVE_SLOT_STATUSES
+        day = local_days[br.pk]
+        free = []
+        for r in options[br.pk]:
+            if overlaps(r.pk, br):
+                continue
+            cap = caps.get(r.pk, {}).get(day.weekday())
+            if not counted and cap is not None and counts.get((r.pk, day), 0) >= cap:
+                free.append(None)
+                continue
+            free.append(r)
+        usable = [r for r in free if r is not None]
+        if not usable:
+            if not options[br.pk]:
+                detail = "No resource is available for this service."
+            elif len(free) == len(options[br.pk]):
+                detail = "No more bookings are accepted on that day."
+            else:
+                detail = "Requested time overlaps with an existing booking slot."
+            results[br.public_id] = _result(br.public_id, False, br.status, detail)
+            continue
+
+        # Confirming over a blackout stays possible, but only when every usable resource is blacked out.
+        resource = next((r for r in usable if not is_blocked(r.pk, br)), usable[0])
+        accepted.append(br)
+        assigned[br.pk] = resource
+        if not counted:
+            counts[(resource.pk, day)] = counts.get((resource.pk, day), 0) + 1
+        entry = (br.requested_start_at, br.requested_end_at, br.pk)
+        if entry not in taken[resource.pk]:
+            insort(taken[resource.pk], entry)
+            insort(ends.setdefault(resource.pk, []), br.requested_end_at)
+
+    if not accepted:
+        return _ordered(public_ids, results)
+
+    to_create, to_update, newly_counted = [], [], []
+    for br in accepted:
+        slot = existing.get(br.pk)
+        resource = assigned[br.pk]
+        if slot is None or slot.status not in ACTIVE_SLOT_STATUSES:
+            newly_counted.append((resource.pk, br.requested_start_at, br.requested_end_at))
+        if slot is None:
+            to_create.append(BookingSlot(
+                booking_request=br,
+                resource=resource,
+                start_at=br.requested_start_at,
+                end_at=br.requested_end_at,
+                status=BookingSlotStatus.CONFIRMED,
+            ))
+        else:
+            slot.resource = resource
+            slot.start_at, slot.end_at = br.requested_start_at, br.requested_end_at
+            slot.status = BookingSlotStatus.CONFIRMED
+            slot.hold_expires_at = None
+            slot.updated_at = now
+            to_update.append(slot)
+
+        br.status = BookingStatus.CONFIRMED
+        br.handled_by = approved_by
+        br.handled_at = now
+        br.confirmed_at = now
+        br.updated_at = now
+        if meeting_url:
+            br.meeting_url = meeting_url
+        results[br.public_id] = _result(br.public_id, True, br.status)
+
+    # Flip existing holds first so new rows never collide with a stale copy of themselves.
+    BookingSlot.objects.bulk_update(
+        to_update, ["resource", "start_at", "end_at", "status", "hold_expires_at", "updated_at"]
+    )
+    BookingSlot.objects.bulk_create(to_create)
+    BookingRequest.objects.bulk_update(
+        accepted, ["status", "handled_by", "handled_at", "confirmed_at", "meeting_url", "updated_at"]
+    )
+    BookingOutboxEvent.record(accepted)
+    BookingDayCounter.apply(added=newly_counted)
+    CalendarGeneration.bump_on_commit(changed_from=min(br.requested_start_at for br in accepted))
+    return _ordered(public_ids, results)
+
+
+@transaction.atomic
+def bulk_decline(public_ids: Iterable[str], actor) -> list[dict]:
+    public_ids, found, results = _load_batch(public_ids)
+    now = timezone.now()
+
+    declined = []
+    for pid, br in found.items():
+        if br.status != BookingStatus.REQUESTED:
+            results[pid] = _result(pid, False, br.status, f"Cannot decline from {br.status}.")
+            continue
+        br.status = BookingStatus.DECLINED
+        br.handled_by = actor
+        br.handled_at = now
+        br.updated_at = now
+        declined.append(br)
+        results[pid] = _result(pid, True, br.status)
+
+    if declined:
+        BookingRequest.objects.bulk_update(declined, ["status", "handled_by", "handled_at", "updated_at"])
+        BookingOutboxEvent.record(declined)
+        BookingSlot.release_for_requests([br.pk for br in declined], now)
+    return _ordered(public_ids, results)
+
+
+@transaction.atomic
+def bulk_cancel(public_ids: Iterable[str], actor) -> list[dict]:
+    public_ids, found, results = _load_batch(public_ids)
+    now = timezone.now()
+
+    cancelled = []
+    for pid, br in found.items():
+        if br.status in TERMINAL_STATUSES:
+            # Same as BookingRequest.cancel: already closed is a no-op, not an error.
+            results[pid] = _result(pid, True, br.status)
+            continue
+        br.status = BookingStatus.CANCELLED_BY_ADMIN
+        br.cancelled_at = now
+        br.handled_by = actor
+        br.handled_at = now
+        br.updated_at = now
+        cancelled.append(br)
+        results[pid] = _result(pid, True, br.status)
+
+    if cancelled:
+        BookingRequest.objects.bulk_update(cancelled, ["status", "cancelled_at", "handled_by", "handled_at", "updated_at"])
+        BookingOutboxEvent.record(cancelled)
+        BookingSlot.release_for_requests([br.pk for br in cancelled], now)
+    return _ordered(public_ids, results)
@@ -0,0 +1,59 @@
+"""
+Versioned availability cache.
+
+Availability payloads are cached per window under the current calendar generation.
+Any committed write to BookingSlot / BlackoutPeriod / RecurringBlackout / AvailabilityRule bumps the
+generation (see booking.signals), which orphans every cached window at once.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import CalendarGeneration
+
+
+def availability_cache_timeout() -> int:
+    return getattr(settings, "BOOKING_AVAILABILITY_CACHE_TIMEOUT", 60)
+
+
+def cached_availability(window_key: str, build: Callable[[], Any]) -> Any:
+    """
+    Return the cached payload for `window_key` or build and store it.
+
+    The key also carries a time bucket of `BOOKING_AVAILABILITY_CACHE_TIMEOUT` seconds,
+    so slots that fall inside a rule's min lead time age out even without writes.
+    """
+    timeout = availability_cache_timeout()
+    if timeout <= 0:
+        return build()
+
+    key = _cache_key(window_key, CalendarGeneration.current(), timeout)
+    payload = cache.get(key)
+    if payload is None:
+        payload = build()
+        cache.set(key, payload, timeout)
+    return payload
+
+
+async def acached_availability(window_key: str, build: Callable[[], Any]) -> Any:
+    """Async twin of cached_availability(); a miss runs the (sync) build in one thread hop."""
+    timeout = availability_cache_timeout()
+    if timeout <= 0:
+        return await sync_to_async(build)()
+
+    key = _cache_key(window_key, await CalendarGeneration.acurrent(), timeout)
+    payload = await cache.aget(key)
+    if payload is None:
+        payload = await sync_to_async(build)()
+        await cache.aset(key, payload, timeout)
+    return payload
+
+
+def _cache_key(window_key: str, generation: int, timeout: int) -> str:
+    bucket = int(timezone.now().timestamp() // timeout)
+    return f"booking:availability:{generation}:{bucket}:{window_key}"
@@ -0,0 +1,143 @@
+"""
+In-process read-through cache of the published ConsultingService catalog.
+
+The public booking paths (create serializer, availability, services list) resolve
+services by slug on every request; the catalog answers those from memory with the
+allowed durations / meeting modes already parsed into sets.
+
+Saves and deletes of a ConsultingService or a Resource, resource mapping changes,
+and refreshed next-slot summaries (loaded with the services through one join)
+invalidate the catalog of the writing process on commit and bump the shared
+"booking.catalog" generation (see booking.signals / booking.next_slots); other
+worker processes reload within CACHE_GENERATION_CHECK_SECONDS (common.generations).
+The create serializer re-reads the service row inside its transaction, so not even
+that window lets a booking through for a service that was just withdrawn.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from common.conditional import make_etag
+from common.generations import SharedGeneration
+
+from .models import ConsultingService, ConsultingServiceStatus
+
+GENERATION = SharedGeneration("booking.catalog")
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    service: ConsultingService
+    durations: frozenset
+    meeting_modes: frozenset
+
+    @classmethod
+    def from_service(cls, service: ConsultingService) -> "CatalogEntry":
+        return cls(
+            service=service,
+            durations=frozenset(service.allowed_durations_minutes or []),
+            meeting_modes=frozenset(service.meeting_modes or []),
+        )
+
+    def allows_duration(self, minutes: int) -> bool:
+        # An empty list means any positive duration, as the serializer always accepted.
+        return minutes > 0 and (not self.durations or minutes in self.durations)
+
+    def allows_meeting_mode(self, mode: str) -> bool:
+        return not self.meeting_modes or mode in self.meeting_modes
+
+
+class ServiceCatalog:
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (loaded_at, generation, by_slug, ordered-by-name) swapped as one tuple so readers never see a half-built state
+        self._snapshot: Optional[tuple[float, int, dict[str, CatalogEntry], list[CatalogEntry]]] = None
+
+    def _stale(self, snapshot) -> bool:
+        return snapshot is None or time.monotonic() - snapshot[0] >= getattr(settings, "BOOKING_CATALOG_TTL_SECONDS", 60)
+
+    def _load(self):
+        snapshot = self._snapshot
+        if self._stale(snapshot) or GENERATION.moved(snapshot[1]):
+            snapshot = self._reload(snapshot)
+        return snapshot
+
+    def _reload(self, seen):
+        with self._lock:
+            if self._snapshot is seen or self._stale(self._snapshot):
+                generation = GENERATION.current()
+                services = (
+                    ConsultingService.objects.filter(status=ConsultingServiceStatus.PUBLISHED)
+                    .select_related("availability_summary")
+                    .prefetch_related("resources")
+                    .order_by("name")
+                )
+                ordered = [CatalogEntry.from_service(s) for s in services]
+                self._snapshot = (time.monotonic(), generation, {e.service.slug: e for e in ordered}, ordered)
+            return self._snapshot
+
+    def get(self, slug: str) -> Optional[CatalogEntry]:
+        return self._load()[2].get(slug)
+
+    def services(self) -> list[ConsultingService]:
+        """Published services ordered by name (the public list order)."""
+        return [e.service for e in self._load()[3]]
+
+    # Async callers (ASGI views) only leave the event loop when the snapshot must be reloaded.
+    async def _aload(self):
+        snapshot = self._snapshot
+        if self._stale(snapshot) or await GENERATION.amoved(snapshot[1]):
+            snapshot = await sync_to_async(self._reload)(snapshot)
+        return snapshot
+
+    async def aget(self, slug: str) -> Optional[CatalogEntry]:
+        return (await self._aload())[2].get(slug)
+
+    async def aservices(self) -> list[ConsultingService]:
+        return [e.service for e in (await self._aload())[3]]
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+    def invalidate_on_commit(self) -> None:
+        """Drop this process's snapshot once the write commits, and have every other process reload."""
+        transaction.on_commit(self.invalidate)
+        GENERATION.bump_on_commit()
+
+
+def passed_starts(services) -> int:
+    """Listed next-slot starts that have passed since their summaries were written."""
+    now = timezone.now()
+    return sum(s.availability_summary.passed(now) for s in services if _summary(s) is not None)
+
+
+def validators(services, *extra) -> tuple[str, Optional[datetime]]:
+    """
+    (etag, last_modified) of services as they are served (catalog snapshot): their rows,
+    next-slot summaries and resources, plus the summary starts that have passed.
+    """
+    parts, stamps = [], []
+    for service in services:
+        summary = _summary(service)
+        computed_at = summary.computed_at if summary is not None else None
+        parts.append((service.pk, service.updated_at, computed_at, tuple(r.pk for r in service.resources.all())))
+        stamps.extend(t for t in (service.updated_at, computed_at) if t is not None)
+    return make_etag(*parts, passed_starts(services), *extra), max(stamps, default=None)
+
+
+def _summary(service):
+    # select_related caches a missing reverse one-to-one; reading it raises (an AttributeError).
+    return getattr(service, "availability_summary", None)
+
+
+catalog = ServiceCatalog()
@@ -1,5 +1,5 @@
 import django_filters
-from .models import BookingRequest, ConsultingService, BookingStatus
+from .models import ArchivedBookingRequest, BookingRequest, ConsultingService, BookingStatus
 
 class ConsultingServiceFilter(django_filters.FilterSet):
     class Meta:
@@ -16,3 +16,9 @@ class BookingRequestFilter(django_filters.FilterSet):
     class Meta:
         model = BookingRequest
         fields = ["status", "email", "service", "start_from", "start_to"]
+
+
+class ArchivedBookingRequestFilter(BookingRequestFilter):
+    class Meta:
+        model = ArchivedBookingRequest
+        fields = ["status", "email", "service", "start_from", "start_to"]
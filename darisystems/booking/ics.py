@@ -0,0 +1,270 @@
+"""
+iCalendar (RFC 5545) feeds for confirmed bookings and blackouts, and the busy-time
+reader used to import an external calendar into blackouts.
+
+Feeds are produced by generators over `.iterator()` querysets, and imports read the
+file line by line, so memory stays flat no matter how large the calendar is.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .models import BlackoutPeriod, BookingRequest, BookingStatus
+
+PRODID = "-//Dari Systems//Booking Calendar//EN"
+UID_DOMAIN = "booking.darisystems"
+CHUNK_SIZE = 500
+
+
+def escape_text(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line: str) -> str:
+    """Fold a content line at 75 octets (continuation lines start with a space)."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+
+    parts, start, limit = [], 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # never split inside a multi-byte UTF-8 sequence
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode("utf-8"))
+        start, limit = end, 74
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_dt(value: datetime) -> str:
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def calendar(name: str, events: Iterable[list[str]]) -> Iterator[str]:
+    """Wrap VEVENT property lists in a VCALENDAR, yielding one folded event per chunk."""
+    yield "".join(fold(line) for line in (
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+    ))
+    for props in events:
+        yield "".join(fold(line) for line in ("BEGIN:VEVENT", *props, "END:VEVENT"))
+    yield fold("END:VCALENDAR")
+
+
+def confirmed_booking_events() -> Iterator[list[str]]:
+    rows = (
+        BookingRequest.objects.filter(status=BookingStatus.CONFIRMED)
+        .order_by("requested_start_at")
+        .values_list(
+            "public_id", "requested_start_at", "requested_end_at", "updated_at",
+            "service__name", "full_name", "email", "company", "meeting_mode", "meeting_url",
+        )
+        .iterator(chunk_size=CHUNK_SIZE)
+    )
+    for public_id, start, end, updated, service, name, email, company, mode, url in rows:
+        description = "\n".join(filter(None, [
+            f"{name} <{email}>",
+            company,
+            f"Mode: {mode}",
+            url,
+        ]))
+        props = [
+            f"UID:{public_id}@{UID_DOMAIN}",
+            f"DTSTAMP:{format_dt(updated)}",
+            f"LAST-MODIFIED:{format_dt(updated)}",
+            f"DTSTART:{format_dt(start)}",
+            f"DTEND:{format_dt(end)}",
+            f"SUMMARY:{escape_text(f'{service} - {name}')}",
+            f"DESCRIPTION:{escape_text(description)}",
+            "STATUS:CONFIRMED",
+            "TRANSP:OPAQUE",
+        ]
+        if url:
+            props.append(f"URL:{url}")
+        yield props
+
+
+def blackout_events() -> Iterator[list[str]]:
+    rows = (
+        BlackoutPeriod.objects.order_by("start_at")
+        .values_list("pk", "start_at", "end_at", "updated_at", "reason")
+        .iterator(chunk_size=CHUNK_SIZE)
+    )
+    for pk, start, end, updated, reason in rows:
+        yield [
+            f"UID:blackout-{pk}@{UID_DOMAIN}",
+            f"DTSTAMP:{format_dt(updated)}",
+            f"LAST-MODIFIED:{format_dt(updated)}",
+            f"DTSTART:{format_dt(start)}",
+            f"DTEND:{format_dt(end)}",
+            f"SUMMARY:{escape_text(reason or 'Unavailable')}",
+            "TRANSP:OPAQUE",
+        ]
+
+
+# ----------------------------
+# Import (busy time from an external calendar)
+# ----------------------------
+class BusyRange(NamedTuple):
+    uid: str
+    start_at: datetime
+    end_at: datetime
+
+
+class InvalidEvent(ValueError):
+    pass
+
+
+_DURATION_RE = re.compile(
+    r"^(?P<sign>[+-])?P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
+)
+
+
+def unfold(lines: Iterable[Union[str, bytes]]) -> Iterator[str]:
+    """Join folded continuation lines back into logical content lines, lazily."""
+    current = None
+    for raw in lines:
+        line = raw.decode("utf-8", errors="replace") if isinstance(raw, bytes) else raw
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def parse_line(line: str) -> tuple[str, dict, str]:
+    """'DTSTART;TZID="Europe/Berlin":20260301T100000' -> ("DTSTART", {"TZID": ...}, "2026...")."""
+    quoted, split = False, -1
+    for i, ch in enumerate(line):
+        if ch == '"':
+            quoted = not quoted
+        elif ch == ":" and not quoted:
+            split = i
+            break
+    if split < 0:
+        return line.upper(), {}, ""
+    head, value = line[:split], line[split + 1:]
+    name, *raw_params = head.split(";")
+    params = {}
+    for param in raw_params:
+        key, _, val = param.partition("=")
+        params[key.upper()] = val.strip('"')
+    return name.upper(), params, value
+
+
+def parse_datetime(value: str, params: dict, default_tz: ZoneInfo) -> Union[datetime, date]:
+    """DATE values stay dates (all-day); DATE-TIMEs become aware (UTC 'Z', TZID, or floating in default_tz)."""
+    try:
+        if params.get("VALUE") == "DATE" or len(value) == 8:
+            return datetime.strptime(value, "%Y%m%d").date()
+        if value.endswith("Z"):
+            return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=dt_timezone.utc)
+        naive = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    except ValueError:
+        raise InvalidEvent(f"Bad date-time {value!r}.")
+    tz = default_tz
+    if "TZID" in params:
+        try:
+            tz = ZoneInfo(params["TZID"])
+        except (ZoneInfoNotFoundError, ValueError):
+            raise InvalidEvent(f"Unknown TZID {params['TZID']!r}.")
+    return naive.replace(tzinfo=tz)
+
+
+def parse_duration(value: str) -> timedelta:
+    match = _DURATION_RE.match(value)
+    if not match:
+        raise InvalidEvent(f"Bad duration {value!r}.")
+    parts = {k: int(v) for k, v in match.groupdict().items() if v and k != "sign"}
+    duration = timedelta(**parts)
+    return -duration if match.group("sign") == "-" else duration
+
+
+def _as_utc(value: Union[datetime, date], tz: ZoneInfo) -> datetime:
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.min, tzinfo=tz)
+    return value.astimezone(dt_timezone.utc)
+
+
+def external_uid(uid: str, recurrence_id: Optional[str]) -> str:
+    """Stable dedupe key; moved instances of a series (RECURRENCE-ID) get their own row."""
+    key = f"{uid}#{recurrence_id}" if recurrence_id else uid
+    if len(key) > 255:
+        key = "sha256:" + hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return key
+
+
+def busy_ranges(lines: Iterable[Union[str, bytes]], default_tz: ZoneInfo, stats: Optional[dict] = None) -> Iterator[BusyRange]:
+    """
+    Stream the busy VEVENTs of an ICS file as UTC ranges, one event in memory at a time.
+
+    Skipped (counted in stats["skipped"]): free time (TRANSP:TRANSPARENT), cancelled
+    events, events without UID or length, unparseable dates, and RRULE series
+    (only their first instance would be busy here; use RecurringBlackout for those).
+    """
+    stats = stats if stats is not None else {}
+    stats.setdefault("skipped", 0)
+    event = None
+    for line in unfold(lines):
+        name, params, value = parse_line(line)
+        if name == "BEGIN" and value.upper() == "VEVENT":
+            event = {}
+        elif name == "END" and value.upper() == "VEVENT" and event is not None:
+            try:
+                busy = _event_range(event, default_tz)
+            except InvalidEvent:
+                busy = None
+            if busy is None:
+                stats["skipped"] += 1
+            else:
+                yield busy
+            event = None
+        elif event is not None and name in ("UID", "DTSTART", "DTEND", "DURATION", "TRANSP", "STATUS", "RRULE", "RECURRENCE-ID"):
+            event[name] = (params, value.strip())
+
+
+def _event_range(event: dict, default_tz: ZoneInfo) -> Optional[BusyRange]:
+    if "UID" not in event or "DTSTART" not in event or "RRULE" in event:
+        return None
+    if event.get("TRANSP", ({}, ""))[1].upper() == "TRANSPARENT":
+        return None
+    if event.get("STATUS", ({}, ""))[1].upper() == "CANCELLED":
+        return None
+
+    start = parse_datetime(event["DTSTART"][1], event["DTSTART"][0], default_tz)
+    if "DTEND" in event:
+        end = parse_datetime(event["DTEND"][1], event["DTEND"][0], default_tz)
+    elif "DURATION" in event:
+        end = start + parse_duration(event["DURATION"][1])
+    elif not isinstance(start, datetime):
+        end = start + timedelta(days=1)  # all-day event without an end: one day
+    else:
+        return None  # zero-length instant: blocks nothing
+
+    start_at, end_at = _as_utc(start, default_tz), _as_utc(end, default_tz)
+    if start_at >= end_at:
+        return None
+    recurrence_id = event.get("RECURRENCE-ID", ({}, None))[1]
+    return BusyRange(external_uid(event["UID"][1], recurrence_id), start_at, end_at)
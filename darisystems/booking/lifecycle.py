@@ -0,0 +1,56 @@
+"""
+Periodic booking housekeeping: expired holds, the booking lifecycle sweep and
+the next-slot summaries (whose earliest starts go stale as time passes).
+
+Run it from cron / a worker with `manage.py sweep_bookings --loop`, or set
+BOOKING_LIFECYCLE_SWEEP_SECONDS to have each server process run it on a
+background thread (started from wsgi.py / asgi.py).
+"""
+from __future__ import annotations
+
+import logging
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from . import next_slots
+from .models import BookingRequest, BookingSlot
+
+logger = logging.getLogger(__name__)
+
+_sweeper: threading.Thread | None = None
+_sweeper_lock = threading.Lock()
+
+
+def sweep(chunk_size: int = 500) -> dict:
+    """One pass: release expired holds, complete/expire past bookings, then refresh next-slot summaries."""
+    result = {"released_holds": BookingSlot.release_expired_holds()}
+    result.update(BookingRequest.sweep_lifecycle(chunk_size=chunk_size))
+    result["next_slots"] = next_slots.refresh()
+    return result
+
+
+def _run(interval: int, stop: threading.Event) -> None:
+    while not stop.wait(interval):
+        try:
+            sweep()
+        except Exception:
+            logger.exception("Booking lifecycle sweep failed.")
+        finally:
+            close_old_connections()
+
+
+def start_periodic_sweeper(stop: threading.Event | None = None) -> threading.Thread | None:
+    """Start the in-process sweeper once per process; no-op unless BOOKING_LIFECYCLE_SWEEP_SECONDS > 0."""
+    global _sweeper
+    interval = getattr(settings, "BOOKING_LIFECYCLE_SWEEP_SECONDS", 0)
+    if interval <= 0:
+        return None
+    with _sweeper_lock:
+        if _sweeper is None:
+            _sweeper = threading.Thread(
+                target=_run, args=(interval, stop or threading.Event()), name="booking-lifecycle", daemon=True,
+            )
+            _sweeper.start()
+    return _sweeper
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from booking.models import ArchivedBookingRequest
+
+
+class Command(BaseCommand):
+    help = "Move closed bookings (and their slots) older than BOOKING_ARCHIVE_AFTER_DAYS into the archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--older-than-days", type=int, default=None, help="Override BOOKING_ARCHIVE_AFTER_DAYS.")
+        parser.add_argument("--chunk-size", type=int, default=500, help="Bookings moved per transaction (default: 500).")
+
+    def handle(self, *args, **opts):
+        moved = ArchivedBookingRequest.archive_closed(
+            older_than_days=opts["older_than_days"], chunk_size=opts["chunk_size"],
+        )
+        self.stdout.write(f"Archived {moved} booking(s).")
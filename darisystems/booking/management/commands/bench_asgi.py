@@ -0,0 +1,135 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time as perf
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import AsyncClient, Client
+from django.test.utils import setup_test_environment
+from django.utils import timezone
+
+from booking.bench import scratch_database, seed_calendar, summarize
+from booking.models import BookingRequest
+from common.models import PublishStatus
+from content.models import Post
+
+# wsgi: sync DRF views on a thread pool (one thread per in-flight request)
+# asgi-sync: the same sync views behind the ASGI handler (thread hop per request)
+# asgi: the native async public read views (common.async_views)
+MODES = ("wsgi", "asgi-sync", "asgi")
+
+
+class Command(BaseCommand):
+    help = "Compare WSGI and ASGI throughput of the public read endpoints under concurrency."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--mode", choices=MODES + ("all",), default="all")
+        parser.add_argument("-c", "--concurrency", type=int, default=32, help="Requests in flight (default: 32).")
+        parser.add_argument("-n", "--requests", type=int, default=2000, help="Requests per mode (default: 2000).")
+        parser.add_argument("--json", action="store_true", help="Print the result as JSON.")
+
+    def handle(self, *args, **opts):
+        if opts["mode"] == "all":
+            results = [self._spawn(mode, opts) for mode in MODES]
+        else:
+            results = [self._run_mode(opts["mode"], opts)]
+
+        if opts["json"]:
+            self.stdout.write(json.dumps(results if len(results) > 1 else results[0]))
+            return
+        for r in results:
+            lat = r["latency"]
+            self.stdout.write(
+                f"{r['mode']:>9}: {r['requests']} requests @ {r['concurrency']} concurrent ({r['vendor']}): "
+                f"{r['throughput_per_s']}/s, p50 {lat['p50_ms']} ms, p99 {lat['p99_ms']} ms, "
+                f"{r['errors']} non-2xx"
+            )
+
+    def _spawn(self, mode, opts):
+        """URLconfs pick sync/async views at import time, so each mode runs in its own process."""
+        env = dict(os.environ, DARISYSTEMS_ASYNC_VIEWS="1" if mode == "asgi" else "0")
+        cmd = [
+            sys.executable, "manage.py", "bench_asgi", "--mode", mode, "--json",
+            "-c", str(opts["concurrency"]), "-n", str(opts["requests"]),
+        ]
+        proc = subprocess.run(cmd, cwd=settings.BASE_DIR, env=env, capture_output=True, text=True)
+        if proc.returncode:
+            raise CommandError(f"{mode} run failed:\n{proc.stderr}")
+        return json.loads(proc.stdout)
+
+    def _run_mode(self, mode, opts):
+        if (mode == "asgi") != settings.ASYNC_PUBLIC_VIEWS:
+            raise CommandError(f"--mode {mode} needs DARISYSTEMS_ASYNC_VIEWS={'1' if mode == 'asgi' else '0'}.")
+        setup_test_environment()
+        with scratch_database(on_disk=True):
+            urls = self._seed()
+            paths = [urls[i % len(urls)] for i in range(opts["requests"])]
+            runner = self._run_wsgi if mode == "wsgi" else self._run_asgi
+            runner(urls, min(opts["concurrency"], len(urls)))  # warm caches and connections
+            wall, samples, errors = runner(paths, opts["concurrency"])
+
+        return {
+            "benchmark": "asgi",
+            "mode": mode,
+            "vendor": connection.vendor,
+            "concurrency": opts["concurrency"],
+            "requests": len(paths),
+            "errors": errors,
+            "wall_ms": round(wall * 1000, 3),
+            "throughput_per_s": round(len(paths) / wall, 1) if wall else 0.0,
+            "latency": summarize(samples),
+        }
+
+    def _seed(self):
+        service = seed_calendar(days=30)
+        now = timezone.now()
+        Post.objects.bulk_create([
+            Post(title=f"Bench post {i}", slug=f"bench-post-{i}", content="Lorem ipsum " * 200,
+                 status=PublishStatus.PUBLISHED, published_at=now)
+            for i in range(30)
+        ])
+        booking = BookingRequest.objects.filter(service=service).first()
+        start = now.date().isoformat()
+        return [
+            f"/api/v1/booking/availability/?start={start}&days=14&service={service.slug}",
+            f"/api/v1/booking/requests/{booking.public_id}/",
+            "/api/v1/booking/services/",
+            "/api/v1/content/posts/",
+            "/api/v1/portfolio/projects/",
+            "/api/v1/assets/",
+        ]
+
+    def _run_wsgi(self, paths, concurrency):
+        def fetch(path):
+            t0 = perf.perf_counter()
+            code = Client().get(path, HTTP_ACCEPT="application/json").status_code
+            return perf.perf_counter() - t0, code
+
+        t0 = perf.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            outcomes = list(pool.map(fetch, paths))
+        wall = perf.perf_counter() - t0
+        return wall, [s for s, _ in outcomes], sum(1 for _, code in outcomes if code >= 300)
+
+    def _run_asgi(self, paths, concurrency):
+        async def main():
+            client = AsyncClient()
+            gate = asyncio.Semaphore(concurrency)
+
+            async def fetch(path):
+                async with gate:
+                    t0 = perf.perf_counter()
+                    response = await client.get(path, HTTP_ACCEPT="application/json")
+                    return perf.perf_counter() - t0, response.status_code
+
+            t0 = perf.perf_counter()
+            outcomes = await asyncio.gather(*(fetch(p) for p in paths))
+            return perf.perf_counter() - t0, outcomes
+
+        wall, outcomes = asyncio.run(main())
+        return wall, [s for s, _ in outcomes], sum(1 for _, code in outcomes if code >= 300)
@@ -0,0 +1,191 @@
+import json
+import platform
+import random
+import subprocess
+from datetime import timedelta
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import setup_test_environment
+from django.utils import timezone
+
+from booking.bench import (
+    CONFIRM_LAYOUTS,
+    run_concurrent,
+    run_concurrent_confirms,
+    scratch_database,
+    seed_calendar,
+    seed_confirm_contention,
+    seed_services,
+)
+from booking.models import BookingRequest, MeetingMode
+
+
+class Command(BaseCommand):
+    help = (
+        "Booking hot-path benchmark suite: public create, availability (cached / uncached), public "
+        "detail lookup and N-way confirm contention on a seeded scratch database. Results go to a "
+        "JSON file for comparing commits. Runs against the configured database: SQLite by default, "
+        "Postgres when POSTGRES_DB is set (see settings.DATABASES)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=90, help="Seeded calendar horizon in days (default: 90).")
+        parser.add_argument("--bookings-per-day", type=int, default=6)
+        parser.add_argument("--services", type=int, default=50, help="Extra services to seed (default: 50).")
+        parser.add_argument("-n", "--requests", type=int, default=500, help="Requests per HTTP scenario (default: 500).")
+        parser.add_argument("-c", "--concurrency", type=int, default=8, help="Client threads (default: 8).")
+        parser.add_argument("--confirm-n", type=int, default=16, help="Concurrent confirms per layout (default: 16).")
+        parser.add_argument(
+            "--confirm-resources", type=int, default=1, help="Consultants serving the confirm service (default: 1).",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--output", help="Result file (default: bench-results/booking-<vendor>-<commit>-<time>.json).")
+        parser.add_argument("--compare", help="Earlier result file to print deltas against.")
+
+    def handle(self, *args, **opts):
+        setup_test_environment()
+        rng = random.Random(opts["seed"])
+        scenarios = {}
+
+        with scratch_database(on_disk=True):
+            service = seed_calendar(days=opts["days"], bookings_per_day=opts["bookings_per_day"], seed=opts["seed"])
+            seed_services(opts["services"])
+            public_ids = list(BookingRequest.objects.values_list("public_id", flat=True))
+            seeded_bookings = len(public_ids)
+
+            scenarios["create"] = self._create(service, opts, past_day=opts["days"] + 1)
+            scenarios["availability_cached"] = self._availability(service, opts, rng)
+            with override_settings(BOOKING_AVAILABILITY_CACHE_TIMEOUT=0):
+                scenarios["availability_uncached"] = self._availability(service, opts, rng)
+            scenarios["detail"] = self._detail(public_ids, opts, rng)
+
+            # Confirms land after the seeded horizon and after the create scenario's bookings.
+            offset = opts["days"] + 30
+            for layout in CONFIRM_LAYOUTS:
+                pks = seed_confirm_contention(
+                    opts["confirm_n"], layout, offset_days=offset, resources=opts["confirm_resources"],
+                )
+                scenarios[f"confirm_{layout}"] = run_concurrent_confirms(pks)
+                offset += opts["confirm_n"] + 1
+
+        result = {
+            "benchmark": "booking",
+            "commit": self._commit(),
+            "created_at": timezone.now().isoformat(),
+            "vendor": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "params": {
+                "days": opts["days"],
+                "bookings_per_day": opts["bookings_per_day"],
+                "services": opts["services"],
+                "seeded_bookings": seeded_bookings,
+                "requests": opts["requests"],
+                "concurrency": opts["concurrency"],
+                "confirm_n": opts["confirm_n"],
+                "confirm_resources": opts["confirm_resources"],
+                "seed": opts["seed"],
+            },
+            "scenarios": scenarios,
+        }
+
+        path = Path(opts["output"] or self._default_output(result))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(result, indent=2) + "\n")
+
+        self._report(scenarios)
+        if opts["compare"]:
+            self._compare(scenarios, opts["compare"])
+        self.stdout.write(f"Wrote {path}")
+
+    # -- scenarios -------------------------------------------------------------------------------
+
+    def _create(self, service, opts, past_day):
+        base = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=past_day)
+
+        def call(i):
+            start = base + timedelta(minutes=30 * i)
+            body = {
+                "service": service.slug,
+                "full_name": f"Bench Create {i}",
+                "email": f"create{i}@example.com",
+                "timezone": "UTC",
+                "duration_minutes": 30,
+                "requested_start_at": start.isoformat(),
+                "meeting_mode": MeetingMode.GOOGLE_MEET,
+            }
+            # A distinct client address per request: the per-IP throttle must not shape the numbers.
+            client = Client(REMOTE_ADDR=f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}")
+            return client.post("/api/v1/booking/requests/", body, content_type="application/json").status_code == 201
+
+        return run_concurrent([lambda i=i: call(i) for i in range(opts["requests"])], opts["concurrency"])
+
+    def _availability(self, service, opts, rng):
+        today = timezone.now().date()
+        urls = [
+            f"/api/v1/booking/availability/?start={today + timedelta(days=rng.randrange(60))}"
+            f"&days=14&service={service.slug}"
+            for _ in range(opts["requests"])
+        ]
+        return run_concurrent([lambda u=u: self._get_ok(u) for u in urls], opts["concurrency"])
+
+    def _detail(self, public_ids, opts, rng):
+        urls = [f"/api/v1/booking/requests/{rng.choice(public_ids)}/" for _ in range(opts["requests"])]
+        return run_concurrent([lambda u=u: self._get_ok(u) for u in urls], opts["concurrency"])
+
+    @staticmethod
+    def _get_ok(url):
+        return Client().get(url, HTTP_ACCEPT="application/json").status_code == 200
+
+    # -- output ----------------------------------------------------------------------------------
+
+    @staticmethod
+    def _commit():
+        try:
+            out = subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"], cwd=settings.BASE_DIR, capture_output=True, text=True,
+            )
+        except OSError:
+            return None
+        return out.stdout.strip() or None
+
+    @staticmethod
+    def _default_output(result):
+        stamp = result["created_at"][:19].replace(":", "").replace("-", "")
+        return settings.BASE_DIR / "bench-results" / f"booking-{result['vendor']}-{result['commit'] or 'nogit'}-{stamp}.json"
+
+    def _report(self, scenarios):
+        for name, r in scenarios.items():
+            lat = r["latency"]
+            extra = (
+                f"{r['confirmed']} confirmed, {r['conflicts']} conflicts, {r['errors']} errors"
+                if "confirmed" in r else f"{r['errors']} failed"
+            )
+            self.stdout.write(
+                f"{name:>22}: {r['throughput_per_s']:>8}/s  p50 {lat['p50_ms']:>8} ms  p99 {lat['p99_ms']:>8} ms  ({extra})"
+            )
+
+    def _compare(self, scenarios, baseline_path):
+        try:
+            baseline = json.loads(Path(baseline_path).read_text())["scenarios"]
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f"Cannot read baseline {baseline_path}: {e}")
+
+        def delta(new, old):
+            return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+        self.stdout.write(f"vs {baseline_path}:")
+        for name, r in scenarios.items():
+            old = baseline.get(name)
+            if not old:
+                continue
+            self.stdout.write(
+                f"{name:>22}: throughput {delta(r['throughput_per_s'], old['throughput_per_s'])}, "
+                f"p50 {delta(r['latency']['p50_ms'], old['latency']['p50_ms'])}, "
+                f"p99 {delta(r['latency']['p99_ms'], old['latency']['p99_ms'])}"
+            )
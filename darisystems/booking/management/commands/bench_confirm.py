@@ -0,0 +1,48 @@
+import json
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from booking.bench import (
+    CONFIRM_LAYOUTS,
+    run_concurrent_confirms,
+    scratch_database,
+    seed_confirm_contention,
+)
+from booking.models import BookingSlot, BookingSlotStatus
+
+
+class Command(BaseCommand):
+    help = "Confirm N booking requests concurrently (one thread each) and report contention."
+
+    def add_arguments(self, parser):
+        parser.add_argument("-n", "--concurrency", type=int, default=16)
+        parser.add_argument(
+            "--layout",
+            choices=CONFIRM_LAYOUTS,
+            default="disjoint",
+            help="disjoint: one booking per day; same-day: back-to-back on one day; "
+                 "conflicting: all at the same time (exactly one must win).",
+        )
+        parser.add_argument("--json", action="store_true", help="Print the result as JSON.")
+
+    def handle(self, *args, **opts):
+        n = opts["concurrency"]
+        layout = opts["layout"]
+        with scratch_database(on_disk=True):
+            pks = seed_confirm_contention(n, layout)
+            result = run_concurrent_confirms(pks)
+            result["active_slots"] = BookingSlot.objects.filter(status=BookingSlotStatus.CONFIRMED).count()
+
+        result.update({"benchmark": "confirm", "layout": layout, "concurrency": n, "vendor": connection.vendor})
+        if opts["json"]:
+            self.stdout.write(json.dumps(result))
+            return
+
+        lat = result["latency"]
+        self.stdout.write(
+            f"{n} concurrent confirms ({layout}, {connection.vendor}): "
+            f"{result['confirmed']} confirmed, {result['conflicts']} conflicts, {result['errors']} errors, "
+            f"wall {result['wall_ms']} ms, {result['throughput_per_s']}/s, "
+            f"p50 {lat['p50_ms']} ms, p99 {lat['p99_ms']} ms"
+        )
@@ -0,0 +1,54 @@
+import json
+import time as perf
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from booking.bench import scratch_database, seed_calendar, summarize
+from booking.slots import available_slots
+
+
+class Command(BaseCommand):
+    help = "Benchmark the bookable-slot engine over long windows on a scratch database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=90, help="Window length in days (default: 90).")
+        parser.add_argument("--repeat", type=int, default=30, help="Timed runs (default: 30).")
+        parser.add_argument("--bookings-per-day", type=int, default=6)
+        parser.add_argument("--json", action="store_true", help="Print the result as JSON.")
+
+    def handle(self, *args, **opts):
+        days = opts["days"]
+        with scratch_database():
+            service = seed_calendar(days=days, bookings_per_day=opts["bookings_per_day"])
+            start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            end = start + timedelta(days=days)
+
+            with CaptureQueriesContext(connection) as queries:
+                slots = available_slots(service, start, end)
+
+            samples = []
+            for _ in range(opts["repeat"]):
+                t0 = perf.perf_counter()
+                available_slots(service, start, end)
+                samples.append(perf.perf_counter() - t0)
+
+        result = {
+            "benchmark": "slots",
+            "window_days": days,
+            "slots_returned": len(slots),
+            "queries_per_call": len(queries),
+            "latency": summarize(samples),
+        }
+        if opts["json"]:
+            self.stdout.write(json.dumps(result))
+            return
+
+        lat = result["latency"]
+        self.stdout.write(
+            f"{days}-day window: {len(slots)} slots, {len(queries)} queries/call, "
+            f"p50 {lat['p50_ms']} ms, p99 {lat['p99_ms']} ms, max {lat['max_ms']} ms"
+        )
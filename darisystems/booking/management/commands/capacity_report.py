@@ -0,0 +1,37 @@
+import csv
+import io
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from booking import reports
+
+
+class Command(BaseCommand):
+    help = (
+        "Compute the booking capacity/utilization report (booked vs available minutes per week, weekday "
+        "and service, lead-time and cancellation distributions) and write it as JSON or CSV."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=("json", "csv"), default="json")
+        parser.add_argument("--output", help="File to write (default: stdout).")
+
+    def handle(self, *args, **opts):
+        report = reports.build_capacity_report()
+        if opts["format"] == "csv":
+            out = io.StringIO()
+            csv.writer(out).writerows(reports.report_rows(report))
+            text = out.getvalue()
+        else:
+            text = json.dumps(report, indent=2) + "\n"
+
+        if not opts["output"]:
+            self.stdout.write(text, ending="")
+            return
+        try:
+            Path(opts["output"]).write_text(text, encoding="utf-8")
+        except OSError as e:
+            raise CommandError(f"Cannot write {opts['output']}: {e}")
+        self.stdout.write(f"Wrote {opts['output']}")
@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from booking.notifications import drain
+
+
+class Command(BaseCommand):
+    help = "Send pending booking notifications from the outbox (batched, with retry/backoff)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100, help="Events claimed per batch (default: 100).")
+        parser.add_argument("--loop", action="store_true", help="Keep draining until interrupted.")
+        parser.add_argument("--interval", type=int, default=5, help="Seconds between drains with --loop (default: 5).")
+
+    def handle(self, *args, **opts):
+        while True:
+            result = drain(batch_size=opts["batch_size"])
+            if any(result.values()) or opts["verbosity"] > 1:
+                self.stdout.write("Sent {sent}, retrying {retried}, failed {failed} notification(s).".format(**result))
+            if not opts["loop"]:
+                return
+            time.sleep(opts["interval"])
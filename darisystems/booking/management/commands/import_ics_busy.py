@@ -0,0 +1,48 @@
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.core.management.base import BaseCommand, CommandError
+
+from booking import ics
+from booking.models import BlackoutPeriod, Resource, calendar_timezone
+
+
+class Command(BaseCommand):
+    help = (
+        "Import the busy events of an .ics file as blackouts, upserting by event UID. "
+        "The file is streamed, so its size does not matter; re-imports only write changed rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the .ics file.")
+        parser.add_argument("--timezone", help="Zone for floating times (default: BOOKING_CALENDAR_TIMEZONE).")
+        parser.add_argument("--reason", default="Busy", help="Blackout reason to store (default: Busy). Event titles are not imported.")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Events upserted per batch (default: 1000).")
+        parser.add_argument("--resource", help="Slug of the resource the busy time belongs to (default: blocks every resource).")
+        parser.add_argument("--prune", action="store_true", help="Delete imported blackouts (of the same resource) whose UID is no longer in the file.")
+
+    def handle(self, *args, **opts):
+        try:
+            tz = ZoneInfo(opts["timezone"]) if opts["timezone"] else calendar_timezone()
+        except (ZoneInfoNotFoundError, ValueError):
+            raise CommandError(f"Unknown timezone {opts['timezone']!r}.")
+        resource = None
+        if opts["resource"]:
+            resource = Resource.objects.filter(slug=opts["resource"]).first()
+            if resource is None:
+                raise CommandError(f"Unknown resource {opts['resource']!r}.")
+
+        stats = {}
+        try:
+            with open(opts["path"], encoding="utf-8", errors="replace", newline="") as f:
+                result = BlackoutPeriod.import_busy(
+                    ics.busy_ranges(f, tz, stats),
+                    reason=opts["reason"], chunk_size=opts["chunk_size"], prune=opts["prune"],
+                    resource=resource,
+                )
+        except OSError as e:
+            raise CommandError(f"Cannot read {opts['path']}: {e}")
+
+        self.stdout.write(
+            f"Created {result['created']}, updated {result['updated']}, unchanged {result['unchanged']}, "
+            f"deleted {result['deleted']}; skipped {stats['skipped']} event(s), {result['duplicates']} duplicate UID(s)."
+        )
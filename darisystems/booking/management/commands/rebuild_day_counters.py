@@ -0,0 +1,33 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from booking.models import ACTIVE_SLOT_STATUSES, BookingDayCounter, BookingSlot
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-resource, per-day booking counters from the held/confirmed booking slots."
+
+    def handle(self, *args, **opts):
+        totals = defaultdict(lambda: [0, 0])
+        rows = (
+            BookingSlot.objects.filter(status__in=ACTIVE_SLOT_STATUSES)
+            .values_list("resource_id", "start_at", "end_at")
+            .iterator(chunk_size=2000)
+        )
+        for resource_id, start_at, end_at in rows:
+            total = totals[(resource_id, BookingDayCounter.local_day(start_at))]
+            total[0] += 1
+            total[1] += int((end_at - start_at).total_seconds() // 60)
+
+        with transaction.atomic():
+            BookingDayCounter.objects.all().delete()
+            BookingDayCounter.objects.bulk_create(
+                [
+                    BookingDayCounter(resource_id=resource_id, day=day, booking_count=c, booked_minutes=m)
+                    for (resource_id, day), (c, m) in totals.items()
+                ],
+                batch_size=1000,
+            )
+        self.stdout.write(f"Rebuilt counters for {len(totals)} resource day(s).")
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from booking import next_slots
+
+
+class Command(BaseCommand):
+    help = "Recompute every published service's next-slot summary (the services list 'next available' times)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stale", action="store_true",
+            help="Only recompute summaries flagged by calendar writes since the last refresh (and missing ones).",
+        )
+        parser.add_argument("--loop", action="store_true", help="Keep refreshing until interrupted.")
+        parser.add_argument("--interval", type=int, default=10, help="Seconds between refreshes with --loop (default: 10).")
+
+    def handle(self, *args, **opts):
+        while True:
+            written = next_slots.refresh(stale_only=opts["stale"])
+            if written or not opts["loop"] or opts["verbosity"] > 1:
+                self.stdout.write(f"Refreshed {written} summary(ies).")
+            if not opts["loop"]:
+                return
+            time.sleep(opts["interval"])
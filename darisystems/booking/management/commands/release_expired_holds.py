@@ -0,0 +1,22 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from booking.models import BookingSlot
+
+
+class Command(BaseCommand):
+    help = "Release expired booking slot holds (one bulk UPDATE per sweep)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", action="store_true", help="Keep sweeping until interrupted.")
+        parser.add_argument("--interval", type=int, default=30, help="Seconds between sweeps with --loop (default: 30).")
+
+    def handle(self, *args, **opts):
+        while True:
+            released = BookingSlot.release_expired_holds()
+            if released or opts["verbosity"] > 1:
+                self.stdout.write(f"Released {released} expired hold(s).")
+            if not opts["loop"]:
+                return
+            time.sleep(opts["interval"])
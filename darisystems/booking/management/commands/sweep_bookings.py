@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from booking.lifecycle import sweep
+
+
+class Command(BaseCommand):
+    help = (
+        "Release expired holds, complete past confirmed bookings, expire stale requests "
+        "and refresh the next-slot summaries."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500, help="Bookings updated per transaction (default: 500).")
+        parser.add_argument("--loop", action="store_true", help="Keep sweeping until interrupted.")
+        parser.add_argument("--interval", type=int, default=300, help="Seconds between sweeps with --loop (default: 300).")
+
+    def handle(self, *args, **opts):
+        while True:
+            result = sweep(chunk_size=opts["chunk_size"])
+            if any(result.values()) or opts["verbosity"] > 1:
+                self.stdout.write(
+                    "Released {released_holds} hold(s), completed {completed}, expired {expired} booking(s), "
+                    "refreshed {next_slots} next-slot summary(ies).".format(**result)
+                )
+            if not opts["loop"]:
+                return
+            time.sleep(opts["interval"])
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.11 on 2026-10-17 18:49
+
+from django.db import migrations, models
+
+# Database-enforced overlap guard for active (HELD/CONFIRMED) booking slots.
+# Postgres gets a native exclusion constraint; SQLite gets equivalent triggers.
+# Other backends rely on the application-level check in BookingRequest.confirm.
+POSTGRES_GUARD = [
+    """
+    ALTER TABLE booking_bookingslot ADD CONSTRAINT bs_no_overlap
+    EXCLUDE USING gist (tstzrange(start_at, end_at, '[)') WITH &&)
+    WHERE (status IN ('HELD', 'CONFIRMED'))
+    """,
+]
+POSTGRES_GUARD_REVERSE = [
+    "ALTER TABLE booking_bookingslot DROP CONSTRAINT IF EXISTS bs_no_overlap",
+]
+
+SQLITE_GUARD = [
+    """
+    CREATE TRIGGER bs_no_overlap_insert
+    BEFORE INSERT ON booking_bookingslot
+    WHEN NEW.status IN ('HELD', 'CONFIRMED')
+    BEGIN
+        SELECT RAISE(ABORT, 'booking slot overlaps an active slot')
+        WHERE EXISTS (
+            SELECT 1 FROM booking_bookingslot
+            WHERE status IN ('HELD', 'CONFIRMED')
+              AND start_at < NEW.end_at AND end_at > NEW.start_at
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER bs_no_overlap_update
+    BEFORE UPDATE OF status, start_at, end_at ON booking_bookingslot
+    WHEN NEW.status IN ('HELD', 'CONFIRMED')
+    BEGIN
+        SELECT RAISE(ABORT, 'booking slot overlaps an active slot')
+        WHERE EXISTS (
+            SELECT 1 FROM booking_bookingslot
+            WHERE id != NEW.id
+              AND status IN ('HELD', 'CONFIRMED')
+              AND start_at < NEW.end_at AND end_at > NEW.start_at
+        );
+    END
+    """,
+]
+SQLITE_GUARD_REVERSE = [
+    "DROP TRIGGER IF EXISTS bs_no_overlap_insert",
+    "DROP TRIGGER IF EXISTS bs_no_overlap_update",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for sql in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0002_calendar_generation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendarDayLock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(unique=True)),
+            ],
+        ),
+        migrations.RunPython(
+            _run({"postgresql": POSTGRES_GUARD, "sqlite": SQLITE_GUARD}),
+            _run({"postgresql": POSTGRES_GUARD_REVERSE, "sqlite": SQLITE_GUARD_REVERSE}),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.11 on 2026-10-17 18:52
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0003_calendar_day_lock'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blackoutperiod',
+            name='updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddIndex(
+            model_name='blackoutperiod',
+            index=models.Index(fields=['updated_at'], name='idx_blackout_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='bookingrequest',
+            index=models.Index(fields=['status', 'updated_at'], name='idx_br_status_updated'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-17 18:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0005_day_counters'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bookingrequest',
+            name='status',
+            field=models.CharField(choices=[('REQUESTED', 'Requested'), ('CONFIRMED', 'Confirmed'), ('DECLINED', 'Declined'), ('CANCELLED_BY_REQUESTER', 'Cancelled by requester'), ('CANCELLED_BY_ADMIN', 'Cancelled by admin'), ('COMPLETED', 'Completed'), ('EXPIRED', 'Expired')], default='REQUESTED', max_length=30),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.11 on 2026-10-17 18:59
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0006_booking_expired_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingOutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('booking_public_id', models.CharField(max_length=12)),
+                ('event_type', models.CharField(choices=[('REQUESTED', 'Requested'), ('CONFIRMED', 'Confirmed'), ('DECLINED', 'Declined'), ('CANCELLED_BY_REQUESTER', 'Cancelled by requester'), ('CANCELLED_BY_ADMIN', 'Cancelled by admin'), ('COMPLETED', 'Completed'), ('EXPIRED', 'Expired')], max_length=30)),
+                ('payload', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('SENT', 'Sent'), ('FAILED', 'Failed')], default='PENDING', max_length=10)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='idx_outbox_status_due'), models.Index(fields=['booking_public_id', 'status'], name='idx_outbox_booking_status')],
+            },
+        ),
+    ]
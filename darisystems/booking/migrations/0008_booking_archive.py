@@ -0,0 +1,67 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:00
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0007_booking_outbox'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedBookingRequest',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('public_id', models.CharField(max_length=12, unique=True)),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('status', models.CharField(choices=[('REQUESTED', 'Requested'), ('CONFIRMED', 'Confirmed'), ('DECLINED', 'Declined'), ('CANCELLED_BY_REQUESTER', 'Cancelled by requester'), ('CANCELLED_BY_ADMIN', 'Cancelled by admin'), ('COMPLETED', 'Completed'), ('EXPIRED', 'Expired')], max_length=30)),
+                ('full_name', models.CharField(max_length=160)),
+                ('email', models.EmailField(max_length=254)),
+                ('company', models.CharField(blank=True, max_length=200, null=True)),
+                ('role', models.CharField(blank=True, max_length=120, null=True)),
+                ('phone', models.CharField(blank=True, max_length=30, null=True)),
+                ('timezone', models.CharField(default='UTC', max_length=64)),
+                ('duration_minutes', models.PositiveIntegerField()),
+                ('requested_start_at', models.DateTimeField()),
+                ('requested_end_at', models.DateTimeField()),
+                ('meeting_mode', models.CharField(choices=[('GOOGLE_MEET', 'Google Meet'), ('TEAMS', 'Microsoft Teams'), ('ZOOM', 'Zoom'), ('PHONE', 'Phone'), ('IN_PERSON', 'In-person')], max_length=20)),
+                ('problem_statement', models.TextField(blank=True, null=True)),
+                ('admin_notes', models.TextField(blank=True, null=True)),
+                ('meeting_url', models.URLField(blank=True, max_length=1024, null=True)),
+                ('handled_at', models.DateTimeField(blank=True, null=True)),
+                ('confirmed_at', models.DateTimeField(blank=True, null=True)),
+                ('cancelled_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('handled_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('service', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='archived_bookings', to='booking.consultingservice')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedBookingSlot',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('start_at', models.DateTimeField()),
+                ('end_at', models.DateTimeField()),
+                ('status', models.CharField(choices=[('HELD', 'Held'), ('CONFIRMED', 'Confirmed'), ('RELEASED', 'Released')], max_length=12)),
+                ('hold_expires_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('booking_request', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='slot', to='booking.archivedbookingrequest')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='archivedbookingrequest',
+            index=models.Index(fields=['email', 'created_at'], name='idx_abr_email_created'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedbookingrequest',
+            index=models.Index(fields=['requested_start_at'], name='idx_abr_start'),
+        ),
+    ]
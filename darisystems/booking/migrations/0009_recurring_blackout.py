@@ -0,0 +1,42 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:08
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0008_booking_archive'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecurringBlackout',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('frequency', models.CharField(choices=[('WEEKLY', 'Weekly'), ('MONTHLY', 'Monthly'), ('YEARLY', 'Yearly')], max_length=10)),
+                ('interval', models.PositiveSmallIntegerField(default=1)),
+                ('weekdays', models.JSONField(blank=True, default=list)),
+                ('month_day', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('month', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('timezone', models.CharField(default='UTC', max_length=64)),
+                ('all_day', models.BooleanField(default=False)),
+                ('start_time_local', models.TimeField(blank=True, null=True)),
+                ('end_time_local', models.TimeField(blank=True, null=True)),
+                ('starts_on', models.DateField()),
+                ('until', models.DateField(blank=True, null=True)),
+                ('reason', models.CharField(blank=True, max_length=200, null=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['is_active'], name='idx_rblackout_active')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0009_recurring_blackout'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blackoutperiod',
+            name='external_uid',
+            field=models.CharField(blank=True, max_length=255, null=True, unique=True),
+        ),
+    ]
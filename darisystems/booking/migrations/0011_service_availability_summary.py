@@ -0,0 +1,24 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:14
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0010_blackout_external_uid'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ServiceAvailabilitySummary',
+            fields=[
+                ('service', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='availability_summary', serialize=False, to='booking.consultingservice')),
+                ('next_starts', models.JSONField(blank=True, default=dict)),
+                ('covers_until', models.DateTimeField(blank=True, null=True)),
+                ('computed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
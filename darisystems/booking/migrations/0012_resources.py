@@ -0,0 +1,229 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:31
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+# The overlap guard of 0003 becomes per resource: slots of different resources may overlap.
+POSTGRES_GUARD = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gist",
+    """
+    ALTER TABLE booking_bookingslot ADD CONSTRAINT bs_no_overlap
+    EXCLUDE USING gist (resource_id WITH =, tstzrange(start_at, end_at, '[)') WITH &&)
+    WHERE (status IN ('HELD', 'CONFIRMED'))
+    """,
+]
+POSTGRES_GUARD_REVERSE = [
+    """
+    ALTER TABLE booking_bookingslot ADD CONSTRAINT bs_no_overlap
+    EXCLUDE USING gist (tstzrange(start_at, end_at, '[)') WITH &&)
+    WHERE (status IN ('HELD', 'CONFIRMED'))
+    """,
+]
+POSTGRES_DROP = [
+    "ALTER TABLE booking_bookingslot DROP CONSTRAINT IF EXISTS bs_no_overlap",
+]
+
+SQLITE_GUARD = [
+    """
+    CREATE TRIGGER bs_no_overlap_insert
+    BEFORE INSERT ON booking_bookingslot
+    WHEN NEW.status IN ('HELD', 'CONFIRMED')
+    BEGIN
+        SELECT RAISE(ABORT, 'booking slot overlaps an active slot')
+        WHERE EXISTS (
+            SELECT 1 FROM booking_bookingslot
+            WHERE status IN ('HELD', 'CONFIRMED')
+              AND resource_id = NEW.resource_id
+              AND start_at < NEW.end_at AND end_at > NEW.start_at
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER bs_no_overlap_update
+    BEFORE UPDATE OF status, start_at, end_at, resource_id ON booking_bookingslot
+    WHEN NEW.status IN ('HELD', 'CONFIRMED')
+    BEGIN
+        SELECT RAISE(ABORT, 'booking slot overlaps an active slot')
+        WHERE EXISTS (
+            SELECT 1 FROM booking_bookingslot
+            WHERE id != NEW.id
+              AND status IN ('HELD', 'CONFIRMED')
+              AND resource_id = NEW.resource_id
+              AND start_at < NEW.end_at AND end_at > NEW.start_at
+        );
+    END
+    """,
+]
+SQLITE_GUARD_REVERSE = [
+    """
+    CREATE TRIGGER bs_no_overlap_insert
+    BEFORE INSERT ON booking_bookingslot
+    WHEN NEW.status IN ('HELD', 'CONFIRMED')
+    BEGIN
+        SELECT RAISE(ABORT, 'booking slot overlaps an active slot')
+        WHERE EXISTS (
+            SELECT 1 FROM booking_bookingslot
+            WHERE status IN ('HELD', 'CONFIRMED')
+              AND start_at < NEW.end_at AND end_at > NEW.start_at
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER bs_no_overlap_update
+    BEFORE UPDATE OF status, start_at, end_at ON booking_bookingslot
+    WHEN NEW.status IN ('HELD', 'CONFIRMED')
+    BEGIN
+        SELECT RAISE(ABORT, 'booking slot overlaps an active slot')
+        WHERE EXISTS (
+            SELECT 1 FROM booking_bookingslot
+            WHERE id != NEW.id
+              AND status IN ('HELD', 'CONFIRMED')
+              AND start_at < NEW.end_at AND end_at > NEW.start_at
+        );
+    END
+    """,
+]
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS bs_no_overlap_insert",
+    "DROP TRIGGER IF EXISTS bs_no_overlap_update",
+]
+
+# Rows that must belong to a resource from now on; blackouts stay global (null).
+OWNED = ("AvailabilityRule", "BookingSlot", "CalendarDayLock", "BookingDayCounter", "ArchivedBookingSlot")
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for sql in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+    return run
+
+
+def assign_default_resource(apps, schema_editor):
+    """
+    Existing calendars become the calendar of a single "default" consultant. Created on
+    fresh installs too: with no active resource every public booking would be refused.
+    """
+    Resource = apps.get_model("booking", "Resource")
+    resource, _ = Resource.objects.get_or_create(slug="default", defaults={"name": "Default"})
+    for model in (apps.get_model("booking", name) for name in OWNED):
+        model.objects.filter(resource__isnull=True).update(resource=resource)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0011_service_availability_summary'),
+    ]
+
+    operations = [
+        # The table rebuilds below would drop the SQLite triggers anyway; recreated per resource at the end.
+        migrations.RunPython(
+            _run({"postgresql": POSTGRES_DROP, "sqlite": SQLITE_DROP}),
+            _run({"postgresql": POSTGRES_GUARD_REVERSE, "sqlite": SQLITE_GUARD_REVERSE}),
+        ),
+        migrations.CreateModel(
+            name='Resource',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('slug', models.SlugField(max_length=80, unique=True)),
+                ('name', models.CharField(max_length=160)),
+                ('kind', models.CharField(choices=[('CONSULTANT', 'Consultant'), ('ROOM', 'Room')], default='CONSULTANT', max_length=12)),
+                ('priority', models.PositiveIntegerField(default=0)),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['is_active', 'priority'], name='idx_resource_active_prio')],
+            },
+        ),
+        migrations.AddField(
+            model_name='consultingservice',
+            name='resources',
+            field=models.ManyToManyField(blank=True, related_name='services', to='booking.resource'),
+        ),
+        migrations.AddField(
+            model_name='archivedbookingslot',
+            name='resource',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='booking.resource'),
+        ),
+        migrations.AddField(
+            model_name='blackoutperiod',
+            name='resource',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='blackouts', to='booking.resource'),
+        ),
+        migrations.AddField(
+            model_name='recurringblackout',
+            name='resource',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='recurring_blackouts', to='booking.resource'),
+        ),
+        migrations.AddField(
+            model_name='availabilityrule',
+            name='resource',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='availability_rules', to='booking.resource'),
+        ),
+        migrations.AddField(
+            model_name='bookingslot',
+            name='resource',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='slots', to='booking.resource'),
+        ),
+        migrations.AddField(
+            model_name='calendardaylock',
+            name='resource',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='booking.resource'),
+        ),
+        migrations.AddField(
+            model_name='bookingdaycounter',
+            name='resource',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='booking.resource'),
+        ),
+        migrations.AlterField(
+            model_name='calendardaylock',
+            name='day',
+            field=models.DateField(),
+        ),
+        migrations.AlterField(
+            model_name='bookingdaycounter',
+            name='day',
+            field=models.DateField(),
+        ),
+        migrations.RunPython(assign_default_resource, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='availabilityrule',
+            name='resource',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='availability_rules', to='booking.resource'),
+        ),
+        migrations.AlterField(
+            model_name='bookingslot',
+            name='resource',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='slots', to='booking.resource'),
+        ),
+        migrations.AlterField(
+            model_name='calendardaylock',
+            name='resource',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='booking.resource'),
+        ),
+        migrations.AlterField(
+            model_name='bookingdaycounter',
+            name='resource',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='booking.resource'),
+        ),
+        migrations.AddIndex(
+            model_name='bookingslot',
+            index=models.Index(fields=['resource', 'start_at', 'end_at'], name='idx_bs_resource_range'),
+        ),
+        migrations.AddConstraint(
+            model_name='calendardaylock',
+            constraint=models.UniqueConstraint(fields=('resource', 'day'), name='uniq_daylock_resource_day'),
+        ),
+        migrations.AddConstraint(
+            model_name='bookingdaycounter',
+            constraint=models.UniqueConstraint(fields=('resource', 'day'), name='uniq_daycounter_resource_day'),
+        ),
+        migrations.RunPython(
+            _run({"postgresql": POSTGRES_GUARD, "sqlite": SQLITE_GUARD}),
+            _run({"postgresql": POSTGRES_DROP, "sqlite": SQLITE_DROP}),
+        ),
+    ]
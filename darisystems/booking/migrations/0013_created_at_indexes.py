@@ -0,0 +1,23 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0012_resources'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='archivedbookingrequest',
+            index=models.Index(fields=['created_at', 'id'], name='idx_abr_created'),
+        ),
+        migrations.AddIndex(
+            model_name='bookingrequest',
+            index=models.Index(fields=['created_at', 'id'], name='idx_br_created'),
+        ),
+    ]
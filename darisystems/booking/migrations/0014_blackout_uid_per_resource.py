@@ -0,0 +1,28 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0013_created_at_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='blackoutperiod',
+            name='external_uid',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='blackoutperiod',
+            constraint=models.UniqueConstraint(fields=('resource', 'external_uid'), name='uq_blackout_resource_uid'),
+        ),
+        migrations.AddConstraint(
+            model_name='blackoutperiod',
+            constraint=models.UniqueConstraint(condition=models.Q(('resource__isnull', True)), fields=('external_uid',), name='uq_blackout_global_uid'),
+        ),
+    ]
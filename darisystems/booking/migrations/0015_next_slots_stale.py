@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-17 20:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0014_blackout_uid_per_resource'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='serviceavailabilitysummary',
+            name='stale',
+            field=models.BooleanField(default=False),
+        ),
+    ]
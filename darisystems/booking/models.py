@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import secrets
-from datetime import timedelta
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
 from typing import Optional
+from zoneinfo import ZoneInfo
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models, transaction
-from django.db.models import Q
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Min, Q
+from django.dispatch import Signal
 from django.utils import timezone
 from common.models import TimeStampedModel
 
@@ -30,6 +34,61 @@ class MeetingMode(models.TextChoices):
     IN_PERSON = "IN_PERSON", "In-person"
 
 
+class ResourceKind(models.TextChoices):
+    CONSULTANT = "CONSULTANT", "Consultant"
+    ROOM = "ROOM", "Room"
+
+
+class Resource(TimeStampedModel):
+    """
+    A consultant or room that can only be in one booking at a time. Availability rules,
+    blackouts, slots, day locks and day counters are all kept per resource, so separate
+    resources never block each other. New bookings go to the first free eligible
+    resource in (priority, id) order.
+    """
+    slug = models.SlugField(max_length=80, unique=True)
+    name = models.CharField(max_length=160)
+    kind = models.CharField(max_length=12, choices=ResourceKind.choices, default=ResourceKind.CONSULTANT)
+    priority = models.PositiveIntegerField(default=0)
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["is_active", "priority"], name="idx_resource_active_prio"),
+        ]
+
+    def __str__(self) -> str:
+        return self.name
+
+    @classmethod
+    def assignment_order(cls, resources, start_at, end_at, now=None) -> list["Resource"]:
+        """
+        Candidates to try (under lock) for a booking of [start_at, end_at): the resources with no
+        active slot and no blackout there, or all of them when none is clear (confirming over a
+        blackout stays possible, as before). Always in (priority, id) order, so writers that lock
+        several resources' days do so in one global order and cannot deadlock.
+        """
+        resources = sorted(resources, key=lambda r: (r.priority, r.pk))
+        ids = [r.pk for r in resources]
+        busy = set(
+            BookingSlot.objects.active(now).filter(resource_id__in=ids)
+            .overlapping(start_at, end_at).values_list("resource_id", flat=True)
+        )
+        scoped = Q(resource_id__in=ids) | Q(resource__isnull=True)
+        blocked = set(
+            BlackoutPeriod.objects.filter(scoped, start_at__lt=end_at, end_at__gt=start_at)
+            .values_list("resource_id", flat=True)
+        )
+        for rule in RecurringBlackout.objects.filter(scoped, is_active=True):
+            if next(rule.occurrences(start_at, end_at), None):
+                blocked.add(rule.resource_id)
+        if None in blocked:
+            clear = []
+        else:
+            clear = [r for r in resources if r.pk not in busy and r.pk not in blocked]
+        return clear or resources
+
+
 class ConsultingService(TimeStampedModel):
     slug = models.SlugField(max_length=160, unique=True)
     name = models.CharField(max_length=200)
@@ -45,6 +104,8 @@ class ConsultingService(TimeStampedModel):
     meeting_modes = models.JSONField(blank=True, null=True)
 
     status = models.CharField(max_length=12, choices=ConsultingServiceStatus.choices, default=ConsultingServiceStatus.DRAFT)
+    # Resources that can deliver this service; empty means every active resource.
+    resources = models.ManyToManyField(Resource, blank=True, related_name="services")
 
     class Meta:
         indexes = [
@@ -54,6 +115,18 @@ class ConsultingService(TimeStampedModel):
     def __str__(self) -> str:
         return self.name
 
+    def eligible_resources(self, active: Optional[list[Resource]] = None) -> list[Resource]:
+        """
+        Active resources for this service in assignment order. Uses prefetched `resources` if
+        present; pass the active resources when checking many services to avoid a query each.
+        """
+        mapped = list(self.resources.all())
+        if mapped:
+            return sorted((r for r in mapped if r.is_active), key=lambda r: (r.priority, r.pk))
+        if active is None:
+            active = list(Resource.objects.filter(is_active=True).order_by("priority", "pk"))
+        return active
+
 
 class BookingStatus(models.TextChoices):
     REQUESTED = "REQUESTED", "Requested"
@@ -62,6 +135,7 @@ class BookingStatus(models.TextChoices):
     CANCELLED_BY_REQUESTER = "CANCELLED_BY_REQUESTER", "Cancelled by requester"
     CANCELLED_BY_ADMIN = "CANCELLED_BY_ADMIN", "Cancelled by admin"
     COMPLETED = "COMPLETED", "Completed"
+    EXPIRED = "EXPIRED", "Expired"
 
 
 def generate_public_id(length: int = 12) -> str:
@@ -111,6 +185,9 @@ class BookingRequest(TimeStampedModel):
             models.Index(fields=["service", "status", "requested_start_at"], name="idx_br_svc_status_time"),
             models.Index(fields=["email", "created_at"], name="idx_br_email_created"),
             models.Index(fields=["status", "requested_start_at"], name="idx_br_status_time"),
+            models.Index(fields=["status", "updated_at"], name="idx_br_status_updated"),
+            # Admin list order (keyset pages, see common.pagination).
+            models.Index(fields=["created_at", "id"], name="idx_br_created"),
         ]
 
     def clean(self):
@@ -124,7 +201,9 @@ class BookingRequest(TimeStampedModel):
     def confirm(self, approved_by, meeting_url: Optional[str] = None) -> "BookingSlot":
         """
         Confirm this booking and create/lock a slot without overlaps.
-        Transaction-safe overlap prevention using row locks + overlap query.
+        Overlap prevention serializes on the calendar day lock rows the booking spans,
+        so confirms on disjoint days never wait on each other. The DB-level overlap
+        guard on booking_bookingslot is the last line of defence.
         """
         # Lock this booking row
         br = BookingRequest.objects.select_for_update().get(pk=self.pk)
@@ -132,21 +211,10 @@ class BookingRequest(TimeStampedModel):
         if br.status not in {BookingStatus.REQUESTED}:
             raise ValidationError(f"Booking cannot be confirmed from status {br.status}.")
 
-        # Check for overlap with existing held/confirmed slots
-        overlap = BookingSlot.objects.select_for_update().filter(
-            status__in=[BookingSlotStatus.HELD, BookingSlotStatus.CONFIRMED],
-        ).filter(
-            Q(start_at__lt=br.requested_end_at) & Q(end_at__gt=br.requested_start_at)
-        ).exists()
-
-        if overlap:
-            raise ValidationError("Requested time overlaps with an existing booking slot.")
-
-        slot = BookingSlot.objects.create(
-            booking_request=br,
-            start_at=br.requested_start_at,
-            end_at=br.requested_end_at,
-            status=BookingSlotStatus.CONFIRMED,
+        slot = br._occupy(
+            BookingSlotStatus.CONFIRMED,
+            hold_expires_at=None,
+            conflict_message="Requested time overlaps with an existing booking slot.",
         )
 
         br.status = BookingStatus.CONFIRMED
@@ -156,16 +224,117 @@ class BookingRequest(TimeStampedModel):
         if meeting_url:
             br.meeting_url = meeting_url
         br.save()
+        BookingOutboxEvent.record([br])
+
+        return slot
+
+    @transaction.atomic
+    def hold(self, minutes: Optional[int] = None) -> "BookingSlot":
+        """
+        Reserve the requested time for a few minutes while the requester finishes checkout.
+        Re-holding refreshes the expiry. Raises ValidationError if the time is taken.
+        """
+        br = BookingRequest.objects.select_for_update().get(pk=self.pk)
+        if br.status != BookingStatus.REQUESTED:
+            raise ValidationError(f"Booking cannot be held from status {br.status}.")
 
+        minutes = minutes or getattr(settings, "BOOKING_HOLD_MINUTES", 10)
+        return br._occupy(
+            BookingSlotStatus.HELD,
+            hold_expires_at=timezone.now() + timedelta(minutes=minutes),
+            conflict_message="Requested time is no longer available.",
+        )
+
+    def _occupy(self, slot_status: str, hold_expires_at, conflict_message: str) -> "BookingSlot":
+        """
+        Shared by confirm/hold (caller holds this request's row lock). An active slot keeps its
+        resource; otherwise the first free eligible resource is taken. Per candidate: lock its
+        calendar days, check overlaps and the daily cap, then write the slot and the day
+        counters. Usually only the chosen resource's days get locked, so bookings that land
+        on different resources do not wait on each other.
+        """
+        start_at, end_at = self.requested_start_at, self.requested_end_at
+        now = timezone.now()
+        slot = BookingSlot.objects.filter(booking_request=self).select_related("resource").first()
+        if (
+            slot is not None and slot.status == BookingSlotStatus.HELD
+            and slot.hold_expires_at is not None and slot.hold_expires_at <= now
+        ):
+            # Our own hold lapsed: release it (uncounting its days) first, then place it afresh.
+            CalendarDayLock.acquire(slot.resource_id, slot.start_at, slot.end_at)
+            BookingSlot.release_expired_holds(
+                now, start_at=slot.start_at, end_at=slot.end_at, resource_ids=[slot.resource_id],
+            )
+            slot.refresh_from_db()
+        already_counted = slot is not None and slot.status in ACTIVE_SLOT_STATUSES
+        if already_counted:
+            candidates = [slot.resource]
+        else:
+            candidates = Resource.assignment_order(self.service.eligible_resources(), start_at, end_at, now)
+        if not candidates:
+            raise ValidationError("No resource is available for this service.")
+
+        all_full = True
+        for resource in candidates:
+            CalendarDayLock.acquire(resource.pk, start_at, end_at)
+            BookingSlot.release_expired_holds(now, start_at=start_at, end_at=end_at, resource_ids=[resource.pk])
+
+            # Overlap with the resource's confirmed slots and active holds (our own hold is fine)
+            taken = (
+                BookingSlot.objects.active(now)
+                .filter(resource=resource)
+                .overlapping(start_at, end_at)
+                .exclude(booking_request=self)
+                .exists()
+            )
+            if taken:
+                all_full = False
+                continue
+            if not already_counted and BookingDayCounter.is_full(resource.pk, start_at):
+                continue
+            break
+        else:
+            raise ValidationError("No more bookings are accepted on that day." if all_full else conflict_message)
+
+        if slot is None:
+            slot = BookingSlot(booking_request=self)
+        slot.resource = resource
+        slot.start_at, slot.end_at = start_at, end_at
+        slot.status = slot_status
+        slot.hold_expires_at = hold_expires_at
+        try:
+            slot.save()
+        except IntegrityError:
+            raise ValidationError(conflict_message)
+
+        if not already_counted:
+            BookingDayCounter.apply(added=[(resource.pk, start_at, end_at)])
         return slot
 
+    @transaction.atomic
+    def decline(self, actor=None):
+        """
+        Decline a pending request and release its hold, if any.
+        """
+        br = BookingRequest.objects.select_for_update().get(pk=self.pk)
+        if br.status != BookingStatus.REQUESTED:
+            raise ValidationError(f"Cannot decline from {br.status}.")
+
+        br.status = BookingStatus.DECLINED
+        br.handled_by = actor
+        br.handled_at = timezone.now()
+        br.save()
+        BookingOutboxEvent.record([br])
+
+        BookingSlot.release_for_requests([br.pk])
+
     @transaction.atomic
     def cancel(self, cancelled_by_admin: bool = False, actor=None):
         """
         Cancel booking and release slot if present.
         """
         br = BookingRequest.objects.select_for_update().get(pk=self.pk)
-        if br.status in {BookingStatus.CANCELLED_BY_ADMIN, BookingStatus.CANCELLED_BY_REQUESTER, BookingStatus.DECLINED, BookingStatus.COMPLETED}:
+        if br.status in {BookingStatus.CANCELLED_BY_ADMIN, BookingStatus.CANCELLED_BY_REQUESTER, BookingStatus.DECLINED, BookingStatus.COMPLETED, BookingStatus.EXPIRED}:
             return
 
         br.status = BookingStatus.CANCELLED_BY_ADMIN if cancelled_by_admin else BookingStatus.CANCELLED_BY_REQUESTER
@@ -174,8 +343,50 @@ class BookingRequest(TimeStampedModel):
             br.handled_by = actor
             br.handled_at = timezone.now()
         br.save()
+        BookingOutboxEvent.record([br])
 
-        BookingSlot.objects.filter(booking_request=br).update(status=BookingSlotStatus.RELEASED, updated_at=timezone.now())
+        BookingSlot.release_for_requests([br.pk])
+
+    # ----------------------------
+    # Lifecycle sweep
+    # ----------------------------
+    @classmethod
+    def sweep_lifecycle(cls, now=None, chunk_size: int = 500) -> dict:
+        """
+        Close bookings whose time has passed:
+          - CONFIRMED whose meeting has ended -> COMPLETED
+          - REQUESTED whose start is already past -> EXPIRED
+        and release their slots. Returns {"completed": n, "expired": n}.
+        """
+        now = now or timezone.now()
+        return {
+            "completed": cls._transition_past(
+                BookingStatus.CONFIRMED, BookingStatus.COMPLETED, now, chunk_size, requested_end_at__lte=now,
+            ),
+            "expired": cls._transition_past(BookingStatus.REQUESTED, BookingStatus.EXPIRED, now, chunk_size),
+        }
+
+    @classmethod
+    def _transition_past(cls, from_status: str, to_status: str, now, chunk_size: int, **extra) -> int:
+        """
+        Move bookings of `from_status` that started before `now` in chunks, one short
+        transaction per chunk (set-based UPDATE + slot release), walking idx_br_status_time.
+        """
+        moved = 0
+        while True:
+            with transaction.atomic():
+                pks = list(
+                    cls.objects.select_for_update()
+                    .filter(status=from_status, requested_start_at__lte=now, **extra)
+                    .order_by("requested_start_at")
+                    .values_list("pk", flat=True)[:chunk_size]
+                )
+                if not pks:
+                    return moved
+                moved += cls.objects.filter(pk__in=pks).update(status=to_status, updated_at=now)
+                BookingSlot.release_for_requests(pks, now)
+                if to_status in BookingOutboxEvent.NOTIFY_ON:
+                    BookingOutboxEvent.record(cls.objects.filter(pk__in=pks))
 
 
 class BookingSlotStatus(models.TextChoices):
@@ -184,29 +395,218 @@ class BookingSlotStatus(models.TextChoices):
     RELEASED = "RELEASED", "Released"
 
 
-class BookingSlot(TimeStampedModel):
+# Slots counted by the calendar (DB overlap guard, day counters). Expired holds stay
+# here until the sweeper releases them; availability additionally checks expiry.
+ACTIVE_SLOT_STATUSES = (BookingSlotStatus.HELD, BookingSlotStatus.CONFIRMED)
+
+
+class LoadedRangeMixin:
+    """Remembers the start_at an instance was loaded with, so a save can report how far back it moved."""
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_start_at = instance.__dict__.get("start_at")
+        return instance
+
+    def changed_from(self) -> datetime:
+        """Earliest instant a save/delete of this row affects: its start, or the loaded one if earlier."""
+        loaded = getattr(self, "_loaded_start_at", None) or self.start_at
+        return min(loaded, self.start_at)
+
+
+class BookingSlotQuerySet(models.QuerySet):
+    def active(self, now=None):
+        """Slots that block the calendar: confirmed ones and holds that have not expired."""
+        now = now or timezone.now()
+        return self.filter(
+            Q(status=BookingSlotStatus.CONFIRMED)
+            | Q(status=BookingSlotStatus.HELD, hold_expires_at__isnull=True)
+            | Q(status=BookingSlotStatus.HELD, hold_expires_at__gt=now)
+        )
+
+    def overlapping(self, start_at, end_at):
+        return self.filter(start_at__lt=end_at, end_at__gt=start_at)
+
+
+class BookingSlot(LoadedRangeMixin, TimeStampedModel):
     booking_request = models.OneToOneField(BookingRequest, on_delete=models.CASCADE, related_name="slot")
+    resource = models.ForeignKey(Resource, on_delete=models.PROTECT, related_name="slots")
     start_at = models.DateTimeField()
     end_at = models.DateTimeField()
     status = models.CharField(max_length=12, choices=BookingSlotStatus.choices, default=BookingSlotStatus.CONFIRMED)
     hold_expires_at = models.DateTimeField(blank=True, null=True)
 
+    objects = BookingSlotQuerySet.as_manager()
+
     class Meta:
         indexes = [
             models.Index(fields=["status", "start_at"], name="idx_bs_status_start"),
             models.Index(fields=["start_at", "end_at"], name="idx_bs_range"),
+            models.Index(fields=["resource", "start_at", "end_at"], name="idx_bs_resource_range"),
         ]
 
     def clean(self):
         if self.start_at and self.end_at and self.start_at >= self.end_at:
             raise ValidationError({"end_at": "end_at must be after start_at."})
 
+    @classmethod
+    @transaction.atomic
+    def release_expired_holds(cls, now=None, start_at=None, end_at=None, resource_ids=None) -> int:
+        """
+        Release every expired hold with one set-based UPDATE driven by idx_bs_status_start
+        (status = HELD prefix). Pass a range (and resources) to only sweep holds overlapping it.
+        """
+        now = now or timezone.now()
+        qs = cls.objects.filter(status=BookingSlotStatus.HELD, hold_expires_at__lte=now)
+        if start_at is not None and end_at is not None:
+            qs = qs.overlapping(start_at, end_at)
+        if resource_ids is not None:
+            qs = qs.filter(resource_id__in=resource_ids)
+        return cls._release(qs, now)
+
+    @classmethod
+    @transaction.atomic
+    def release_for_requests(cls, booking_ids, now=None) -> int:
+        """Release the active slots of the given booking requests (cancel/decline)."""
+        now = now or timezone.now()
+        qs = cls.objects.filter(booking_request_id__in=booking_ids, status__in=ACTIVE_SLOT_STATUSES)
+        return cls._release(qs, now)
+
+    @classmethod
+    def _release(cls, qs, now) -> int:
+        # Lock + read the ranges first so the day counters move by exactly what gets released.
+        rows = list(qs.select_for_update().values_list("pk", "resource_id", "start_at", "end_at"))
+        if not rows:
+            return 0
+        released = cls.objects.filter(pk__in=[pk for pk, _, _, _ in rows]).update(
+            status=BookingSlotStatus.RELEASED, updated_at=now
+        )
+        BookingDayCounter.apply(removed=[(resource_id, start, end) for _, resource_id, start, end in rows])
+        # Queryset.update() skips post_save, so invalidate cached availability explicitly.
+        CalendarGeneration.bump_on_commit(changed_from=min(start for _, _, start, _ in rows))
+        return released
+
+
+class CalendarDayLock(models.Model):
+    """
+    One row per resource and calendar day (UTC) that has ever been booked.
+    Writers that change the busy set of a resource's day lock its row first; locking rows
+    that always exist avoids the phantom problem of locking (possibly absent) slot rows.
+    """
+    resource = models.ForeignKey(Resource, on_delete=models.CASCADE, related_name="+")
+    day = models.DateField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["resource", "day"], name="uniq_daylock_resource_day"),
+        ]
+
+    @classmethod
+    def days_spanned(cls, start_at, end_at) -> list:
+        first = start_at.astimezone(dt_timezone.utc).date()
+        last = (end_at - timedelta(microseconds=1)).astimezone(dt_timezone.utc).date()
+        return [first + timedelta(days=i) for i in range((last - first).days + 1)]
+
+    @classmethod
+    def acquire(cls, resource_id: int, start_at, end_at) -> None:
+        """
+        Lock every day of the resource touched by [start_at, end_at) for the current transaction.
+        Rows are created on demand and locked in day order so concurrent writers cannot deadlock.
+        """
+        cls.acquire_days(resource_id, cls.days_spanned(start_at, end_at))
+
+    @classmethod
+    def acquire_days(cls, resource_id: int, days) -> None:
+        days = sorted(set(days))
+        cls.objects.bulk_create([cls(resource_id=resource_id, day=d) for d in days], ignore_conflicts=True)
+        list(
+            cls.objects.select_for_update()
+            .filter(resource_id=resource_id, day__in=days)
+            .order_by("day")
+            .values_list("pk", flat=True)
+        )
+
+
+def calendar_timezone() -> ZoneInfo:
+    """Timezone whose local days the daily booking caps and counters refer to."""
+    return ZoneInfo(getattr(settings, "BOOKING_CALENDAR_TIMEZONE", settings.TIME_ZONE))
+
+
+class BookingDayCounter(models.Model):
+    """
+    Materialized occupancy per resource and local calendar day: number of active
+    (held/confirmed) slots starting that day and their booked minutes. Kept in step
+    transactionally by hold/confirm/cancel/decline and hold expiry; `rebuild_day_counters`
+    recomputes it.
+    """
+    resource = models.ForeignKey(Resource, on_delete=models.CASCADE, related_name="+")
+    day = models.DateField()
+    booking_count = models.IntegerField(default=0)
+    booked_minutes = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["resource", "day"], name="uniq_daycounter_resource_day"),
+        ]
+
+    @staticmethod
+    def local_day(at) -> date:
+        return at.astimezone(calendar_timezone()).date()
+
+    @classmethod
+    def apply(cls, added=(), removed=()) -> None:
+        """Add/remove (resource_id, start_at, end_at) ranges, one UPDATE per touched resource day."""
+        deltas: dict[tuple[int, date], list[int]] = defaultdict(lambda: [0, 0])
+        for sign, ranges in ((1, added), (-1, removed)):
+            for resource_id, start_at, end_at in ranges:
+                delta = deltas[(resource_id, cls.local_day(start_at))]
+                delta[0] += sign
+                delta[1] += sign * int((end_at - start_at).total_seconds() // 60)
+        deltas = {k: v for k, v in deltas.items() if v != [0, 0]}
+        if not deltas:
+            return
+
+        now = timezone.now()
+        cls.objects.bulk_create([cls(resource_id=r, day=d) for r, d in deltas], ignore_conflicts=True)
+        for resource_id, day in sorted(deltas):
+            count, minutes = deltas[(resource_id, day)]
+            cls.objects.filter(resource_id=resource_id, day=day).update(
+                booking_count=F("booking_count") + count,
+                booked_minutes=F("booked_minutes") + minutes,
+                updated_at=now,
+            )
+
+    @staticmethod
+    def caps_by_weekday(rules) -> dict[int, int]:
+        """Tightest max_bookings_per_day per weekday across the given (active) rules."""
+        caps: dict[int, int] = {}
+        for rule in rules:
+            if rule.max_bookings_per_day is not None:
+                caps[rule.day_of_week] = min(caps.get(rule.day_of_week, rule.max_bookings_per_day), rule.max_bookings_per_day)
+        return caps
+
+    @classmethod
+    def is_full(cls, resource_id: int, start_at) -> bool:
+        """Would one more booking of the resource starting at `start_at` exceed its day's cap?"""
+        day = cls.local_day(start_at)
+        cap = (
+            AvailabilityRule.objects.filter(resource_id=resource_id, is_active=True, day_of_week=day.weekday())
+            .aggregate(cap=Min("max_bookings_per_day"))["cap"]
+        )
+        if cap is None:
+            return False
+        count = cls.objects.filter(resource_id=resource_id, day=day).values_list("booking_count", flat=True).first() or 0
+        return count >= cap
+
 
 class AvailabilityRule(TimeStampedModel):
     """
-    Weekly availability windows in a given timezone.
+    Weekly availability windows of a resource in a given timezone.
     day_of_week: 0=Mon ... 6=Sun (your API can map accordingly)
     """
+    resource = models.ForeignKey(Resource, on_delete=models.CASCADE, related_name="availability_rules")
     timezone = models.CharField(max_length=64, default="UTC")
     day_of_week = models.PositiveSmallIntegerField()  # validate 0..6
     start_time_local = models.TimeField()
@@ -233,21 +633,507 @@ class AvailabilityRule(TimeStampedModel):
             raise ValidationError({"end_time_local": "end_time_local must be after start_time_local."})
 
 
-class BlackoutPeriod(models.Model):
+class BlackoutPeriod(LoadedRangeMixin, TimeStampedModel):
+    # Null blocks every resource (office closure, holidays).
+    resource = models.ForeignKey(Resource, on_delete=models.CASCADE, blank=True, null=True, related_name="blackouts")
     start_at = models.DateTimeField()
     end_at = models.DateTimeField()
     reason = models.CharField(max_length=200, blank=True, null=True)
+    # UID of the source calendar event for imported blackouts (see import_busy); null for manual ones.
+    # Unique per resource: one invite shared by several consultants is imported once for each.
+    external_uid = models.CharField(max_length=255, blank=True, null=True)
 
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, blank=True, null=True)
-    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["resource", "external_uid"], name="uq_blackout_resource_uid"),
+            # NULLs never collide in the constraint above: global (null resource) imports need their own.
+            models.UniqueConstraint(
+                fields=["external_uid"], condition=Q(resource__isnull=True), name="uq_blackout_global_uid",
+            ),
+        ]
         indexes = [
             models.Index(fields=["start_at", "end_at"], name="idx_blackout_range"),
+            models.Index(fields=["updated_at"], name="idx_blackout_updated"),
         ]
 
     def clean(self):
         if self.start_at and self.end_at and self.start_at >= self.end_at:
             raise ValidationError({"end_at": "end_at must be after start_at."})
 
+    @classmethod
+    def import_busy(
+        cls, ranges, reason: str = "Busy", chunk_size: int = 1000, prune: bool = False, created_by=None, resource=None,
+    ) -> dict:
+        """
+        Upsert busy ranges (objects with uid/start_at/end_at, e.g. booking.ics.busy_ranges) by
+        (resource, external_uid).
+
+        Works chunk by chunk: one lookup of the chunk's existing rows, bulk_create for new
+        UIDs and bulk_update for rows whose times or reason changed; unchanged rows are not
+        written. Duplicate UIDs within the input keep the first occurrence. Rows are attached
+        to `resource` (None: they block every resource).
+        With prune=True, imported rows of the same resource whose UID is no longer in the input are deleted.
+        """
+        result = {"created": 0, "updated": 0, "unchanged": 0, "duplicates": 0, "deleted": 0}
+        seen: set[str] = set()
+        chunk: dict = {}
+        changed_starts: list = []
+        resource_id = resource.pk if resource is not None else None
+
+        def flush():
+            now = timezone.now()
+            existing = {
+                b.external_uid: b for b in cls.objects.filter(resource_id=resource_id, external_uid__in=list(chunk))
+            }
+            to_create, to_update = [], []
+            for uid, busy in chunk.items():
+                row = existing.get(uid)
+                if row is None:
+                    to_create.append(cls(
+                        external_uid=uid, start_at=busy.start_at, end_at=busy.end_at,
+                        reason=reason, created_by=created_by, resource_id=resource_id,
+                    ))
+                elif (row.start_at, row.end_at, row.reason) != (busy.start_at, busy.end_at, reason):
+                    changed_starts.append(row.start_at)
+                    row.start_at, row.end_at, row.reason, row.updated_at = busy.start_at, busy.end_at, reason, now
+                    to_update.append(row)
+            with transaction.atomic():
+                cls.objects.bulk_create(to_create)
+                cls.objects.bulk_update(to_update, ["start_at", "end_at", "reason", "updated_at"])
+            changed_starts.extend(b.start_at for b in to_create + to_update)
+            result["created"] += len(to_create)
+            result["updated"] += len(to_update)
+            result["unchanged"] += len(chunk) - len(to_create) - len(to_update)
+            chunk.clear()
+
+        for busy in ranges:
+            if busy.uid in seen:
+                result["duplicates"] += 1
+                continue
+            seen.add(busy.uid)
+            chunk[busy.uid] = busy
+            if len(chunk) >= chunk_size:
+                flush()
+        if chunk:
+            flush()
+
+        if prune:
+            stale = [
+                pk for pk, uid in cls.objects.filter(external_uid__isnull=False, resource_id=resource_id)
+                .values_list("pk", "external_uid").iterator(chunk_size=chunk_size)
+                if uid not in seen
+            ]
+            for i in range(0, len(stale), chunk_size):
+                result["deleted"] += cls.objects.filter(pk__in=stale[i:i + chunk_size]).delete()[0]
+
+        # bulk_create/bulk_update skip post_save, so invalidate cached availability here (once).
+        if changed_starts:
+            CalendarGeneration.bump_on_commit(changed_from=min(changed_starts))
+        return result
+
+
+class RecurrenceFrequency(models.TextChoices):
+    WEEKLY = "WEEKLY", "Weekly"
+    MONTHLY = "MONTHLY", "Monthly"
+    YEARLY = "YEARLY", "Yearly"
+
+
+class RecurringBlackout(TimeStampedModel):
+    """
+    RRULE-style repeating blackout, stored as one row and expanded on demand:
+      - WEEKLY on `weekdays` (0=Mon..6=Sun), every `interval` weeks from `starts_on`
+      - MONTHLY on `month_day`, every `interval` months (months without that day are skipped)
+      - YEARLY on `month`/`month_day`, every `interval` years
+    Times are wall-clock in `timezone`; `all_day` blocks the whole local day.
+    """
+    # Null blocks every resource.
+    resource = models.ForeignKey(Resource, on_delete=models.CASCADE, blank=True, null=True, related_name="recurring_blackouts")
+    frequency = models.CharField(max_length=10, choices=RecurrenceFrequency.choices)
+    interval = models.PositiveSmallIntegerField(default=1)
+    weekdays = models.JSONField(default=list, blank=True)
+    month_day = models.PositiveSmallIntegerField(blank=True, null=True)
+    month = models.PositiveSmallIntegerField(blank=True, null=True)
+
+    timezone = models.CharField(max_length=64, default="UTC")
+    all_day = models.BooleanField(default=False)
+    start_time_local = models.TimeField(blank=True, null=True)
+    end_time_local = models.TimeField(blank=True, null=True)
+
+    starts_on = models.DateField()
+    until = models.DateField(blank=True, null=True)
+
+    reason = models.CharField(max_length=200, blank=True, null=True)
+    is_active = models.BooleanField(default=True)
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["is_active"], name="idx_rblackout_active"),
+        ]
+
+    def clean(self):
+        errors = {}
+        if self.interval < 1:
+            errors["interval"] = "interval must be at least 1."
+        if self.frequency == RecurrenceFrequency.WEEKLY:
+            if not self.weekdays or any(not isinstance(d, int) or not 0 <= d <= 6 for d in self.weekdays):
+                errors["weekdays"] = "Weekly rules need weekdays between 0 (Mon) and 6 (Sun)."
+        elif not self.month_day or not 1 <= self.month_day <= 31:
+            errors["month_day"] = "Monthly and yearly rules need month_day between 1 and 31."
+        if self.frequency == RecurrenceFrequency.YEARLY and (not self.month or not 1 <= self.month <= 12):
+            errors["month"] = "Yearly rules need month between 1 and 12."
+        if not self.all_day:
+            if not self.start_time_local or not self.end_time_local:
+                errors["start_time_local"] = "start_time_local and end_time_local are required unless all_day."
+            elif self.start_time_local >= self.end_time_local:
+                errors["end_time_local"] = "end_time_local must be after start_time_local."
+        if self.until and self.until < self.starts_on:
+            errors["until"] = "until must not be before starts_on."
+        if errors:
+            raise ValidationError(errors)
+
+    def occurs_on(self, day: date) -> bool:
+        if day < self.starts_on or (self.until and day > self.until):
+            return False
+        if self.frequency == RecurrenceFrequency.WEEKLY:
+            first_week = self.starts_on - timedelta(days=self.starts_on.weekday())
+            return day.weekday() in self.weekdays and ((day - first_week).days // 7) % self.interval == 0
+        if day.day != self.month_day:
+            return False
+        if self.frequency == RecurrenceFrequency.MONTHLY:
+            months = (day.year - self.starts_on.year) * 12 + day.month - self.starts_on.month
+            return months % self.interval == 0
+        return day.month == self.month and (day.year - self.starts_on.year) % self.interval == 0
+
+    def occurrences(self, window_start, window_end):
+        """Yield the (UTC) blocked intervals touching [window_start, window_end); only that window is expanded."""
+        tz = ZoneInfo(self.timezone)
+        day = max(window_start.astimezone(tz).date(), self.starts_on)
+        last_day = window_end.astimezone(tz).date()
+        if self.until:
+            last_day = min(last_day, self.until)
+        while day <= last_day:
+            if self.occurs_on(day):
+                if self.all_day:
+                    start = datetime.combine(day, time.min, tzinfo=tz)
+                    end = datetime.combine(day + timedelta(days=1), time.min, tzinfo=tz)
+                else:
+                    start = datetime.combine(day, self.start_time_local, tzinfo=tz)
+                    end = datetime.combine(day, self.end_time_local, tzinfo=tz)
+                start, end = start.astimezone(dt_timezone.utc), end.astimezone(dt_timezone.utc)
+                if start < window_end and end > window_start:
+                    yield start, end
+            day += timedelta(days=1)
+
+
+class CalendarGeneration(models.Model):
+    """
+    Single-row counter bumped after every committed write that can change availability
+    (slots, blackouts, rules). Cached availability is keyed by it, so a bump invalidates
+    every cached window at once without having to enumerate keys.
+    """
+    SINGLETON_PK = 1
+
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    @classmethod
+    def current(cls) -> int:
+        return cls.objects.filter(pk=cls.SINGLETON_PK).values_list("value", flat=True).first() or 0
+
+    @classmethod
+    async def acurrent(cls) -> int:
+        return await cls.objects.filter(pk=cls.SINGLETON_PK).values_list("value", flat=True).afirst() or 0
+
+    @classmethod
+    def bump(cls) -> None:
+        updated = cls.objects.filter(pk=cls.SINGLETON_PK).update(value=F("value") + 1, updated_at=timezone.now())
+        if not updated:
+            cls.objects.get_or_create(pk=cls.SINGLETON_PK, defaults={"value": 1})
+
+    @classmethod
+    def bump_on_commit(cls, changed_from: Optional[datetime] = None) -> None:
+        """
+        Bump once the surrounding transaction commits (immediately in autocommit).
+        Bumping after commit keeps the counter row out of the writer's lock set, and
+        readers that cached pre-commit data did so under a generation that is now dead.
+
+        `changed_from` is the earliest instant the write can affect (None: unknown/everything);
+        it lets calendar_written receivers (next-slot summaries) skip work for far-off changes.
+        """
+        calendar_written.send(sender=cls, changed_from=changed_from)
+        transaction.on_commit(cls.bump)
+
+
+# Sent from inside the writing transaction by CalendarGeneration.bump_on_commit(changed_from=...).
+calendar_written = Signal()
+
+
+class ServiceAvailabilitySummary(models.Model):
+    """
+    Precomputed next free start times of a published service, per allowed duration,
+    so the services list can show them through one join (see booking.next_slots).
+    """
+    service = models.OneToOneField(
+        ConsultingService, on_delete=models.CASCADE, primary_key=True, related_name="availability_summary"
+    )
+    # {"<duration minutes>": ["<UTC ISO start>", ...]} in ascending order
+    next_starts = models.JSONField(default=dict, blank=True)
+    # Calendar changes at or after this instant cannot alter next_starts.
+    covers_until = models.DateTimeField(blank=True, null=True)
+    computed_at = models.DateTimeField(default=timezone.now)
+    # Set by calendar writes that can alter next_starts; the next refresh recomputes and clears it.
+    stale = models.BooleanField(default=False)
+
+    @staticmethod
+    def durations_for(service: ConsultingService) -> list[int]:
+        return sorted(set(service.allowed_durations_minutes or [service.default_duration_minutes]))
+
+    @classmethod
+    def mark_stale(cls, changed_from: Optional[datetime] = None) -> int:
+        """Flag the summaries a change at `changed_from` can alter (all of them when None)."""
+        summaries = cls.objects.filter(stale=False)
+        if changed_from is not None:
+            summaries = summaries.filter(Q(covers_until__isnull=True) | Q(covers_until__gt=changed_from))
+        return summaries.update(stale=True)
+
+    def upcoming(self, now=None) -> dict[str, list[str]]:
+        """next_starts without the entries that have already passed."""
+        now = now or timezone.now()
+        return {
+            duration: [s for s in starts if datetime.fromisoformat(s) > now]
+            for duration, starts in self.next_starts.items()
+        }
+
+    def passed(self, now=None) -> int:
+        """How many listed starts have passed (upcoming() drops them without a write)."""
+        now = now or timezone.now()
+        count = 0
+        for starts in self.next_starts.values():
+            for s in starts:  # ascending
+                if datetime.fromisoformat(s) > now:
+                    break
+                count += 1
+        return count
+
+
+# ----------------------------
+# Notification outbox
+# ----------------------------
+class OutboxStatus(models.TextChoices):
+    PENDING = "PENDING", "Pending"
+    SENT = "SENT", "Sent"
+    FAILED = "FAILED", "Failed"
+
+
+class BookingOutboxEvent(models.Model):
+    """
+    A booking state change waiting to be announced, written in the same transaction
+    as the change itself. booking.notifications drains the table in batches, so API
+    requests never wait on SMTP. Events of one booking are delivered in id order.
+
+    The payload is a snapshot of what the message needs; booking_public_id is a plain
+    column (not a FK) so events outlive the booking row.
+    """
+    booking_public_id = models.CharField(max_length=12)
+    event_type = models.CharField(max_length=30, choices=BookingStatus.choices)
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+
+    status = models.CharField(max_length=10, choices=OutboxStatus.choices, default=OutboxStatus.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    # State changes that notify the requester (COMPLETED is silent).
+    NOTIFY_ON = (
+        BookingStatus.CONFIRMED,
+        BookingStatus.DECLINED,
+        BookingStatus.CANCELLED_BY_ADMIN,
+        BookingStatus.CANCELLED_BY_REQUESTER,
+        BookingStatus.EXPIRED,
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="idx_outbox_status_due"),
+            models.Index(fields=["booking_public_id", "status"], name="idx_outbox_booking_status"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event_type} {self.booking_public_id} ({self.status})"
+
+    @classmethod
+    def build(cls, booking: "BookingRequest", service_name: Optional[str] = None) -> Optional["BookingOutboxEvent"]:
+        """Unsaved event for the booking's current status, or None if that status does not notify."""
+        if booking.status not in cls.NOTIFY_ON:
+            return None
+        return cls(
+            booking_public_id=booking.public_id,
+            event_type=booking.status,
+            payload={
+                "email": booking.email,
+                "full_name": booking.full_name,
+                "service": service_name or booking.service.name,
+                "start_at": booking.requested_start_at,
+                "end_at": booking.requested_end_at,
+                "timezone": booking.timezone,
+                "meeting_mode": booking.meeting_mode,
+                "meeting_url": booking.meeting_url,
+            },
+        )
+
+    @classmethod
+    def record(cls, bookings) -> int:
+        """
+        Queue events for the current status of `bookings`: one lookup for service names,
+        one INSERT. Call inside the transaction that changed them.
+        """
+        bookings = [b for b in bookings if b.status in cls.NOTIFY_ON]
+        if not bookings:
+            return 0
+        names = dict(
+            ConsultingService.objects.filter(pk__in={b.service_id for b in bookings}).values_list("pk", "name")
+        )
+        cls.objects.bulk_create([cls.build(b, names.get(b.service_id)) for b in bookings])
+        return len(bookings)
+
+
+# ----------------------------
+# Archive (closed bookings)
+# ----------------------------
+CLOSED_BOOKING_STATUSES = (
+    BookingStatus.COMPLETED,
+    BookingStatus.DECLINED,
+    BookingStatus.CANCELLED_BY_ADMIN,
+    BookingStatus.CANCELLED_BY_REQUESTER,
+    BookingStatus.EXPIRED,
+)
+
+
+class ArchivedBookingRequest(models.Model):
+    """
+    Cold copy of a closed BookingRequest (same primary key and public_id).
+    Rows are moved here by archive_closed() so the hot table and its indexes only
+    hold bookings that can still change.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    public_id = models.CharField(max_length=12, unique=True)
+    archived_at = models.DateTimeField(default=timezone.now)  # declared before the `timezone` field shadows the module
+
+    service = models.ForeignKey(ConsultingService, on_delete=models.PROTECT, related_name="archived_bookings")
+    status = models.CharField(max_length=30, choices=BookingStatus.choices)
+
+    full_name = models.CharField(max_length=160)
+    email = models.EmailField()
+    company = models.CharField(max_length=200, blank=True, null=True)
+    role = models.CharField(max_length=120, blank=True, null=True)
+    phone = models.CharField(max_length=30, blank=True, null=True)
+
+    timezone = models.CharField(max_length=64, default="UTC")
+    duration_minutes = models.PositiveIntegerField()
+
+    requested_start_at = models.DateTimeField()
+    requested_end_at = models.DateTimeField()
+
+    meeting_mode = models.CharField(max_length=20, choices=MeetingMode.choices)
+    problem_statement = models.TextField(blank=True, null=True)
+
+    admin_notes = models.TextField(blank=True, null=True)
+    meeting_url = models.URLField(max_length=1024, blank=True, null=True)
+
+    handled_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="+",
+    )
+    handled_at = models.DateTimeField(blank=True, null=True)
+    confirmed_at = models.DateTimeField(blank=True, null=True)
+    cancelled_at = models.DateTimeField(blank=True, null=True)
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["email", "created_at"], name="idx_abr_email_created"),
+            models.Index(fields=["requested_start_at"], name="idx_abr_start"),
+            models.Index(fields=["created_at", "id"], name="idx_abr_created"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.public_id} ({self.status}, archived)"
+
+    @classmethod
+    def archive_closed(cls, older_than_days: Optional[int] = None, chunk_size: int = 500, now=None) -> int:
+        """
+        Move closed bookings last updated more than `older_than_days` ago (default
+        BOOKING_ARCHIVE_AFTER_DAYS), with their slots, into the archive tables.
+        Works in chunks along idx_br_status_updated, one short transaction each.
+        Returns the number of bookings moved.
+        """
+        now = now or timezone.now()
+        days = older_than_days if older_than_days is not None else getattr(settings, "BOOKING_ARCHIVE_AFTER_DAYS", 180)
+        cutoff = now - timedelta(days=days)
+        moved = 0
+        while True:
+            with transaction.atomic():
+                batch = list(
+                    BookingRequest.objects.select_for_update()
+                    .filter(status__in=CLOSED_BOOKING_STATUSES, updated_at__lt=cutoff)
+                    .order_by("updated_at")[:chunk_size]
+                )
+                if not batch:
+                    return moved
+                cls._move(batch, now)
+                moved += len(batch)
+
+    @classmethod
+    def _move(cls, batch, now) -> None:
+        pks = [br.pk for br in batch]
+        slots = list(BookingSlot.objects.filter(booking_request_id__in=pks))
+
+        cls.objects.bulk_create([cls.copy_of(br, archived_at=now) for br in batch])
+        ArchivedBookingSlot.objects.bulk_create([ArchivedBookingSlot.copy_of(s) for s in slots])
+
+        # Closed bookings normally have released slots; anything still counted leaves the day counters.
+        BookingDayCounter.apply(
+            removed=[(s.resource_id, s.start_at, s.end_at) for s in slots if s.status in ACTIVE_SLOT_STATUSES]
+        )
+        # Raw deletes: these rows cannot affect availability, so the per-row delete
+        # signals (and their calendar generation bumps) are deliberately skipped.
+        slot_qs = BookingSlot.objects.filter(pk__in=[s.pk for s in slots])
+        slot_qs._raw_delete(slot_qs.db)
+        request_qs = BookingRequest.objects.filter(pk__in=pks)
+        request_qs._raw_delete(request_qs.db)
+
+    @staticmethod
+    def _copy_fields(model, source, target_model, **extra):
+        values = {f.attname: getattr(source, f.attname) for f in model._meta.concrete_fields}
+        values.update(extra)
+        return target_model(**values)
+
+    @classmethod
+    def copy_of(cls, booking: "BookingRequest", **extra) -> "ArchivedBookingRequest":
+        return cls._copy_fields(BookingRequest, booking, cls, **extra)
+
+
+class ArchivedBookingSlot(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    booking_request = models.OneToOneField(ArchivedBookingRequest, on_delete=models.CASCADE, related_name="slot")
+    resource = models.ForeignKey(Resource, on_delete=models.SET_NULL, blank=True, null=True, related_name="+")
+    start_at = models.DateTimeField()
+    end_at = models.DateTimeField()
+    status = models.CharField(max_length=12, choices=BookingSlotStatus.choices)
+    hold_expires_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
 
+    @classmethod
+    def copy_of(cls, slot: "BookingSlot") -> "ArchivedBookingSlot":
+        return ArchivedBookingRequest._copy_fields(BookingSlot, slot, cls)
@@ -0,0 +1,168 @@
+"""
+"Next available" summaries for the services list.
+
+ServiceAvailabilitySummary keeps the next BOOKING_NEXT_SLOTS_COUNT free start times
+of every published service and allowed duration (across its eligible resources), so
+the list serializer reads them through one join instead of running the slot engine
+per service.
+
+Every calendar write reports the earliest instant it can affect (see
+CalendarGeneration.bump_on_commit). After commit, the summaries whose covered range
+reaches that instant are flagged stale with one UPDATE (writes within one transaction
+coalesce into a single one); the slot engine never runs in the request. The lifecycle
+sweep and `manage.py refresh_next_slots --stale --loop` recompute flagged summaries
+(and those of newly published services), each (resource, duration) once for all
+services sharing it, and write only rows whose content changed. The services list
+serves the previous starts until then; creating a booking still checks the time itself.
+
+A full refresh (the lifecycle sweep, `manage.py refresh_next_slots`) also drops starts
+that have passed since the last one.
+"""
+from __future__ import annotations
+
+import threading
+from datetime import datetime, time, timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .catalog import catalog
+from .models import (
+    BookingDayCounter,
+    ConsultingService,
+    ConsultingServiceStatus,
+    Resource,
+    ServiceAvailabilitySummary,
+    calendar_timezone,
+)
+from .slots import compute_slots, load_busy_intervals, load_full_days, load_rules
+
+_pending = threading.local()
+_ALL = object()
+
+
+def _setting(name: str, default):
+    return getattr(settings, name, default)
+
+
+def note_change(changed_from: Optional[datetime] = None) -> None:
+    """Flag the affected summaries stale after commit; None means the whole calendar may have changed."""
+    since = getattr(_pending, "since", None)
+    if since is None:
+        _pending.since = changed_from if changed_from is not None else _ALL
+    elif since is not _ALL:
+        _pending.since = min(since, changed_from) if changed_from is not None else _ALL
+    # robust: a failed update is logged, it must not fail the request whose write just committed.
+    transaction.on_commit(_flush, robust=True)
+
+
+def _flush() -> None:
+    # Every noted write registers this callback; the first to run takes the merged change.
+    since = getattr(_pending, "since", None)
+    if since is None:
+        return
+    _pending.since = None
+    ServiceAvailabilitySummary.mark_stale(None if since is _ALL else since)
+
+
+def next_starts(needed: dict[int, set[int]], now: datetime) -> tuple[dict, dict]:
+    """
+    For every (resource id, duration) in `needed` ({resource_id: durations}): the first free
+    starts inside the horizon, and the instant from which calendar changes can no longer
+    alter that list. One busy/day-cap load is shared by all resources and durations.
+    """
+    count = _setting("BOOKING_NEXT_SLOTS_COUNT", 5)
+    horizon = now + timedelta(days=_setting("BOOKING_NEXT_SLOTS_HORIZON_DAYS", 30))
+    starts = {(rid, d): [] for rid, durations in needed.items() for d in durations}
+    covers = {key: horizon for key in starts}
+    rules = load_rules(needed)
+    if not rules:
+        return starts, covers
+
+    pad = timedelta(minutes=max(
+        max(r.buffer_before_minutes, r.buffer_after_minutes) for own in rules.values() for r in own
+    ))
+    longest = max(d for durations in needed.values() for d in durations)
+    busy = load_busy_intervals(rules, now - pad, horizon + timedelta(minutes=longest) + pad, now=now)
+    full_days = load_full_days(rules, now, horizon)
+
+    for resource_id, own in rules.items():
+        for duration in needed[resource_id]:
+            found = compute_slots(
+                rules=own, busy=busy[resource_id], duration_minutes=duration,
+                window_start=now, window_end=horizon, now=now, full_days=full_days.get(resource_id, ()),
+            )[:count]
+            starts[(resource_id, duration)] = found
+            if len(found) < count:
+                covers[(resource_id, duration)] = horizon + timedelta(minutes=duration) + pad
+            else:
+                # Later changes still reach the last listed start through its buffers or its day's booking cap.
+                last = found[-1]
+                next_day = datetime.combine(
+                    BookingDayCounter.local_day(last) + timedelta(days=1), time.min, tzinfo=calendar_timezone()
+                )
+                covers[(resource_id, duration)] = max(last + timedelta(minutes=duration) + pad, next_day)
+    return starts, covers
+
+
+def refresh(now: Optional[datetime] = None, stale_only: bool = False) -> int:
+    """
+    Recompute every published service's summary, or with `stale_only` those flagged
+    stale or missing. Returns the number of summaries written.
+    """
+    now = now or timezone.now()
+    services = list(
+        ConsultingService.objects.filter(status=ConsultingServiceStatus.PUBLISHED)
+        .select_related("availability_summary")
+        .prefetch_related("resources")
+    )
+    current = {s.pk: getattr(s, "availability_summary", None) for s in services}
+    stale = [s for s in services if not stale_only or current[s.pk] is None or current[s.pk].stale]
+    if not stale_only:
+        ServiceAvailabilitySummary.objects.exclude(service__status=ConsultingServiceStatus.PUBLISHED).delete()
+    if not stale:
+        return 0
+    # Clear the flags before reading the calendar: a write committed from here on flags its summaries again.
+    ServiceAvailabilitySummary.objects.filter(pk__in=[s.pk for s in stale], stale=True).update(stale=False)
+
+    active = list(Resource.objects.filter(is_active=True).order_by("priority", "pk"))
+    eligible = {s.pk: [r.pk for r in s.eligible_resources(active)] for s in stale}
+    needed: dict[int, set[int]] = {}
+    for service in stale:
+        for resource_id in eligible[service.pk]:
+            needed.setdefault(resource_id, set()).update(ServiceAvailabilitySummary.durations_for(service))
+    starts, covers = next_starts(needed, now)
+
+    count = _setting("BOOKING_NEXT_SLOTS_COUNT", 5)
+    horizon_end = now + timedelta(days=_setting("BOOKING_NEXT_SLOTS_HORIZON_DAYS", 30))
+    to_create, to_update = [], []
+    for service in stale:
+        own = ServiceAvailabilitySummary.durations_for(service)
+        resource_ids = eligible[service.pk]
+        next_starts_json = {
+            str(d): [
+                start.isoformat()
+                for start in sorted({start for rid in resource_ids for start in starts[(rid, d)]})[:count]
+            ]
+            for d in own
+        }
+        # A resource's first N starts bound the union's first N, so per-resource bounds are enough.
+        covers_until = max((covers[(rid, d)] for rid in resource_ids for d in own), default=horizon_end)
+        summary = current[service.pk]
+        if summary is None:
+            to_create.append(ServiceAvailabilitySummary(
+                service=service, next_starts=next_starts_json, covers_until=covers_until, computed_at=now,
+            ))
+        elif (summary.next_starts, summary.covers_until) != (next_starts_json, covers_until):
+            summary.next_starts, summary.covers_until, summary.computed_at = next_starts_json, covers_until, now
+            to_update.append(summary)
+
+    if to_create or to_update:
+        with transaction.atomic():
+            ServiceAvailabilitySummary.objects.bulk_create(to_create)
+            ServiceAvailabilitySummary.objects.bulk_update(to_update, ["next_starts", "covers_until", "computed_at"])
+        # The catalog snapshot carries the summaries (services list / detail).
+        catalog.invalidate_on_commit()
+    return len(to_create) + len(to_update)
@@ -0,0 +1,133 @@
+"""
+Outbox dispatcher: turns BookingOutboxEvent rows into emails.
+
+Each batch is claimed in a short transaction (its next_attempt_at is pushed out by a
+lease so concurrent workers and crashed runs do not double-send), sent over a single
+SMTP connection outside any transaction, then marked SENT or rescheduled with
+exponential backoff. Only the oldest pending event of a booking is ever claimable,
+so a booking's notifications go out in the order they happened.
+"""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from .models import BookingOutboxEvent, BookingStatus, OutboxStatus
+
+SUBJECTS = {
+    BookingStatus.CONFIRMED: "Your {service} booking is confirmed",
+    BookingStatus.DECLINED: "Your {service} booking request was declined",
+    BookingStatus.CANCELLED_BY_ADMIN: "Your {service} booking was cancelled",
+    BookingStatus.CANCELLED_BY_REQUESTER: "Your {service} booking was cancelled",
+    BookingStatus.EXPIRED: "Your {service} booking request has expired",
+}
+
+
+def _setting(name: str, default):
+    return getattr(settings, name, default)
+
+
+def render(event: BookingOutboxEvent) -> EmailMessage:
+    p = event.payload
+    lines = [
+        f"Hello {p['full_name']},",
+        "",
+        SUBJECTS[event.event_type].format(service=p["service"]) + ".",
+        f"Requested time: {p['start_at']} - {p['end_at']} (UTC)",
+        f"Meeting mode: {p['meeting_mode']}",
+    ]
+    if event.event_type == BookingStatus.CONFIRMED and p.get("meeting_url"):
+        lines.append(f"Meeting link: {p['meeting_url']}")
+    lines += ["", f"Reference: {event.booking_public_id}"]
+    return EmailMessage(
+        subject=SUBJECTS[event.event_type].format(service=p["service"]),
+        body="\n".join(lines),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[p["email"]],
+        headers={"X-Booking-Reference": event.booking_public_id},
+    )
+
+
+def backoff(attempts: int) -> timedelta:
+    base = _setting("BOOKING_OUTBOX_BACKOFF_SECONDS", 30)
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), _setting("BOOKING_OUTBOX_MAX_BACKOFF_SECONDS", 3600)))
+
+
+def claim(batch_size: int, now=None) -> list[BookingOutboxEvent]:
+    """Lease up to `batch_size` due events, at most one (the oldest pending) per booking."""
+    now = now or timezone.now()
+    earlier_pending = BookingOutboxEvent.objects.filter(
+        booking_public_id=OuterRef("booking_public_id"),
+        status=OutboxStatus.PENDING,
+        pk__lt=OuterRef("pk"),
+    )
+    qs = (
+        BookingOutboxEvent.objects.filter(status=OutboxStatus.PENDING, next_attempt_at__lte=now)
+        .exclude(Exists(earlier_pending))
+        .order_by("pk")
+    )
+    if connection.features.has_select_for_update_skip_locked:
+        qs = qs.select_for_update(skip_locked=True)
+    with transaction.atomic():
+        events = list(qs[:batch_size])
+        if events:
+            lease = now + timedelta(seconds=_setting("BOOKING_OUTBOX_LEASE_SECONDS", 300))
+            BookingOutboxEvent.objects.filter(pk__in=[e.pk for e in events]).update(next_attempt_at=lease)
+    return events
+
+
+def dispatch_batch(batch_size: int = 100) -> dict:
+    """Send one batch. Returns {"sent": n, "retried": n, "failed": n}."""
+    events = claim(batch_size)
+    result = {"sent": 0, "retried": 0, "failed": 0}
+    if not events:
+        return result
+
+    sent, errors = [], {}
+    try:
+        with get_connection() as conn:
+            for event in events:
+                try:
+                    conn.send_messages([render(event)])
+                    sent.append(event.pk)
+                except Exception as exc:
+                    errors[event.pk] = exc
+    except Exception as exc:
+        # Could not open (or cleanly close) the connection: everything not sent is retried.
+        errors.update({e.pk: exc for e in events if e.pk not in sent and e.pk not in errors})
+
+    now = timezone.now()
+    if sent:
+        result["sent"] = BookingOutboxEvent.objects.filter(pk__in=sent).update(
+            status=OutboxStatus.SENT, sent_at=now, last_error=None
+        )
+
+    max_attempts = _setting("BOOKING_OUTBOX_MAX_ATTEMPTS", 8)
+    failed = [e for e in events if e.pk in errors]
+    for event in failed:
+        event.attempts += 1
+        event.last_error = f"{type(errors[event.pk]).__name__}: {errors[event.pk]}"[:2000]
+        if event.attempts >= max_attempts:
+            event.status = OutboxStatus.FAILED
+            result["failed"] += 1
+        else:
+            event.next_attempt_at = now + backoff(event.attempts)
+            result["retried"] += 1
+    BookingOutboxEvent.objects.bulk_update(failed, ["attempts", "last_error", "status", "next_attempt_at"])
+    return result
+
+
+def drain(batch_size: int = 100) -> dict:
+    """Dispatch batches until nothing is due (events blocked behind a retrying one stay queued)."""
+    total = {"sent": 0, "retried": 0, "failed": 0}
+    while True:
+        result = dispatch_batch(batch_size)
+        for key, value in result.items():
+            total[key] += value
+        if not any(result.values()):
+            return total
@@ -0,0 +1,354 @@
+"""
+Capacity / utilization report for the booking calendar.
+
+The report window (BOOKING_REPORT_PAST_DAYS before today to BOOKING_REPORT_AHEAD_DAYS
+after it, in local days of BOOKING_CALENDAR_TIMEZONE) is laid out as a timeline with
+one array cell per minute. For each resource, the availability rules, blackouts and
+active slots are loaded as arrays of start/end minute indexes and painted onto the
+timeline with a difference array (np.add.at + cumsum). The interval arithmetic
+(rules minus blackouts, booked minutes, local-day totals) therefore runs as a few
+vectorized passes instead of Python loops over datetimes. Day totals are then rolled
+up into weeks, weekdays and a past/upcoming split.
+
+Booked minutes are those of confirmed and completed bookings, including archived
+ones, so the past year stays complete after sweep_bookings and archive_bookings
+have run. The report is plain JSON data and is cached
+for BOOKING_REPORT_CACHE_TIMEOUT seconds (see capacity_report). The admin endpoint
+serves it as JSON or CSV (see report_rows).
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Iterator, Optional
+from zoneinfo import ZoneInfo
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import (
+    ArchivedBookingRequest,
+    ArchivedBookingSlot,
+    BlackoutPeriod,
+    BookingRequest,
+    BookingSlot,
+    BookingStatus,
+    ConsultingService,
+    Resource,
+    calendar_timezone,
+)
+from .slots import load_rules, recurring_blackout_intervals
+
+MINUTES_PER_DAY = 24 * 60
+EPOCH = date(1970, 1, 1)
+# Lead time / cancellation notice histogram edges in hours; the last bin is open-ended.
+HOUR_BINS = (0, 24, 72, 168, 336, 720)
+CANCELLED_STATUSES = (BookingStatus.CANCELLED_BY_ADMIN, BookingStatus.CANCELLED_BY_REQUESTER)
+BOOKED_STATUSES = (BookingStatus.CONFIRMED, BookingStatus.COMPLETED)
+
+
+def _setting(name: str, default):
+    return getattr(settings, name, default)
+
+
+def epoch_minutes(values: Iterable[datetime]) -> np.ndarray:
+    """Aware datetimes -> int64 minutes since the Unix epoch (one conversion pass, no arithmetic)."""
+    values = list(values)
+    seconds = np.fromiter((v.timestamp() for v in values), dtype=np.float64, count=len(values))
+    return (seconds // 60).astype(np.int64)
+
+
+class Timeline:
+    """
+    Minute grid over the local days [first_day, first_day + days) of `tz`.
+    Cell i is the minute starting `origin + i` (minutes since the epoch).
+    """
+
+    def __init__(self, first_day: date, days: int, tz: ZoneInfo):
+        self.first_day, self.days, self.tz = first_day, days, tz
+        # Only the calendar setup touches datetimes: one UTC offset per local midnight.
+        offsets = self._offsets_at(tz, time.min, np.arange(days + 1))
+        day_epoch = (first_day - EPOCH).days + np.arange(days + 1)
+        midnights = day_epoch * MINUTES_PER_DAY - offsets
+        self.origin = int(midnights[0])
+        # bounds[k] is the first cell of local day k; bounds[days] is the end of the grid.
+        self.bounds = midnights - self.origin
+        self.size = int(self.bounds[-1])
+        self.weekdays = (first_day.weekday() + np.arange(days)) % 7
+        self._offset_cache: dict[tuple[str, time], np.ndarray] = {}
+
+    def _offsets_at(self, tz: ZoneInfo, at: time, day_indexes: np.ndarray) -> np.ndarray:
+        """UTC offset in minutes of tz at local time `at` on each of the given local days."""
+        return np.array(
+            [
+                datetime.combine(self.first_day + timedelta(days=int(i)), at, tzinfo=tz).utcoffset() // timedelta(minutes=1)
+                for i in day_indexes
+            ],
+            dtype=np.int64,
+        )
+
+    def to_cells(self, minutes: np.ndarray) -> np.ndarray:
+        return minutes - self.origin
+
+    def day_of(self, cells: np.ndarray) -> np.ndarray:
+        """Local day index of each cell (-1 before the grid, `days` after it)."""
+        return np.searchsorted(self.bounds, cells, side="right") - 1
+
+    def paint(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """Boolean minute mask of the union of [starts, ends) (cell indexes, clipped to the grid)."""
+        starts = np.clip(starts, 0, self.size)
+        ends = np.clip(ends, 0, self.size)
+        keep = starts < ends
+        diff = np.zeros(self.size + 1, dtype=np.int32)
+        np.add.at(diff, starts[keep], 1)
+        np.add.at(diff, ends[keep], -1)
+        return np.cumsum(diff[:-1]) > 0
+
+    def per_day(self, mask: np.ndarray) -> np.ndarray:
+        """Minutes set in `mask` per local day."""
+        cumulative = np.concatenate(([0], np.cumsum(mask, dtype=np.int64)))
+        return cumulative[self.bounds[1:]] - cumulative[self.bounds[:-1]]
+
+    def rule_windows(self, rules) -> tuple[np.ndarray, np.ndarray]:
+        """Cell ranges of the weekly windows of `rules`, each in its own timezone."""
+        # One local day of slack on either side: rule zones may be ahead of / behind the calendar zone.
+        local_days = np.arange(-1, self.days + 1)
+        weekdays = (self.first_day.weekday() + local_days) % 7
+        day_epoch = (self.first_day - EPOCH).days + local_days
+        starts, ends = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+        for rule in rules:
+            on = weekdays == rule.day_of_week
+            for at, out in ((rule.start_time_local, starts), (rule.end_time_local, ends)):
+                key = (rule.timezone, at)
+                if key not in self._offset_cache:
+                    self._offset_cache[key] = self._offsets_at(ZoneInfo(rule.timezone), at, local_days)
+                local = day_epoch[on] * MINUTES_PER_DAY + at.hour * 60 + at.minute
+                out.append(self.to_cells(local - self._offset_cache[key][on]))
+        return np.concatenate(starts), np.concatenate(ends)
+
+
+def _utilization(available, booked) -> dict:
+    available, booked = int(available), int(booked)
+    return {
+        "available_minutes": available,
+        "booked_minutes": booked,
+        "utilization": round(booked / available, 4) if available else None,
+    }
+
+
+def _histogram(hours: np.ndarray) -> list[int]:
+    counts, _ = np.histogram(hours, bins=[*HOUR_BINS, np.inf])
+    return counts.tolist()
+
+
+def _percentile(hours: np.ndarray, q: float) -> Optional[float]:
+    return round(float(np.percentile(hours, q)), 1) if hours.size else None
+
+
+def build_capacity_report(now: Optional[datetime] = None) -> dict:
+    """Compute the report from the database (uncached)."""
+    now = now or timezone.now()
+    tz = calendar_timezone()
+    today = now.astimezone(tz).date()
+    past_days = _setting("BOOKING_REPORT_PAST_DAYS", 365)
+    timeline = Timeline(today - timedelta(days=past_days), past_days + _setting("BOOKING_REPORT_AHEAD_DAYS", 92), tz)
+    window_start = datetime.combine(timeline.first_day, time.min, tzinfo=tz)
+    window_end = datetime.combine(timeline.first_day + timedelta(days=timeline.days), time.min, tzinfo=tz)
+    upcoming = np.arange(timeline.days) >= past_days
+
+    resources = list(Resource.objects.order_by("priority", "pk"))
+    rules = load_rules([r.pk for r in resources])
+
+    # Blackouts (one-off + recurring) by resource; None blocks every resource.
+    blackout_rows = list(
+        BlackoutPeriod.objects.filter(start_at__lt=window_end, end_at__gt=window_start)
+        .values_list("resource_id", "start_at", "end_at")
+    )
+    blackout_rows += [(rid, s, e) for s, e, _, rid in recurring_blackout_intervals(window_start, window_end)]
+    blackout_rid = np.array([-1 if rid is None else rid for rid, _, _ in blackout_rows], dtype=np.int64)
+    blackout_start = timeline.to_cells(epoch_minutes(s for _, s, _ in blackout_rows))
+    blackout_end = timeline.to_cells(epoch_minutes(e for _, _, e in blackout_rows))
+
+    # Booked time: slots of confirmed or completed requests, live and archived. Not the slot
+    # status: the lifecycle sweep releases the slots of completed bookings.
+    slot_rows = []
+    for model in (BookingSlot, ArchivedBookingSlot):
+        slot_rows += list(
+            model.objects.filter(
+                booking_request__status__in=BOOKED_STATUSES, resource__isnull=False,
+                start_at__lt=window_end, end_at__gt=window_start,
+            ).values_list("resource_id", "booking_request__service_id", "start_at", "end_at")
+        )
+    slot_rid = np.array([r[0] for r in slot_rows], dtype=np.int64)
+    slot_service = np.array([r[1] for r in slot_rows], dtype=np.int64)
+    slot_start = timeline.to_cells(epoch_minutes(r[2] for r in slot_rows))
+    slot_end = timeline.to_cells(epoch_minutes(r[3] for r in slot_rows))
+
+    available_days = {}
+    total_available = np.zeros(timeline.days, dtype=np.int64)
+    total_booked = np.zeros(timeline.days, dtype=np.int64)
+    for resource in resources:
+        own = (blackout_rid == resource.pk) | (blackout_rid == -1)
+        open_mask = timeline.paint(*timeline.rule_windows(rules.get(resource.pk, ())))
+        open_mask &= ~timeline.paint(blackout_start[own], blackout_end[own])
+        mine = slot_rid == resource.pk
+        booked_mask = timeline.paint(slot_start[mine], slot_end[mine])
+        available_days[resource.pk] = timeline.per_day(open_mask)
+        total_available += available_days[resource.pk]
+        total_booked += timeline.per_day(booked_mask)
+
+    report = {
+        "generated_at": now.isoformat(),
+        "timezone": str(tz),
+        "range": {
+            "start": timeline.first_day.isoformat(),
+            "end": (timeline.first_day + timedelta(days=timeline.days)).isoformat(),
+            "upcoming_from": today.isoformat(),
+        },
+        "totals": {
+            period: _utilization(total_available[mask].sum(), total_booked[mask].sum())
+            for period, mask in (("past", ~upcoming), ("upcoming", upcoming))
+        },
+    }
+
+    # Weeks start on Monday; the first and last ones may be partial.
+    week = (np.arange(timeline.days) + timeline.first_day.weekday()) // 7
+    first_monday = timeline.first_day - timedelta(days=timeline.first_day.weekday())
+    week_available = np.bincount(week, weights=total_available)
+    week_booked = np.bincount(week, weights=total_booked)
+    report["weeks"] = [
+        {"week_start": (first_monday + timedelta(weeks=i)).isoformat(), **_utilization(a, b)}
+        for i, (a, b) in enumerate(zip(week_available, week_booked))
+    ]
+
+    report["weekdays"] = {
+        period: [
+            {"weekday": d, **_utilization(a, b)}
+            for d, (a, b) in enumerate(zip(
+                np.bincount(timeline.weekdays[mask], weights=total_available[mask], minlength=7),
+                np.bincount(timeline.weekdays[mask], weights=total_booked[mask], minlength=7),
+            ))
+        ]
+        for period, mask in (("past", ~upcoming), ("upcoming", upcoming))
+    }
+
+    report["services"] = _services(timeline, past_days, available_days, slot_service, slot_start, slot_end)
+    report.update(_bookings(timeline, window_start, window_end))
+    return report
+
+
+def _services(timeline, past_days, available_days, slot_service, slot_start, slot_end) -> list[dict]:
+    """Booked minutes per service against the available minutes of its (currently) eligible resources."""
+    upcoming = np.arange(timeline.days) >= past_days
+    services = list(ConsultingService.objects.prefetch_related("resources").order_by("name"))
+    active = list(Resource.objects.filter(is_active=True).order_by("priority", "pk"))
+    index = {s.pk: i for i, s in enumerate(services)}
+
+    # A slot counts towards the period of the local day it starts on.
+    minutes = np.clip(slot_end, 0, timeline.size) - np.clip(slot_start, 0, timeline.size)
+    starts_upcoming = timeline.day_of(np.clip(slot_start, 0, timeline.size - 1)) >= past_days
+    position = np.array([index.get(int(s), -1) for s in slot_service], dtype=np.int64)
+    known = position >= 0
+    booked = {
+        period: np.bincount(position[known & mask], weights=minutes[known & mask], minlength=len(services))
+        for period, mask in (("past", ~starts_upcoming), ("upcoming", starts_upcoming))
+    }
+
+    rows = []
+    for i, service in enumerate(services):
+        eligible = [r.pk for r in service.eligible_resources(active)]
+        days = sum((available_days[rid] for rid in eligible if rid in available_days), np.zeros(timeline.days, dtype=np.int64))
+        rows.append({
+            "service": service.slug,
+            "past": _utilization(days[~upcoming].sum(), booked["past"][i]),
+            "upcoming": _utilization(days[upcoming].sum(), booked["upcoming"][i]),
+        })
+    return rows
+
+
+def _bookings(timeline, window_start, window_end) -> dict:
+    """Lead-time and cancellation distributions of the requests starting inside the window."""
+    rows = []
+    for model in (BookingRequest, ArchivedBookingRequest):
+        rows += list(
+            model.objects.filter(requested_start_at__gte=window_start, requested_start_at__lt=window_end)
+            .exclude(status__in=(BookingStatus.DECLINED, BookingStatus.EXPIRED))
+            .values_list("created_at", "requested_start_at", "status", "cancelled_at")
+        )
+    created = epoch_minutes(r[0] for r in rows)
+    start = epoch_minutes(r[1] for r in rows)
+    cancelled = np.array([r[2] in CANCELLED_STATUSES for r in rows], dtype=bool)
+    noticed = cancelled & np.array([r[3] is not None for r in rows], dtype=bool)
+    cancelled_at = epoch_minutes(r[3] for r in rows if r[3] is not None)
+
+    # Requests entered after the fact (or cancelled after the start) count as zero hours.
+    lead_hours = np.clip((start - created) / 60, 0, None)
+    notice_hours = np.clip((start[noticed] - cancelled_at) / 60, 0, None)
+    weekday = timeline.weekdays[np.clip(timeline.day_of(timeline.to_cells(start)), 0, timeline.days - 1)]
+    per_weekday = np.bincount(weekday, minlength=7)
+    cancelled_per_weekday = np.bincount(weekday[cancelled], minlength=7)
+
+    return {
+        "lead_time": {
+            "bins_hours": list(HOUR_BINS),
+            "counts": _histogram(lead_hours),
+            "p50_hours": _percentile(lead_hours, 50),
+            "p90_hours": _percentile(lead_hours, 90),
+            "requests": len(rows),
+        },
+        "cancellations": {
+            "requests": len(rows),
+            "cancelled": int(cancelled.sum()),
+            "rate": round(float(cancelled.mean()), 4) if rows else None,
+            "notice_bins_hours": list(HOUR_BINS),
+            "notice_counts": _histogram(notice_hours),
+            "by_weekday": [
+                {"weekday": d, "requests": int(n), "cancelled": int(c), "rate": round(c / n, 4) if n else None}
+                for d, (n, c) in enumerate(zip(per_weekday, cancelled_per_weekday))
+            ],
+        },
+    }
+
+
+def capacity_report(refresh: bool = False) -> dict:
+    """
+    The cached report for today; rebuilt at most every BOOKING_REPORT_CACHE_TIMEOUT seconds
+    (or when `refresh` is set), so planning tools polling it do not load the production DB.
+    """
+    timeout = _setting("BOOKING_REPORT_CACHE_TIMEOUT", 3600)
+    key = f"booking:capacity-report:{timezone.now().astimezone(calendar_timezone()).date().isoformat()}"
+    report = None if refresh or timeout <= 0 else cache.get(key)
+    if report is None:
+        report = build_capacity_report()
+        if timeout > 0:
+            cache.set(key, report, timeout)
+    return report
+
+
+CSV_HEADER = ["section", "period", "label", "available_minutes", "booked_minutes", "utilization", "count", "rate"]
+
+
+def report_rows(report: dict) -> Iterator[list]:
+    """The report flattened to CSV rows (CSV_HEADER columns; blanks where a column does not apply)."""
+    yield CSV_HEADER
+    for period, row in report["totals"].items():
+        yield ["total", period, "", row["available_minutes"], row["booked_minutes"], row["utilization"], "", ""]
+    for row in report["weeks"]:
+        yield ["week", "", row["week_start"], row["available_minutes"], row["booked_minutes"], row["utilization"], "", ""]
+    for period, rows in report["weekdays"].items():
+        for row in rows:
+            yield ["weekday", period, row["weekday"], row["available_minutes"], row["booked_minutes"], row["utilization"], "", ""]
+    for row in report["services"]:
+        for period in ("past", "upcoming"):
+            r = row[period]
+            yield ["service", period, row["service"], r["available_minutes"], r["booked_minutes"], r["utilization"], "", ""]
+    for section, bins, counts in (
+        ("lead_time", report["lead_time"]["bins_hours"], report["lead_time"]["counts"]),
+        ("cancellation_notice", report["cancellations"]["notice_bins_hours"], report["cancellations"]["notice_counts"]),
+    ):
+        labels = [f"{lo}-{hi}h" for lo, hi in zip(bins, bins[1:])] + [f"{bins[-1]}h+"]
+        for label, count in zip(labels, counts):
+            yield [section, "", label, "", "", "", count, ""]
+    for row in report["cancellations"]["by_weekday"]:
+        yield ["cancellation_weekday", "", row["weekday"], "", "", "", row["requests"], row["rate"]]
@@ -1,4 +1,7 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.utils import timezone
 from rest_framework import serializers
 
@@ -7,12 +10,30 @@ from .models import (
     ConsultingServiceStatus,
     BookingRequest,
     BookingStatus,
+    BookingSlotStatus,
     MeetingMode,
     AvailabilityRule,
     BlackoutPeriod,
+    RecurringBlackout,
+    ArchivedBookingRequest,
+    ArchivedBookingSlot,
+    Resource,
 )
+from .catalog import CatalogEntry, catalog
+
+class ResourceSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Resource
+        fields = ["id", "slug", "name", "kind", "priority", "is_active", "created_at", "updated_at"]
+
 
 class ConsultingServiceReadSerializer(serializers.ModelSerializer):
+    # Empty means every active resource; querysets should prefetch_related("resources").
+    resources = serializers.SlugRelatedField(slug_field="slug", many=True, read_only=True)
+    # From the precomputed ServiceAvailabilitySummary: querysets must select_related("availability_summary").
+    next_available_at = serializers.SerializerMethodField()
+    next_available = serializers.SerializerMethodField()
+
     class Meta:
         model = ConsultingService
         fields = [
@@ -23,10 +44,42 @@ class ConsultingServiceReadSerializer(serializers.ModelSerializer):
             "price_amount", "currency",
             "meeting_modes",
             "status",
+            "resources",
+            "next_available_at",
+            "next_available",
             "created_at", "updated_at",
         ]
 
+    @staticmethod
+    def _upcoming(obj) -> dict:
+        summary = getattr(obj, "availability_summary", None)
+        return summary.upcoming() if summary else {}
+
+    def get_next_available_at(self, obj):
+        """Next free start for the default duration (or the shortest allowed one)."""
+        upcoming = self._upcoming(obj)
+        starts = upcoming.get(str(obj.default_duration_minutes))
+        if starts is None and upcoming:
+            starts = upcoming[min(upcoming, key=int)]
+        return serializers.DateTimeField().to_representation(datetime.fromisoformat(starts[0])) if starts else None
+
+    def get_next_available(self, obj):
+        """{"<duration minutes>": [start, ...]}; null until the summary is computed."""
+        upcoming = self._upcoming(obj)
+        if not upcoming:
+            return None
+        field = serializers.DateTimeField()
+        return {
+            duration: [field.to_representation(datetime.fromisoformat(s)) for s in starts]
+            for duration, starts in upcoming.items()
+        }
+
+
 class ConsultingServiceWriteSerializer(serializers.ModelSerializer):
+    resources = serializers.SlugRelatedField(
+        slug_field="slug", many=True, required=False, queryset=Resource.objects.all()
+    )
+
     class Meta:
         model = ConsultingService
         fields = [
@@ -37,9 +90,27 @@ class ConsultingServiceWriteSerializer(serializers.ModelSerializer):
             "price_amount", "currency",
             "meeting_modes",
             "status",
+            "resources",
         ]
 
 
+class CatalogServiceField(serializers.Field):
+    """
+    Resolves a published service by slug from the in-process catalog (no DB round trip).
+    Unknown and unpublished slugs are rejected the same way.
+    """
+    default_error_messages = {"unavailable": "Service is not available for booking."}
+
+    def to_internal_value(self, data):
+        entry = catalog.get(str(data))
+        if entry is None:
+            self.fail("unavailable")
+        return entry.service
+
+    def to_representation(self, value):
+        return value.slug
+
+
 class BookingRequestCreateSerializer(serializers.ModelSerializer):
     """
     Public create endpoint.
@@ -51,10 +122,7 @@ class BookingRequestCreateSerializer(serializers.ModelSerializer):
       - user details
     Server computes requested_end_at = start + duration.
     """
-    service = serializers.SlugRelatedField(
-        slug_field="slug",
-        queryset=ConsultingService.objects.all(),
-    )
+    service = CatalogServiceField()
 
     class Meta:
         model = BookingRequest
@@ -68,27 +136,35 @@ class BookingRequestCreateSerializer(serializers.ModelSerializer):
             "problem_statement",
         ]
 
+    @staticmethod
+    def check_bookable(entry, duration, meeting_mode) -> None:
+        service = None if entry is None else entry.service
+        if service is None or service.status != ConsultingServiceStatus.PUBLISHED:
+            raise serializers.ValidationError({"service": "Service is not available for booking."})
+
+        if not entry.allows_duration(duration):
+            raise serializers.ValidationError(
+                {"duration_minutes": f"duration_minutes must be one of {service.allowed_durations_minutes}."}
+            )
+
+        if not entry.allows_meeting_mode(meeting_mode):
+            raise serializers.ValidationError({"meeting_mode": f"meeting_mode must be one of {service.meeting_modes}."})
+
     def validate(self, attrs):
         service: ConsultingService = attrs["service"]
-
-        if service.status != ConsultingServiceStatus.PUBLISHED:
+        entry = catalog.get(service.slug)
+        if entry is None or service.status != ConsultingServiceStatus.PUBLISHED:
             raise serializers.ValidationError({"service": "Service is not available for booking."})
 
         duration = attrs.get("duration_minutes") or service.default_duration_minutes
         if duration <= 0:
             raise serializers.ValidationError({"duration_minutes": "duration_minutes must be > 0."})
 
-        allowed = service.allowed_durations_minutes
-        if allowed and duration not in allowed:
-            raise serializers.ValidationError({"duration_minutes": f"duration_minutes must be one of {allowed}."})
-
         meeting_mode = attrs.get("meeting_mode")
         if meeting_mode not in MeetingMode.values:
             raise serializers.ValidationError({"meeting_mode": "Invalid meeting mode."})
 
-        meeting_modes_allowed = service.meeting_modes
-        if meeting_modes_allowed and meeting_mode not in meeting_modes_allowed:
-            raise serializers.ValidationError({"meeting_mode": f"meeting_mode must be one of {meeting_modes_allowed}."})
+        self.check_bookable(entry, duration, meeting_mode)
 
         start = attrs.get("requested_start_at")
         if not start:
@@ -103,6 +179,14 @@ class BookingRequestCreateSerializer(serializers.ModelSerializer):
         return attrs
 
     def create(self, validated_data):
+        # validate() trusted this process's catalog snapshot, which can lag an edit made by
+        # another worker: check the service row again inside the create transaction.
+        service = ConsultingService.objects.filter(pk=validated_data["service"].pk).first()
+        self.check_bookable(
+            None if service is None else CatalogEntry.from_service(service),
+            validated_data["duration_minutes"], validated_data["meeting_mode"],
+        )
+        validated_data["service"] = service
         # requested_end_at was injected in validate()
         end = validated_data.pop("requested_end_at")
         obj = BookingRequest.objects.create(**validated_data, requested_end_at=end)
@@ -111,6 +195,7 @@ class BookingRequestCreateSerializer(serializers.ModelSerializer):
 
 class BookingRequestPublicSerializer(serializers.ModelSerializer):
     service = serializers.SlugRelatedField(slug_field="slug", read_only=True)
+    hold_expires_at = serializers.SerializerMethodField()
 
     class Meta:
         model = BookingRequest
@@ -125,14 +210,23 @@ class BookingRequestPublicSerializer(serializers.ModelSerializer):
             "meeting_mode",
             "problem_statement",
             "meeting_url",
+            "hold_expires_at",
             "created_at", "updated_at",
             "confirmed_at", "cancelled_at",
         ]
         read_only_fields = fields
 
+    def get_hold_expires_at(self, obj):
+        slot = getattr(obj, "slot", None)
+        if slot is not None and slot.status == BookingSlotStatus.HELD:
+            return slot.hold_expires_at
+        return None
+
 
 class BookingRequestAdminSerializer(serializers.ModelSerializer):
     service = serializers.SlugRelatedField(slug_field="slug", read_only=True)
+    # Resource of the booking's slot; querysets should select_related("slot__resource").
+    resource = serializers.SlugRelatedField(source="slot.resource", slug_field="slug", read_only=True, default=None)
 
     class Meta:
         model = BookingRequest
@@ -148,21 +242,51 @@ class BookingRequestAdminSerializer(serializers.ModelSerializer):
             "problem_statement",
             "admin_notes",
             "meeting_url",
+            "resource",
             "handled_by", "handled_at",
             "confirmed_at", "cancelled_at",
             "created_at", "updated_at",
         ]
 
 
+class ArchivedBookingSlotSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ArchivedBookingSlot
+        fields = ["start_at", "end_at", "status"]
+
+
+class ArchivedBookingRequestSerializer(serializers.ModelSerializer):
+    service = serializers.SlugRelatedField(slug_field="slug", read_only=True)
+    resource = serializers.SlugRelatedField(source="slot.resource", slug_field="slug", read_only=True, default=None)
+    slot = ArchivedBookingSlotSerializer(read_only=True)
+
+    class Meta:
+        model = ArchivedBookingRequest
+        fields = BookingRequestAdminSerializer.Meta.fields + ["slot", "archived_at"]
+
+
 class BookingConfirmSerializer(serializers.Serializer):
     meeting_url = serializers.URLField(required=False, allow_null=True, allow_blank=True)
 
 
+class BookingBulkActionSerializer(serializers.Serializer):
+    public_ids = serializers.ListField(
+        child=serializers.CharField(max_length=12),
+        allow_empty=False,
+        max_length=500,
+    )
+    # Only used by bulk-confirm
+    meeting_url = serializers.URLField(required=False, allow_null=True, allow_blank=True)
+
+
 class AvailabilityRuleSerializer(serializers.ModelSerializer):
+    resource = serializers.SlugRelatedField(slug_field="slug", queryset=Resource.objects.all())
+
     class Meta:
         model = AvailabilityRule
         fields = [
             "id",
+            "resource",
             "timezone",
             "day_of_week",
             "start_time_local",
@@ -177,16 +301,101 @@ class AvailabilityRuleSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
 
+    def validate_timezone(self, value):
+        # The slot engine resolves local times with zoneinfo, so reject names it cannot load.
+        try:
+            ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise serializers.ValidationError("Unknown timezone.")
+        return value
+
 
 class BlackoutPeriodSerializer(serializers.ModelSerializer):
+    # Null (the default) blocks every resource.
+    resource = serializers.SlugRelatedField(
+        slug_field="slug", queryset=Resource.objects.all(), required=False, allow_null=True
+    )
+
     class Meta:
         model = BlackoutPeriod
         fields = [
             "id",
+            "resource",
             "start_at",
             "end_at",
             "reason",
+            "external_uid",
             "created_by",
             "created_at",
+            "updated_at",
         ]
-        read_only_fields = ["created_by", "created_at"]
+        read_only_fields = ["external_uid", "created_by", "created_at", "updated_at"]
+
+
+class BlackoutImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    # Zone for floating (TZID-less) times; defaults to BOOKING_CALENDAR_TIMEZONE.
+    timezone = serializers.CharField(max_length=64, required=False)
+    reason = serializers.CharField(max_length=200, required=False, default="Busy")
+    # Resource the busy time belongs to; omitted blocks every resource.
+    resource = serializers.SlugRelatedField(
+        slug_field="slug", queryset=Resource.objects.all(), required=False, allow_null=True, default=None
+    )
+    prune = serializers.BooleanField(required=False, default=False)
+
+    def validate_timezone(self, value):
+        try:
+            return ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise serializers.ValidationError("Unknown timezone.")
+
+
+class RecurringBlackoutSerializer(serializers.ModelSerializer):
+    # Null (the default) blocks every resource.
+    resource = serializers.SlugRelatedField(
+        slug_field="slug", queryset=Resource.objects.all(), required=False, allow_null=True
+    )
+
+    class Meta:
+        model = RecurringBlackout
+        fields = [
+            "id",
+            "resource",
+            "frequency",
+            "interval",
+            "weekdays",
+            "month_day",
+            "month",
+            "timezone",
+            "all_day",
+            "start_time_local",
+            "end_time_local",
+            "starts_on",
+            "until",
+            "reason",
+            "is_active",
+            "created_by",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = ["created_by", "created_at", "updated_at"]
+
+    def validate_timezone(self, value):
+        try:
+            ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise serializers.ValidationError("Unknown timezone.")
+        return value
+
+    def validate(self, attrs):
+        # The pattern fields depend on each other (and on partial updates), so check the merged rule.
+        rule = RecurringBlackout() if self.instance is None else RecurringBlackout(
+            **{f: getattr(self.instance, f) for f in self.Meta.fields if f not in ("id", *self.Meta.read_only_fields)}
+        )
+        for field, value in attrs.items():
+            setattr(rule, field, value)
+        try:
+            rule.clean()
+        except DjangoValidationError as e:
+            raise serializers.ValidationError(e.message_dict)
+        return attrs
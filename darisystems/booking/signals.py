@@ -0,0 +1,64 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from . import next_slots
+from .catalog import catalog
+from .models import (
+    AvailabilityRule,
+    BlackoutPeriod,
+    BookingSlot,
+    CalendarGeneration,
+    ConsultingService,
+    RecurringBlackout,
+    Resource,
+    calendar_written,
+)
+
+
+@receiver(post_save, sender=BookingSlot)
+@receiver(post_delete, sender=BookingSlot)
+@receiver(post_save, sender=BlackoutPeriod)
+@receiver(post_delete, sender=BlackoutPeriod)
+def range_changed(sender, instance, **kwargs):
+    CalendarGeneration.bump_on_commit(changed_from=instance.changed_from())
+
+
+@receiver(post_save, sender=RecurringBlackout)
+@receiver(post_delete, sender=RecurringBlackout)
+@receiver(post_save, sender=AvailabilityRule)
+@receiver(post_delete, sender=AvailabilityRule)
+def calendar_changed(sender, **kwargs):
+    CalendarGeneration.bump_on_commit()
+
+
+@receiver(calendar_written)
+def refresh_next_slots(sender, changed_from=None, **kwargs):
+    next_slots.note_change(changed_from)
+
+
+@receiver(post_save, sender=ConsultingService)
+@receiver(post_delete, sender=ConsultingService)
+def service_changed(sender, **kwargs):
+    catalog.invalidate_on_commit()
+    # Durations or the published set may have changed.
+    next_slots.note_change()
+
+
+@receiver(post_save, sender=Resource)
+@receiver(post_delete, sender=Resource)
+@receiver(m2m_changed, sender=ConsultingService.resources.through)
+def resources_changed(sender, instance, action=None, reverse=False, pk_set=None, **kwargs):
+    if action is not None and not action.startswith("post_"):
+        return
+    # The services' representation lists their resources: move their updated_at (conditional GET validators).
+    if action is None:
+        services = ConsultingService.objects.filter(resources=instance)
+    elif reverse:
+        services = ConsultingService.objects.filter(pk__in=pk_set or ())
+    else:
+        services = ConsultingService.objects.filter(pk=instance.pk)
+    services.update(updated_at=timezone.now())
+    # Eligible resources (and so every service's slots) may have changed.
+    catalog.invalidate_on_commit()
+    CalendarGeneration.bump_on_commit()
@@ -0,0 +1,262 @@
+"""
+Bookable slot generation.
+
+For each resource that can deliver the service, expands its active weekly
+AvailabilityRules for a window (in each rule's own timezone), subtracts its
+blackouts (one-off and recurring, its own and the global ones), confirmed slots
+and active holds with one sorted sweep. A start time is bookable when any of
+the resources can take it.
+"""
+from __future__ import annotations
+
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from typing import Collection, Iterable, Iterator, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import (
+    AvailabilityRule,
+    BlackoutPeriod,
+    BookingDayCounter,
+    BookingSlot,
+    CalendarGeneration,
+    ConsultingService,
+    RecurringBlackout,
+)
+
+Interval = tuple[datetime, datetime]
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> list[Interval]:
+    """
+    Sort and coalesce overlapping/touching intervals.
+    The result has strictly increasing starts *and* ends, so it can be bisected on either.
+    """
+    merged: list[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def expand_rule(rule: AvailabilityRule, window_start: datetime, window_end: datetime) -> Iterator[Interval]:
+    """
+    Yield the concrete (UTC) open windows of a weekly rule that touch [window_start, window_end).
+    Local wall-clock times are resolved per day, so DST shifts are honoured.
+    """
+    tz = ZoneInfo(rule.timezone)
+    day = window_start.astimezone(tz).date()
+    last_day = window_end.astimezone(tz).date()
+
+    day += timedelta(days=(rule.day_of_week - day.weekday()) % 7)
+    while day <= last_day:
+        open_start = datetime.combine(day, rule.start_time_local, tzinfo=tz).astimezone(dt_timezone.utc)
+        open_end = datetime.combine(day, rule.end_time_local, tzinfo=tz).astimezone(dt_timezone.utc)
+        if open_start < window_end and open_end > window_start:
+            yield open_start, open_end
+        day += timedelta(days=7)
+
+
+def _ceil_to_grid(origin: datetime, value: datetime, step: timedelta) -> datetime:
+    """First point of the grid origin + k*step (k >= 0) that is >= value."""
+    if value <= origin:
+        return origin
+    return origin - ((origin - value) // step) * step
+
+
+def compute_slots(
+    *,
+    rules: Sequence[AvailabilityRule],
+    busy: Iterable[Interval],
+    duration_minutes: int,
+    window_start: datetime,
+    window_end: datetime,
+    now: datetime,
+    full_days: Collection[date] = (),
+) -> list[datetime]:
+    """
+    Pure slot computation (no DB access).
+
+    A candidate start is bookable when:
+      - it lies on the rule's granularity grid inside one of its open windows,
+        and the meeting ends before the window closes
+      - it respects the rule's min_lead_time_minutes relative to `now`
+      - [start - buffer_before, end + buffer_after) does not intersect any busy interval
+      - its local calendar day is not in `full_days` (max_bookings_per_day reached)
+    """
+    duration = timedelta(minutes=duration_minutes)
+    busy = merge_intervals(busy)
+    busy_ends = [end for _, end in busy]
+    n_busy = len(busy)
+
+    found: set[datetime] = set()
+    for rule in rules:
+        step = timedelta(minutes=max(rule.slot_granularity_minutes, 1))
+        before = timedelta(minutes=rule.buffer_before_minutes)
+        after = timedelta(minutes=rule.buffer_after_minutes)
+        earliest = max(window_start, now + timedelta(minutes=rule.min_lead_time_minutes))
+
+        for open_start, open_end in expand_rule(rule, window_start, window_end):
+            last_start = min(open_end - duration, window_end - timedelta(microseconds=1))
+            candidate = _ceil_to_grid(open_start, earliest, step)
+            i = bisect_right(busy_ends, candidate - before)
+
+            while candidate <= last_start:
+                if full_days and BookingDayCounter.local_day(candidate) in full_days:
+                    candidate += step
+                    continue
+                lo = candidate - before
+                hi = candidate + duration + after
+                while i < n_busy and busy_ends[i] <= lo:
+                    i += 1
+                if i < n_busy and busy[i][0] < hi:
+                    # Jump straight past the blocking interval instead of stepping through it.
+                    candidate = _ceil_to_grid(open_start, busy[i][1] + before, step)
+                    continue
+                found.add(candidate)
+                candidate += step
+
+    return sorted(found)
+
+
+# Expanded recurring blackouts per (calendar generation, window); any committed calendar
+# write bumps the generation, so stale entries are never hit again and just age out.
+_RECURRING_MEMO: OrderedDict = OrderedDict()
+_RECURRING_MEMO_SIZE = 256
+_recurring_memo_lock = threading.Lock()
+
+
+def recurring_blackout_intervals(
+    window_start: datetime, window_end: datetime,
+) -> list[tuple[datetime, datetime, str, Optional[int]]]:
+    """
+    (start, end, reason, resource_id) occurrences of the active RecurringBlackouts inside the window, sorted.
+    Only the queried window is expanded, and each expansion is memoized per window.
+    """
+    key = (CalendarGeneration.current(), window_start, window_end)
+    with _recurring_memo_lock:
+        if key in _RECURRING_MEMO:
+            _RECURRING_MEMO.move_to_end(key)
+            return _RECURRING_MEMO[key]
+
+    occurrences = sorted(
+        (start, end, rule.reason or "", rule.resource_id)
+        for rule in RecurringBlackout.objects.filter(is_active=True, starts_on__lte=window_end.date())
+        .exclude(until__lt=window_start.date())
+        for start, end in rule.occurrences(window_start, window_end)
+    )
+    with _recurring_memo_lock:
+        _RECURRING_MEMO[key] = occurrences
+        while len(_RECURRING_MEMO) > _RECURRING_MEMO_SIZE:
+            _RECURRING_MEMO.popitem(last=False)
+    return occurrences
+
+
+def load_rules(resource_ids: Collection[int]) -> dict[int, list[AvailabilityRule]]:
+    """Active rules of the given resources, grouped by resource (resources without rules are left out)."""
+    rules: dict[int, list[AvailabilityRule]] = defaultdict(list)
+    for rule in AvailabilityRule.objects.filter(is_active=True, resource_id__in=resource_ids):
+        rules[rule.resource_id].append(rule)
+    return dict(rules)
+
+
+def load_busy_intervals(
+    resource_ids: Collection[int], window_start: datetime, window_end: datetime, now: Optional[datetime] = None,
+) -> dict[int, list[Interval]]:
+    """
+    Per resource: its own and the global blackouts (one-off + recurring), confirmed slots and
+    active holds overlapping the window. Two indexed range queries for all resources together.
+    """
+    busy: dict[int, list[Interval]] = {rid: [] for rid in resource_ids}
+    shared: list[Interval] = []
+    blackouts = (
+        BlackoutPeriod.objects.filter(Q(resource_id__in=resource_ids) | Q(resource__isnull=True))
+        .filter(start_at__lt=window_end, end_at__gt=window_start)
+        .values_list("resource_id", "start_at", "end_at")
+    )
+    for resource_id, start, end in blackouts:
+        (shared if resource_id is None else busy[resource_id]).append((start, end))
+    for start, end, _, resource_id in recurring_blackout_intervals(window_start, window_end):
+        if resource_id is None:
+            shared.append((start, end))
+        elif resource_id in busy:
+            busy[resource_id].append((start, end))
+
+    slots = (
+        BookingSlot.objects.active(now).filter(resource_id__in=resource_ids)
+        .overlapping(window_start, window_end)
+        .values_list("resource_id", "start_at", "end_at")
+    )
+    for resource_id, start, end in slots:
+        busy[resource_id].append((start, end))
+    for intervals in busy.values():
+        intervals.extend(shared)
+    return busy
+
+
+def available_slots(
+    service: ConsultingService,
+    window_start: datetime,
+    window_end: datetime,
+    duration_minutes: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> list[datetime]:
+    """
+    Ready-to-book start times for `service` in [window_start, window_end): the union over
+    the service's eligible resources. Callers are expected to have validated
+    `duration_minutes` against the service.
+    """
+    duration = duration_minutes or service.default_duration_minutes
+    now = now or timezone.now()
+    rules = load_rules([r.pk for r in service.eligible_resources()])
+    if not rules:
+        return []
+
+    # Buffers can reach outside the window, so widen the busy lookup accordingly.
+    pad = timedelta(minutes=max(
+        max(r.buffer_before_minutes, r.buffer_after_minutes) for own in rules.values() for r in own
+    ))
+    busy = load_busy_intervals(rules, window_start - pad, window_end + timedelta(minutes=duration) + pad, now=now)
+    full_days = load_full_days(rules, window_start, window_end)
+
+    found: set[datetime] = set()
+    for resource_id, own in rules.items():
+        found.update(compute_slots(
+            rules=own,
+            busy=busy[resource_id],
+            duration_minutes=duration,
+            window_start=window_start,
+            window_end=window_end,
+            now=now,
+            full_days=full_days.get(resource_id, ()),
+        ))
+    return sorted(found)
+
+
+def load_full_days(
+    rules: dict[int, Sequence[AvailabilityRule]], window_start: datetime, window_end: datetime,
+) -> dict[int, set[date]]:
+    """Per resource, the local days in the window whose max_bookings_per_day is reached (one range lookup)."""
+    caps = {rid: BookingDayCounter.caps_by_weekday(own) for rid, own in rules.items()}
+    caps = {rid: c for rid, c in caps.items() if c}
+    if not caps:
+        return {}
+    counters = BookingDayCounter.objects.filter(
+        resource_id__in=caps,
+        day__gte=BookingDayCounter.local_day(window_start),
+        day__lte=BookingDayCounter.local_day(window_end),
+    ).values_list("resource_id", "day", "booking_count")
+    full: dict[int, set[date]] = defaultdict(set)
+    for resource_id, day, count in counters:
+        cap = caps[resource_id].get(day.weekday())
+        if cap is not None and count >= cap:
+            full[resource_id].add(day)
+    return dict(full)
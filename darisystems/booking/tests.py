@@ -1,3 +1,445 @@
-from django.test import TestCase
+from datetime import time, timedelta
+from unittest import mock
+from zoneinfo import ZoneInfo
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from common.models import CacheGeneration
+
+from . import ics, next_slots, notifications, reports
+from .bulk import bulk_confirm
+from .catalog import catalog
+from .models import (
+    ArchivedBookingRequest,
+    ArchivedBookingSlot,
+    AvailabilityRule,
+    BlackoutPeriod,
+    BookingDayCounter,
+    BookingOutboxEvent,
+    BookingRequest,
+    BookingSlot,
+    BookingSlotStatus,
+    BookingStatus,
+    ConsultingService,
+    ConsultingServiceStatus,
+    MeetingMode,
+    OutboxStatus,
+    Resource,
+    ServiceAvailabilitySummary,
+)
+
+
+class BookingCalendarTestCase(TestCase):
+    """One published service, the default consultant and a fixed weekday a week ahead with a daily cap of 2."""
+
+    def setUp(self):
+        self.admin = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+        # Created by the migrations, so a fresh install can take bookings.
+        self.consultant = Resource.objects.get(slug="default")
+        self.service = ConsultingService.objects.create(
+            slug="audit", name="Audit", default_duration_minutes=60, status=ConsultingServiceStatus.PUBLISHED,
+        )
+        self.day = (timezone.now() + timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.add_rule(self.consultant)
+
+    def add_rule(self, resource, cap=2):
+        AvailabilityRule.objects.create(
+            resource=resource, timezone="UTC", day_of_week=self.day.weekday(),
+            start_time_local=time(8, 0), end_time_local=time(18, 0), max_bookings_per_day=cap,
+        )
+
+    def request(self, hour: int, minutes: int = 60) -> BookingRequest:
+        start = self.day + timedelta(hours=hour)
+        return BookingRequest.objects.create(
+            service=self.service, full_name="Requester", email=f"r{hour}@example.com",
+            duration_minutes=minutes, requested_start_at=start, requested_end_at=start + timedelta(minutes=minutes),
+            meeting_mode=MeetingMode.GOOGLE_MEET,
+        )
+
+    def expire_hold(self, br: BookingRequest):
+        BookingSlot.objects.filter(booking_request=br).update(hold_expires_at=timezone.now() - timedelta(minutes=1))
+
+    def count(self, resource=None) -> int:
+        resource = resource or self.consultant
+        counter = BookingDayCounter.objects.filter(resource=resource, day=self.day.date()).first()
+        return counter.booking_count if counter else 0
+
+    def assertCounterMatchesSlots(self):
+        """The day counters equal the number of active slots per resource."""
+        for resource in Resource.objects.all():
+            active = BookingSlot.objects.active().filter(
+                resource=resource, start_at__gte=self.day, start_at__lt=self.day + timedelta(days=1),
+            ).count()
+            self.assertEqual(self.count(resource), active, resource.slug)
+
+
+class OccupyCounterTests(BookingCalendarTestCase):
+    def test_hold_then_confirm_counts_once(self):
+        br = self.request(10)
+        br.hold()
+        br.confirm(approved_by=self.admin)
+        self.assertEqual(self.count(), 1)
+        self.assertCounterMatchesSlots()
+
+    def test_confirm_after_hold_expired_counts_once(self):
+        br = self.request(10)
+        br.hold()
+        self.expire_hold(br)
+        slot = br.confirm(approved_by=self.admin)
+        self.assertEqual(slot.status, BookingSlotStatus.CONFIRMED)
+        self.assertEqual(self.count(), 1)
+        self.assertCounterMatchesSlots()
+
+    def test_rehold_after_expiry_counts_once(self):
+        br = self.request(10)
+        br.hold()
+        self.expire_hold(br)
+        br.hold()
+        self.assertEqual(self.count(), 1)
+        self.assertCounterMatchesSlots()
+
+    def test_expired_hold_frees_the_time(self):
+        first, second = self.request(10), self.request(10)
+        first.hold()
+        with self.assertRaises(ValidationError):
+            second.hold()
+        self.expire_hold(first)
+        second.hold()
+        self.assertEqual(BookingSlot.objects.get(booking_request=first).status, BookingSlotStatus.RELEASED)
+        self.assertEqual(self.count(), 1)
+        self.assertCounterMatchesSlots()
+
+    def test_cancel_releases_the_count(self):
+        br = self.request(10)
+        br.confirm(approved_by=self.admin)
+        br.cancel(cancelled_by_admin=True, actor=self.admin)
+        self.assertEqual(self.count(), 0)
+        self.assertCounterMatchesSlots()
+
+    def test_max_bookings_per_day(self):
+        self.request(9).confirm(approved_by=self.admin)
+        self.request(11).confirm(approved_by=self.admin)
+        with self.assertRaisesMessage(ValidationError, "No more bookings are accepted on that day."):
+            self.request(13).confirm(approved_by=self.admin)
+        self.assertEqual(self.count(), 2)
+
+    def test_cap_still_enforced_after_expired_hold_is_confirmed(self):
+        br = self.request(9)
+        br.hold()
+        self.expire_hold(br)
+        br.confirm(approved_by=self.admin)
+        self.request(11).confirm(approved_by=self.admin)
+        with self.assertRaises(ValidationError):
+            self.request(13).confirm(approved_by=self.admin)
+        self.assertCounterMatchesSlots()
+
+
+class ResourceAssignmentTests(BookingCalendarTestCase):
+    def test_overlapping_bookings_go_to_free_resources(self):
+        bob = Resource.objects.create(slug="bob", name="Bob", priority=1)
+        self.add_rule(bob)
+        first, second = self.request(10).confirm(approved_by=self.admin), self.request(10).confirm(approved_by=self.admin)
+        self.assertEqual({first.resource, second.resource}, {self.consultant, bob})
+        with self.assertRaisesMessage(ValidationError, "overlaps"):
+            self.request(10).confirm(approved_by=self.admin)
+        self.assertCounterMatchesSlots()
+
+    def test_held_request_keeps_its_resource(self):
+        bob = Resource.objects.create(slug="bob", name="Bob", priority=1)
+        self.add_rule(bob)
+        br = self.request(10)
+        held = br.hold()
+        self.assertEqual(br.confirm(approved_by=self.admin).resource, held.resource)
+        self.assertCounterMatchesSlots()
+
+
+class BulkConfirmCounterTests(BookingCalendarTestCase):
+    def test_bulk_confirm_after_hold_expired_counts_once(self):
+        br = self.request(10)
+        br.hold()
+        self.expire_hold(br)
+        [result] = bulk_confirm([br.public_id], approved_by=self.admin)
+        self.assertTrue(result["ok"], result)
+        self.assertEqual(BookingSlot.objects.get(booking_request=br).status, BookingSlotStatus.CONFIRMED)
+        self.assertEqual(self.count(), 1)
+        self.assertCounterMatchesSlots()
+
+    def test_bulk_confirm_of_live_hold_counts_once(self):
+        br = self.request(10)
+        br.hold()
+        [result] = bulk_confirm([br.public_id], approved_by=self.admin)
+        self.assertTrue(result["ok"], result)
+        self.assertEqual(self.count(), 1)
+        self.assertCounterMatchesSlots()
+
+    def test_bulk_confirm_respects_max_bookings_per_day(self):
+        requests = [self.request(9), self.request(11), self.request(13)]
+        results = bulk_confirm([br.public_id for br in requests], approved_by=self.admin)
+        self.assertEqual([r["ok"] for r in results], [True, True, False])
+        self.assertEqual(results[2]["detail"], "No more bookings are accepted on that day.")
+        self.assertEqual(self.count(), 2)
+        self.assertEqual(BookingRequest.objects.filter(status=BookingStatus.CONFIRMED).count(), 2)
+
+    def test_bulk_confirm_rejects_overlap_within_batch(self):
+        first, second = self.request(10), self.request(10, minutes=30)
+        results = bulk_confirm([first.public_id, second.public_id], approved_by=self.admin)
+        self.assertEqual([r["ok"] for r in results], [True, False])
+        self.assertCounterMatchesSlots()
+
+
+class BookingRequestCreateTests(BookingCalendarTestCase):
+    def setUp(self):
+        super().setUp()
+        catalog.invalidate()
+        self.client = APIClient()
+
+    def payload(self, hour: int = 10) -> dict:
+        return {
+            "service": "audit", "full_name": "Requester", "email": "requester@example.com",
+            "duration_minutes": 60, "meeting_mode": MeetingMode.GOOGLE_MEET,
+            "requested_start_at": (self.day + timedelta(hours=hour)).isoformat(),
+        }
+
+    def test_create_with_idempotency_key(self):
+        first = self.client.post("/api/v1/booking/requests/", self.payload(), format="json", HTTP_IDEMPOTENCY_KEY="k1")
+        self.assertEqual(first.status_code, 201, first.content)
+        again = self.client.post("/api/v1/booking/requests/", self.payload(), format="json", HTTP_IDEMPOTENCY_KEY="k1")
+        self.assertEqual(again.status_code, 201)
+        self.assertEqual(again["Idempotent-Replayed"], "true")
+        self.assertEqual(again.json()["public_id"], first.json()["public_id"])
+        self.assertEqual(BookingRequest.objects.count(), 1)
+        self.assertCounterMatchesSlots()
+
+    def test_create_rechecks_a_service_withdrawn_elsewhere(self):
+        self.assertIsNotNone(catalog.get("audit"))
+        # Archived by another worker: this process's snapshot still lists the service.
+        ConsultingService.objects.filter(pk=self.service.pk).update(status=ConsultingServiceStatus.ARCHIVED)
+        response = self.client.post("/api/v1/booking/requests/", self.payload(), format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("service", response.json())
+        self.assertFalse(BookingRequest.objects.exists())
+
+    @override_settings(CACHE_GENERATION_CHECK_SECONDS=0)
+    def test_catalog_follows_the_shared_generation(self):
+        self.assertIsNotNone(catalog.get("audit"))
+        ConsultingService.objects.filter(pk=self.service.pk).update(status=ConsultingServiceStatus.ARCHIVED)
+        self.assertIsNotNone(catalog.get("audit"))
+        CacheGeneration.bump("booking.catalog")
+        self.assertIsNone(catalog.get("audit"))
+
+    def test_service_edits_bump_the_generation(self):
+        before = CacheGeneration.current("booking.catalog")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.status = ConsultingServiceStatus.ARCHIVED
+            self.service.save()
+        self.assertEqual(CacheGeneration.current("booking.catalog"), before + 1)
+        self.assertIsNone(catalog.get("audit"))
+
+
+class CapacityReportTests(BookingCalendarTestCase):
+    def totals(self, now=None) -> dict:
+        return reports.build_capacity_report(now)["totals"]
+
+    def test_totals(self):
+        now = timezone.now()
+        today = now.date()
+        weekdays = sum(
+            (today + timedelta(days=i)).weekday() == self.day.weekday()
+            for i in range(reports._setting("BOOKING_REPORT_AHEAD_DAYS", 92))
+        )
+        self.request(10).confirm(approved_by=self.admin)
+        self.request(13, minutes=30).hold()  # a hold is not a booking
+        BlackoutPeriod.objects.create(
+            resource=self.consultant, start_at=self.day + timedelta(hours=16), end_at=self.day + timedelta(hours=18),
+        )
+        upcoming = self.totals(now)["upcoming"]
+        self.assertEqual(upcoming["available_minutes"], weekdays * 600 - 120)
+        self.assertEqual(upcoming["booked_minutes"], 60)
+
+    def test_completed_and_archived_bookings_stay_booked(self):
+        start = timezone.now().replace(microsecond=0) - timedelta(days=3)
+        br = BookingRequest.objects.create(
+            service=self.service, full_name="Past", email="past@example.com", duration_minutes=60,
+            requested_start_at=start, requested_end_at=start + timedelta(minutes=60),
+            meeting_mode=MeetingMode.GOOGLE_MEET,
+        )
+        br.confirm(approved_by=self.admin)
+        self.assertEqual(self.totals()["past"]["booked_minutes"], 60)
+
+        self.assertEqual(BookingRequest.sweep_lifecycle()["completed"], 1)
+        self.assertEqual(BookingSlot.objects.get(booking_request=br).status, BookingSlotStatus.RELEASED)
+        self.assertEqual(self.totals()["past"]["booked_minutes"], 60)
+
+        moved = ArchivedBookingRequest.archive_closed(older_than_days=0, now=timezone.now() + timedelta(seconds=1))
+        self.assertEqual(moved, 1)
+        self.assertFalse(BookingRequest.objects.exists())
+        self.assertEqual(self.totals()["past"]["booked_minutes"], 60)
+
+
+class BusyImportTests(BookingCalendarTestCase):
+    def ics(self, *events) -> list[str]:
+        """A calendar of (uid, start hour, hours) events on the test day."""
+        lines = ["BEGIN:VCALENDAR"]
+        for uid, hour, hours in events:
+            start = self.day + timedelta(hours=hour)
+            lines += [
+                "BEGIN:VEVENT", f"UID:{uid}",
+                f"DTSTART:{ics.format_dt(start)}", f"DTEND:{ics.format_dt(start + timedelta(hours=hours))}",
+                "END:VEVENT",
+            ]
+        return lines + ["END:VCALENDAR"]
+
+    def import_busy(self, lines, resource=None, prune=False) -> dict:
+        return BlackoutPeriod.import_busy(ics.busy_ranges(lines, ZoneInfo("UTC")), resource=resource, prune=prune)
+
+    def test_reimport_updates_moved_events_and_prunes_removed_ones(self):
+        manual = BlackoutPeriod.objects.create(
+            resource=self.consultant, start_at=self.day, end_at=self.day + timedelta(hours=1), reason="Dentist",
+        )
+        first = self.import_busy(self.ics(("a", 9, 1), ("b", 12, 1), ("a", 15, 1)), resource=self.consultant)
+        self.assertEqual((first["created"], first["duplicates"]), (2, 1))
+
+        again = self.import_busy(self.ics(("a", 10, 2)), resource=self.consultant, prune=True)
+        self.assertEqual(again, {"created": 0, "updated": 1, "unchanged": 0, "duplicates": 0, "deleted": 1})
+        moved = BlackoutPeriod.objects.get(external_uid="a")
+        self.assertEqual((moved.start_at, moved.end_at), (self.day + timedelta(hours=10), self.day + timedelta(hours=12)))
+        # Rows added by hand have no UID and survive the prune.
+        self.assertEqual(set(BlackoutPeriod.objects.all()), {manual, moved})
+
+    def test_prune_only_touches_the_imported_resource(self):
+        bob = Resource.objects.create(slug="bob", name="Bob", priority=1)
+        self.import_busy(self.ics(("a", 9, 1)), resource=self.consultant)
+        self.import_busy(self.ics(("b", 9, 1)), resource=bob)
+        self.assertEqual(self.import_busy(self.ics(), resource=bob, prune=True)["deleted"], 1)
+        self.assertEqual(list(BlackoutPeriod.objects.values_list("external_uid", flat=True)), ["a"])
+
+    def test_shared_invite_blocks_each_resource(self):
+        bob = Resource.objects.create(slug="bob", name="Bob", priority=1)
+        self.add_rule(bob)
+        invite = self.ics(("meeting@example.com", 10, 1))
+        self.assertEqual(self.import_busy(invite, resource=self.consultant)["created"], 1)
+        self.assertEqual(self.import_busy(invite, resource=bob)["created"], 1)
+        # Re-imports leave each consultant's copy where it is.
+        self.assertEqual(self.import_busy(invite, resource=self.consultant)["unchanged"], 1)
+        self.assertEqual(
+            sorted(BlackoutPeriod.objects.values_list("resource__slug", flat=True)), ["bob", "default"],
+        )
+        # Only a consultant outside the meeting is clear at that time.
+        carol = Resource.objects.create(slug="carol", name="Carol", priority=2)
+        self.add_rule(carol)
+        self.assertEqual(self.request(10).confirm(approved_by=self.admin).resource, carol)
+
+
+class NextSlotsTests(BookingCalendarTestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            super().setUp()
+        # A day before the test day, so the first listed start is on that day.
+        self.now = self.day - timedelta(days=1)
+        next_slots.refresh(now=self.now)
+
+    def summary(self) -> ServiceAvailabilitySummary:
+        return ServiceAvailabilitySummary.objects.get(service=self.service)
+
+    def test_writes_flag_summaries_and_the_refresh_recomputes_them(self):
+        before = self.summary().next_starts["60"]
+        self.assertEqual(before[0], (self.day + timedelta(hours=8)).isoformat())
+        with self.captureOnCommitCallbacks(execute=True):
+            self.request(8).confirm(approved_by=self.admin)
+        # The write only flagged the summary.
+        summary = self.summary()
+        self.assertTrue(summary.stale)
+        self.assertEqual(summary.next_starts["60"], before)
+
+        self.assertEqual(next_slots.refresh(now=self.now, stale_only=True), 1)
+        summary = self.summary()
+        self.assertFalse(summary.stale)
+        self.assertNotIn(before[0], summary.next_starts["60"])
+        self.assertEqual(next_slots.refresh(now=self.now, stale_only=True), 0)
+
+    def test_changes_past_the_listed_starts_are_not_flagged(self):
+        far = self.day + timedelta(days=14)
+        with self.captureOnCommitCallbacks(execute=True):
+            BlackoutPeriod.objects.create(resource=self.consultant, start_at=far, end_at=far + timedelta(hours=2))
+        self.assertFalse(self.summary().stale)
+
+
+class OutboxDispatchTests(BookingCalendarTestCase):
+    def setUp(self):
+        super().setUp()
+        self.booking = self.request(10)
+        self.booking.confirm(approved_by=self.admin)
+        self.booking.cancel(cancelled_by_admin=True, actor=self.admin)
+
+    def events(self) -> list[BookingOutboxEvent]:
+        return list(BookingOutboxEvent.objects.order_by("pk"))
+
+    def test_drain_sends_a_bookings_events_in_order(self):
+        self.assertEqual(notifications.drain(), {"sent": 2, "retried": 0, "failed": 0})
+        self.assertEqual(
+            [m.subject for m in mail.outbox],
+            ["Your Audit booking is confirmed", "Your Audit booking was cancelled"],
+        )
+        self.assertEqual({e.status for e in self.events()}, {OutboxStatus.SENT})
+        self.assertEqual(notifications.drain(), {"sent": 0, "retried": 0, "failed": 0})
+
+    def test_failed_send_is_retried_after_backoff(self):
+        with mock.patch("booking.notifications.get_connection", side_effect=OSError("connection refused")):
+            # The cancellation waits behind the confirmation it follows.
+            self.assertEqual(notifications.drain(), {"sent": 0, "retried": 1, "failed": 0})
+        first, second = self.events()
+        self.assertEqual((first.attempts, first.status), (1, OutboxStatus.PENDING))
+        self.assertIn("connection refused", first.last_error)
+        self.assertEqual(second.attempts, 0)
+        self.assertGreater(first.next_attempt_at, timezone.now())
+        self.assertEqual(notifications.drain()["sent"], 0)
+
+        BookingOutboxEvent.objects.filter(pk=first.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(notifications.drain()["sent"], 2)
+        self.assertEqual(len(mail.outbox), 2)
+
+    @override_settings(BOOKING_OUTBOX_MAX_ATTEMPTS=1)
+    def test_gives_up_after_max_attempts(self):
+        with mock.patch("booking.notifications.get_connection", side_effect=OSError("connection refused")):
+            # A failed event no longer holds back the next one of its booking.
+            self.assertEqual(notifications.drain(), {"sent": 0, "retried": 0, "failed": 2})
+        self.assertEqual({e.status for e in self.events()}, {OutboxStatus.FAILED})
+        self.assertEqual(notifications.drain(), {"sent": 0, "retried": 0, "failed": 0})
+        self.assertEqual(mail.outbox, [])
+
+
+class ArchiveTests(BookingCalendarTestCase):
+    def test_moves_old_closed_bookings_with_their_slots(self):
+        declined = self.request(9)
+        declined.hold()
+        declined.decline(actor=self.admin)
+        cancelled = self.request(11)
+        cancelled.confirm(approved_by=self.admin)
+        cancelled.cancel(cancelled_by_admin=True, actor=self.admin)
+        live = self.request(14)
+        live.confirm(approved_by=self.admin)
+        recent = self.request(16)
+        recent.decline(actor=self.admin)
+        BookingRequest.objects.exclude(pk=recent.pk).update(updated_at=timezone.now() - timedelta(days=200))
+
+        self.assertEqual(ArchivedBookingRequest.archive_closed(older_than_days=180, chunk_size=1), 2)
+        self.assertEqual(
+            set(BookingRequest.objects.values_list("public_id", flat=True)), {live.public_id, recent.public_id},
+        )
+        archived = ArchivedBookingRequest.objects.select_related("slot").get(public_id=cancelled.public_id)
+        self.assertEqual(archived.status, BookingStatus.CANCELLED_BY_ADMIN)
+        self.assertEqual(archived.slot.start_at, self.day + timedelta(hours=11))
+        self.assertEqual(ArchivedBookingSlot.objects.count(), 2)
+        self.assertFalse(BookingSlot.objects.filter(booking_request__in=[declined.pk, cancelled.pk]).exists())
+        self.assertCounterMatchesSlots()
+        self.assertEqual(ArchivedBookingRequest.archive_closed(older_than_days=180), 0)
+
+        self.client.force_login(self.admin)
+        response = self.client.get(f"/api/v1/booking/admin/archived-requests/{cancelled.public_id}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["resource"], "default")
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
@@ -5,10 +6,21 @@ from .views import (
     ServiceViewSet,
     BookingRequestCreateView,
     BookingRequestPublicDetailView,
+    BookingRequestHoldView,
     BookingRequestAdminViewSet,
+    ArchivedBookingRequestAdminViewSet,
+    ResourceAdminViewSet,
     AvailabilityRuleAdminViewSet,
     BlackoutPeriodAdminViewSet,
+    RecurringBlackoutAdminViewSet,
     AvailabilityPublicView,
+    CapacityReportView,
+    ConfirmedBookingsFeedView,
+    BlackoutsFeedView,
+    ServiceListAsyncView,
+    ServiceDetailAsyncView,
+    BookingRequestPublicDetailAsyncView,
+    AvailabilityPublicAsyncView,
 )
 
 router = DefaultRouter()
@@ -17,15 +29,33 @@ router.register(r"services", ServiceViewSet, basename="booking-services")
 
 # admin routers
 router.register(r"admin/requests", BookingRequestAdminViewSet, basename="booking-admin-requests")
+router.register(r"admin/archived-requests", ArchivedBookingRequestAdminViewSet, basename="booking-admin-archived-requests")
+router.register(r"admin/resources", ResourceAdminViewSet, basename="booking-admin-resources")
 router.register(r"admin/availability-rules", AvailabilityRuleAdminViewSet, basename="booking-admin-availability")
 router.register(r"admin/blackouts", BlackoutPeriodAdminViewSet, basename="booking-admin-blackouts")
+router.register(r"admin/recurring-blackouts", RecurringBlackoutAdminViewSet, basename="booking-admin-recurring-blackouts")
 
 urlpatterns = [
     # public booking requests
     path("requests/", BookingRequestCreateView.as_view(), name="booking-request-create"),
     path("requests/<str:public_id>/", BookingRequestPublicDetailView.as_view(), name="booking-request-public"),
+    path("requests/<str:public_id>/hold/", BookingRequestHoldView.as_view(), name="booking-request-hold"),
     # public availability
     path("availability/", AvailabilityPublicView.as_view(), name="booking-availability"),
+    # reports (admin)
+    path("admin/reports/capacity/", CapacityReportView.as_view(), name="booking-admin-capacity-report"),
+    # calendar subscriptions (admin)
+    path("feeds/bookings.ics", ConfirmedBookingsFeedView.as_view(), name="booking-feed-bookings"),
+    path("feeds/blackouts.ics", BlackoutsFeedView.as_view(), name="booking-feed-blackouts"),
 ]
 
 urlpatterns += router.urls
+
+if settings.ASYNC_PUBLIC_VIEWS:
+    # Under ASGI the hot public reads run natively async; they delegate everything else to the views above.
+    urlpatterns = [
+        path("services/", ServiceListAsyncView.as_view(), name="booking-services-list-async"),
+        path("services/<slug:slug>/", ServiceDetailAsyncView.as_view(), name="booking-services-detail-async"),
+        path("requests/<str:public_id>/", BookingRequestPublicDetailAsyncView.as_view(), name="booking-request-public-async"),
+        path("availability/", AvailabilityPublicAsyncView.as_view(), name="booking-availability-async"),
+    ] + urlpatterns
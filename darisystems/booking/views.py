@@ -1,43 +1,70 @@
 from django.shortcuts import render
 
 # Create your views here.
+import csv
+import io
+from abc import ABCMeta, abstractmethod
 from datetime import datetime, timedelta
 from django.utils import timezone as dj_tz
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
+from django.http import StreamingHttpResponse
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.generics import GenericAPIView
 from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import AllowAny
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
 from rest_framework.filters import OrderingFilter, SearchFilter
 from django_filters.rest_framework import DjangoFilterBackend
 
 from .models import (
     ConsultingService, ConsultingServiceStatus,
     BookingRequest, BookingStatus,
-    AvailabilityRule, BlackoutPeriod,
+    BookingSlot, BookingSlotStatus,
+    AvailabilityRule, BlackoutPeriod, RecurringBlackout,
+    ArchivedBookingRequest,
+    Resource,
+    calendar_timezone,
 )
 from .serializers import (
     ConsultingServiceReadSerializer, ConsultingServiceWriteSerializer,
     BookingRequestCreateSerializer, BookingRequestPublicSerializer, BookingRequestAdminSerializer,
-    BookingConfirmSerializer,
-    AvailabilityRuleSerializer, BlackoutPeriodSerializer,
+    BookingConfirmSerializer, BookingBulkActionSerializer,
+    AvailabilityRuleSerializer, BlackoutPeriodSerializer, BlackoutImportSerializer, RecurringBlackoutSerializer,
+    ArchivedBookingRequestSerializer,
+    ResourceSerializer,
 )
 from .permissions import IsAdminUser, IsAdminOrReadOnly
-from .filters import ConsultingServiceFilter, BookingRequestFilter
+from .filters import ConsultingServiceFilter, BookingRequestFilter, ArchivedBookingRequestFilter
+from .slots import available_slots, recurring_blackout_intervals
+from .cache import cached_availability, acached_availability
+from .catalog import catalog, passed_starts, validators as catalog_validators
+from .bulk import bulk_confirm, bulk_decline, bulk_cancel
+from . import ics, reports
+from common.idempotency import idempotent
+from common.throttling import PUBLIC_WRITE_THROTTLES
+from common.async_views import AsyncPublicListView, AsyncReadView, json_response
+from common.conditional import ConditionalGetMixin, queryset_validators, not_modified, representation, set_validators
+
+MAX_AVAILABILITY_DAYS = 92
 
 
 # ----------------------------
 # Services
 # ----------------------------
-class ServiceViewSet(ModelViewSet):
+class ServiceViewSet(ConditionalGetMixin, ModelViewSet):
     """
     Public: GET list/retrieve shows only PUBLISHED.
     Admin: full CRUD.
     """
     permission_classes = [IsAdminOrReadOnly]
     lookup_field = "slug"
+    # Next-slot summaries are part of the representation (resource changes bump updated_at, see booking.signals).
+    conditional_fields = ("updated_at", "availability_summary__computed_at")
 
     filter_backends = [DjangoFilterBackend, OrderingFilter, SearchFilter]
     filterset_class = ConsultingServiceFilter
@@ -45,7 +72,7 @@ class ServiceViewSet(ModelViewSet):
     search_fields = ["name", "description"]
 
     def get_queryset(self):
-        qs = ConsultingService.objects.all()
+        qs = ConsultingService.objects.select_related("availability_summary").prefetch_related("resources")
         if not (self.request.user and self.request.user.is_staff):
             qs = qs.filter(status=ConsultingServiceStatus.PUBLISHED)
         return qs.order_by("name")
@@ -55,6 +82,48 @@ class ServiceViewSet(ModelViewSet):
             return ConsultingServiceWriteSerializer
         return ConsultingServiceReadSerializer
 
+    # Plain public reads (no filter/search/ordering params) are served from the in-process catalog.
+    CATALOG_PARAMS = {"page", "format"}
+
+    def _use_catalog(self, request) -> bool:
+        if request.user and request.user.is_staff:
+            return False
+        return set(request.query_params) <= self.CATALOG_PARAMS
+
+    def get_validators(self, request, queryset):
+        extra = representation(request, bool(request.user and request.user.is_staff), request.accepted_media_type)
+        if not self._use_catalog(request):
+            # Passed starts disappear from the summaries at serialization time, without a write.
+            return queryset_validators(queryset, self.conditional_fields, passed_starts(catalog.services()), *extra)
+        # Validate what is served: this process's catalog snapshot, no query.
+        if self.action == "retrieve":
+            entry = catalog.get(self.kwargs[self.lookup_field])
+            return catalog_validators([entry.service] if entry else [], *extra)
+        return catalog_validators(catalog.services(), *extra)
+
+    def list(self, request, *args, **kwargs):
+        if not self._use_catalog(request):
+            return super().list(request, *args, **kwargs)
+        return self._conditional(request, None, lambda: self._catalog_list(request))
+
+    def _catalog_list(self, request):
+        services = catalog.services()
+        page = self.paginate_queryset(services)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        return Response(self.get_serializer(services, many=True).data)
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self._use_catalog(request):
+            return super().retrieve(request, *args, **kwargs)
+        return self._conditional(request, None, lambda: self._catalog_retrieve(kwargs[self.lookup_field]))
+
+    def _catalog_retrieve(self, slug):
+        entry = catalog.get(slug)
+        if entry is None:
+            raise NotFound()
+        return Response(self.get_serializer(entry.service).data)
+
 
 # ----------------------------
 # Public booking requests
@@ -62,11 +131,20 @@ class ServiceViewSet(ModelViewSet):
 class BookingRequestCreateView(GenericAPIView):
     permission_classes = [AllowAny]
     serializer_class = BookingRequestCreateSerializer
+    throttle_classes = PUBLIC_WRITE_THROTTLES
+    throttle_scope = "booking_request"
 
+    @idempotent
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        br = serializer.save()
+        try:
+            with transaction.atomic():
+                br = serializer.save()
+                # Hold the time right away so a second visitor cannot check out the same slot.
+                br.hold()
+        except DjangoValidationError as e:
+            return Response({"detail": e.messages[0]}, status=status.HTTP_409_CONFLICT)
         return Response(BookingRequestPublicSerializer(br).data, status=status.HTTP_201_CREATED)
 
 
@@ -74,7 +152,7 @@ class BookingRequestPublicDetailView(GenericAPIView):
     permission_classes = [AllowAny]
 
     def get(self, request, public_id: str):
-        br = BookingRequest.objects.filter(public_id=public_id).select_related("service").first()
+        br = BookingRequest.objects.filter(public_id=public_id).select_related("service", "slot").first()
         if not br:
             return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
         return Response(BookingRequestPublicSerializer(br).data, status=status.HTTP_200_OK)
@@ -91,11 +169,32 @@ class BookingRequestPublicDetailView(GenericAPIView):
         return Response(BookingRequestPublicSerializer(br).data, status=status.HTTP_200_OK)
 
 
+class BookingRequestHoldView(GenericAPIView):
+    """
+    POST /api/v1/booking/requests/<public_id>/hold/
+    Refresh the temporary hold on the requested time while the requester is checking out.
+    """
+    permission_classes = [AllowAny]
+
+    def post(self, request, public_id: str):
+        br = BookingRequest.objects.filter(public_id=public_id).first()
+        if not br:
+            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        try:
+            slot = br.hold()
+        except DjangoValidationError as e:
+            return Response({"detail": e.messages[0]}, status=status.HTTP_409_CONFLICT)
+        return Response(
+            {"public_id": br.public_id, "hold_expires_at": slot.hold_expires_at},
+            status=status.HTTP_200_OK,
+        )
+
+
 # ----------------------------
 # Admin booking requests
 # ----------------------------
 class BookingRequestAdminViewSet(ReadOnlyModelViewSet):
-    queryset = BookingRequest.objects.all().select_related("service").order_by("-created_at")
+    queryset = BookingRequest.objects.all().select_related("service", "slot__resource").order_by("-created_at")
     serializer_class = BookingRequestAdminSerializer
     permission_classes = [IsAdminUser]
     lookup_field = "public_id"
@@ -123,13 +222,12 @@ class BookingRequestAdminViewSet(ReadOnlyModelViewSet):
     @action(detail=True, methods=["patch"], url_path="decline")
     def decline(self, request, public_id=None):
         br = self.get_object()
-        if br.status != BookingStatus.REQUESTED:
-            return Response({"detail": f"Cannot decline from {br.status}."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            br.decline(actor=request.user)
+        except DjangoValidationError as e:
+            return Response({"detail": e.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
 
-        br.status = BookingStatus.DECLINED
-        br.handled_by = request.user
-        br.handled_at = dj_tz.now()
-        br.save()
+        br.refresh_from_db()
         return Response(BookingRequestAdminSerializer(br).data, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=["patch"], url_path="cancel")
@@ -139,28 +237,269 @@ class BookingRequestAdminViewSet(ReadOnlyModelViewSet):
         br.refresh_from_db()
         return Response(BookingRequestAdminSerializer(br).data, status=status.HTTP_200_OK)
 
+    # Batch variants: {"public_ids": [...]} -> per-item results, one transaction per call.
+    def _bulk(self, request, run):
+        ser = BookingBulkActionSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        results = run(ser.validated_data)
+        succeeded = sum(1 for r in results if r["ok"])
+        return Response(
+            {"succeeded": succeeded, "failed": len(results) - succeeded, "results": results},
+            status=status.HTTP_200_OK,
+        )
+
+    @action(detail=False, methods=["patch"], url_path="bulk-confirm")
+    def bulk_confirm(self, request):
+        return self._bulk(request, lambda data: bulk_confirm(
+            data["public_ids"], approved_by=request.user, meeting_url=data.get("meeting_url") or None,
+        ))
+
+    @action(detail=False, methods=["patch"], url_path="bulk-decline")
+    def bulk_decline(self, request):
+        return self._bulk(request, lambda data: bulk_decline(data["public_ids"], actor=request.user))
+
+    @action(detail=False, methods=["patch"], url_path="bulk-cancel")
+    def bulk_cancel(self, request):
+        return self._bulk(request, lambda data: bulk_cancel(data["public_ids"], actor=request.user))
+
 
 # ----------------------------
-# Availability & blackouts (admin CRUD)
+# Archived bookings (admin history)
 # ----------------------------
+class ArchivedBookingRequestAdminViewSet(ReadOnlyModelViewSet):
+    """
+    Booking history: closed requests moved out of the hot table by archive_bookings.
+    Same filters and search as the live admin list.
+    """
+    queryset = ArchivedBookingRequest.objects.all().select_related("service", "slot__resource").order_by("-created_at")
+    serializer_class = ArchivedBookingRequestSerializer
+    permission_classes = [IsAdminUser]
+    lookup_field = "public_id"
+
+    filter_backends = [DjangoFilterBackend, OrderingFilter, SearchFilter]
+    filterset_class = ArchivedBookingRequestFilter
+    ordering_fields = ["created_at", "requested_start_at", "status", "archived_at"]
+    search_fields = ["full_name", "email", "company", "role", "problem_statement", "admin_notes"]
+
+
+# ----------------------------
+# Resources, availability & blackouts (admin CRUD)
+# ----------------------------
+class ResourceAdminViewSet(ModelViewSet):
+    queryset = Resource.objects.all().order_by("priority", "id")
+    serializer_class = ResourceSerializer
+    permission_classes = [IsAdminUser]
+    lookup_field = "slug"
+
+
 class AvailabilityRuleAdminViewSet(ModelViewSet):
-    queryset = AvailabilityRule.objects.all().order_by("day_of_week", "start_time_local")
+    queryset = AvailabilityRule.objects.select_related("resource").order_by("resource__priority", "day_of_week", "start_time_local")
     serializer_class = AvailabilityRuleSerializer
     permission_classes = [IsAdminUser]
 
 
 class BlackoutPeriodAdminViewSet(ModelViewSet):
-    queryset = BlackoutPeriod.objects.all().order_by("-start_at")
+    queryset = BlackoutPeriod.objects.select_related("resource").order_by("-start_at")
     serializer_class = BlackoutPeriodSerializer
     permission_classes = [IsAdminUser]
 
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
+    @action(detail=False, methods=["post"], url_path="import", parser_classes=[MultiPartParser])
+    def import_ics(self, request):
+        """Multipart upload of an .ics file; busy events are upserted by UID (see BlackoutPeriod.import_busy)."""
+        ser = BlackoutImportSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        data = ser.validated_data
+        stats = {}
+        result = BlackoutPeriod.import_busy(
+            ics.busy_ranges(data["file"], data.get("timezone") or calendar_timezone(), stats),
+            reason=data["reason"], prune=data["prune"], created_by=request.user, resource=data["resource"],
+        )
+        return Response({**result, "skipped": stats["skipped"]}, status=status.HTTP_200_OK)
+
+
+class RecurringBlackoutAdminViewSet(ModelViewSet):
+    queryset = RecurringBlackout.objects.select_related("resource").order_by("-is_active", "starts_on")
+    serializer_class = RecurringBlackoutSerializer
+    permission_classes = [IsAdminUser]
+
+    def perform_create(self, serializer):
+        serializer.save(created_by=self.request.user)
+
+
+# ----------------------------
+# Capacity report (admin)
+# ----------------------------
+class CapacityReportCSVRenderer(BaseRenderer):
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        out = io.StringIO()
+        writer = csv.writer(out)
+        if isinstance(data, dict) and "weeks" in data:
+            writer.writerows(reports.report_rows(data))
+        else:
+            # Errors (403, ...) as key/value rows.
+            writer.writerows((data or {}).items())
+        return out.getvalue()
+
+
+class CapacityReportView(GenericAPIView):
+    """
+    GET /api/v1/booking/admin/reports/capacity/[?format=csv][&refresh=1]
+    Booked vs available minutes per week, weekday and service over the past year and
+    the coming quarter, plus lead-time and cancellation distributions (booking.reports).
+    Served from cache; refresh=1 recomputes it.
+    """
+    permission_classes = [IsAdminUser]
+    renderer_classes = [JSONRenderer, BrowsableAPIRenderer, CapacityReportCSVRenderer]
+
+    def get(self, request, *args, **kwargs):
+        report = reports.capacity_report(refresh=request.query_params.get("refresh") in ("1", "true"))
+        response = Response(report, status=status.HTTP_200_OK)
+        if request.accepted_renderer.format == "csv":
+            response["Content-Disposition"] = 'attachment; filename="capacity-report.csv"'
+        return response
+
+
+# ----------------------------
+# iCalendar feeds (admin; calendar clients authenticate with Basic auth)
+# ----------------------------
+class CalendarFeedView(GenericAPIView, metaclass=ABCMeta):
+    """
+    Streams an ICS feed. ETag/Last-Modified come from MAX(updated_at) + COUNT(*) of the
+    feed's rows, so the frequent polls of calendar clients usually end in a 304.
+    """
+    permission_classes = [IsAdminUser]
+    calendar_name = ""
+    filename = ""
+
+    @abstractmethod
+    def get_feed_queryset(self):
+        """The rows behind the feed (for its validators)."""
+
+    @abstractmethod
+    def get_events(self):
+        """VEVENT property lists to stream, e.g. booking.ics.blackout_events()."""
+
+    def get(self, request):
+        etag, last_modified = queryset_validators(self.get_feed_queryset())
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            response = StreamingHttpResponse(
+                ics.calendar(self.calendar_name, self.get_events()),
+                content_type="text/calendar; charset=utf-8",
+            )
+            response["Content-Disposition"] = f'inline; filename="{self.filename}"'
+        response["Cache-Control"] = "private, no-cache"
+        return set_validators(response, etag, last_modified)
+
+
+class ConfirmedBookingsFeedView(CalendarFeedView):
+    calendar_name = "Confirmed bookings"
+    filename = "bookings.ics"
+
+    def get_feed_queryset(self):
+        return BookingRequest.objects.filter(status=BookingStatus.CONFIRMED)
+
+    def get_events(self):
+        return ics.confirmed_booking_events()
+
+
+class BlackoutsFeedView(CalendarFeedView):
+    calendar_name = "Blackouts"
+    filename = "blackouts.ics"
+
+    def get_feed_queryset(self):
+        return BlackoutPeriod.objects.all()
+
+    def get_events(self):
+        return ics.blackout_events()
+
 
 # ----------------------------
 # Public availability endpoint (optional but useful)
 # ----------------------------
+def parse_availability_window(params):
+    """(start_date, days) from the query params, or raise ValueError with the client-facing message."""
+    start_str = params.get("start")
+    if not start_str:
+        raise ValueError("start is required (YYYY-MM-DD).")
+    try:
+        start_date = datetime.strptime(start_str, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError("start must be YYYY-MM-DD.")
+    try:
+        days = int(params.get("days", "14"))
+    except ValueError:
+        raise ValueError("days must be an integer.")
+    if not 1 <= days <= MAX_AVAILABILITY_DAYS:
+        raise ValueError(f"days must be between 1 and {MAX_AVAILABILITY_DAYS}.")
+    return start_date, days
+
+
+def parse_availability_duration(entry, params) -> int:
+    """Requested duration for a catalog entry, or raise ValueError with the client-facing message."""
+    service = entry.service
+    try:
+        duration = int(params.get("duration") or service.default_duration_minutes)
+    except ValueError:
+        raise ValueError("duration must be an integer.")
+    if not entry.allows_duration(duration):
+        allowed = service.allowed_durations_minutes
+        raise ValueError(f"duration must be one of {allowed or [service.default_duration_minutes]}.")
+    return duration
+
+
+def availability_payload(start_dt, end_dt, service=None, duration=None) -> dict:
+    # Blackouts
+    blackouts = list(
+        BlackoutPeriod.objects.filter(start_at__lt=end_dt, end_at__gt=start_dt)
+        .values("start_at", "end_at", "reason")
+    )
+    recurring = recurring_blackout_intervals(start_dt, end_dt)
+    if recurring:
+        blackouts.extend({"start_at": s, "end_at": e, "reason": r} for s, e, r, _ in recurring)
+        blackouts.sort(key=lambda b: b["start_at"])
+
+    # Confirmed slots block time
+    slots = list(
+        BookingRequest.objects.filter(
+            status=BookingStatus.CONFIRMED,
+            requested_start_at__lt=end_dt,
+            requested_end_at__gt=start_dt,
+        ).values("requested_start_at", "requested_end_at")
+    )
+
+    # Active holds block time too (someone is checking out)
+    held = list(
+        BookingSlot.objects.active()
+        .filter(status=BookingSlotStatus.HELD)
+        .overlapping(start_dt, end_dt)
+        .values("start_at", "end_at", "hold_expires_at")
+    )
+
+    payload = {
+        "range": {"start": start_dt, "end": end_dt},
+        "blackouts": blackouts,
+        "confirmed": slots,
+        "held": held,
+    }
+    if service is not None:
+        payload["service"] = service.slug
+        payload["duration_minutes"] = duration
+        payload["slots"] = available_slots(service, start_dt, end_dt, duration_minutes=duration)
+    return payload
+
+
+def availability_window_key(start_date, days, service, duration) -> str:
+    return f"{start_date.isoformat()}:{days}:{service.slug if service else ''}:{duration or ''}"
+
+
 class AvailabilityPublicView(GenericAPIView):
     permission_classes = [AllowAny]
 
@@ -169,41 +508,105 @@ class AvailabilityPublicView(GenericAPIView):
         GET /api/v1/booking/availability/?start=2026-02-22&days=14
         Returns a simple list of blocked ranges (blackouts + confirmed slots)
         V1 lightweight (frontend can build UI).
-        """
-        start_str = request.query_params.get("start")
-        days = int(request.query_params.get("days", "14"))
-
-        if not start_str:
-            return Response({"detail": "start is required (YYYY-MM-DD)."}, status=status.HTTP_400_BAD_REQUEST)
 
+        With ?service=<slug>[&duration=<minutes>] the response also carries
+        "slots": ready-to-book start times computed from the availability rules.
+        """
         try:
-            start_date = datetime.strptime(start_str, "%Y-%m-%d").date()
-        except ValueError:
-            return Response({"detail": "start must be YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
+            start_date, days = parse_availability_window(request.query_params)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         start_dt = dj_tz.make_aware(datetime.combine(start_date, datetime.min.time()))
         end_dt = start_dt + timedelta(days=days)
 
-        # Blackouts
-        blackouts = list(
-            BlackoutPeriod.objects.filter(start_at__lt=end_dt, end_at__gt=start_dt)
-            .values("start_at", "end_at", "reason")
+        service = None
+        duration = None
+        service_slug = request.query_params.get("service")
+        if service_slug:
+            entry = catalog.get(service_slug)
+            if entry is None:
+                return Response({"detail": "Unknown service."}, status=status.HTTP_400_BAD_REQUEST)
+            service = entry.service
+            try:
+                duration = parse_availability_duration(entry, request.query_params)
+            except ValueError as e:
+                return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        payload = cached_availability(
+            availability_window_key(start_date, days, service, duration),
+            lambda: availability_payload(start_dt, end_dt, service, duration),
         )
+        return Response(payload, status=status.HTTP_200_OK)
 
-        # Confirmed slots block time
-        slots = list(
-            BookingRequest.objects.filter(
-                status=BookingStatus.CONFIRMED,
-                requested_start_at__lt=end_dt,
-                requested_end_at__gt=start_dt,
-            ).values("requested_start_at", "requested_end_at")
-        )
 
-        return Response(
-            {
-                "range": {"start": start_dt, "end": end_dt},
-                "blackouts": blackouts,
-                "confirmed": slots,
-            },
-            status=status.HTTP_200_OK,
+# ----------------------------
+# Async public reads (ASGI; see common.async_views)
+# ----------------------------
+class ServiceListAsyncView(AsyncPublicListView):
+    fallback = ServiceViewSet.as_view({"get": "list", "post": "create"})
+    serializer_class = ConsultingServiceReadSerializer
+
+    async def get_validators(self, request, *args, **kwargs):
+        return catalog_validators(await catalog.aservices(), *representation(request, False, "application/json"))
+
+    async def get_page(self, offset: int, limit: int):
+        services = await catalog.aservices()
+        return len(services), services[offset:offset + limit]
+
+
+class ServiceDetailAsyncView(AsyncReadView):
+    fallback = ServiceViewSet.as_view({"get": "retrieve", "put": "update", "patch": "partial_update", "delete": "destroy"})
+
+    async def get_validators(self, request, slug: str):
+        entry = await catalog.aget(slug)
+        return catalog_validators([entry.service] if entry else [], *representation(request, False, "application/json"))
+
+    async def get(self, request, slug: str):
+        entry = await catalog.aget(slug)
+        if entry is None:
+            return json_response({"detail": "Not found."}, status=404)
+        return json_response(ConsultingServiceReadSerializer(entry.service).data)
+
+
+class BookingRequestPublicDetailAsyncView(AsyncReadView):
+    fallback = BookingRequestPublicDetailView.as_view()
+
+    async def get(self, request, public_id: str):
+        br = await BookingRequest.objects.filter(public_id=public_id).select_related("service", "slot").afirst()
+        if not br:
+            return json_response({"detail": "Not found."}, status=404)
+        return json_response(BookingRequestPublicSerializer(br).data)
+
+
+class AvailabilityPublicAsyncView(AsyncReadView):
+    fallback = AvailabilityPublicView.as_view()
+    serve_params = frozenset({"start", "days", "service", "duration", "format"})
+
+    async def get(self, request):
+        try:
+            start_date, days = parse_availability_window(request.GET)
+        except ValueError as e:
+            return json_response({"detail": str(e)}, status=400)
+
+        start_dt = dj_tz.make_aware(datetime.combine(start_date, datetime.min.time()))
+        end_dt = start_dt + timedelta(days=days)
+
+        service = None
+        duration = None
+        service_slug = request.GET.get("service")
+        if service_slug:
+            entry = await catalog.aget(service_slug)
+            if entry is None:
+                return json_response({"detail": "Unknown service."}, status=400)
+            service = entry.service
+            try:
+                duration = parse_availability_duration(entry, request.GET)
+            except ValueError as e:
+                return json_response({"detail": str(e)}, status=400)
+
+        payload = await acached_availability(
+            availability_window_key(start_date, days, service, duration),
+            lambda: availability_payload(start_dt, end_dt, service, duration),
         )
+        return json_response(payload)
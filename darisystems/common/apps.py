@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CommonConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'common'
+
+    def ready(self):
+        from . import suggest
+        from .models import Tag
+
+        suggest.register(Tag, "tag", label="name", extra=["scope"])
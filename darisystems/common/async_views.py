@@ -0,0 +1,157 @@
+"""
+Native async variants of the hot public read endpoints (served under ASGI).
+
+Each view answers the plain anonymous JSON GET itself with the async ORM, so an
+ASGI worker never parks a thread on a slow client. Anything it does not handle
+(other methods, staff sessions, Basic auth, filters/search/ordering, the
+browsable API, unusual page values) is delegated to the existing sync DRF view,
+so behaviour stays identical to the WSGI deployment.
+
+The URLconfs only mount these views when settings.ASYNC_PUBLIC_VIEWS is set
+(asgi.py turns it on); under WSGI they would just add an async_to_sync hop.
+"""
+from __future__ import annotations
+
+from abc import ABCMeta, abstractmethod
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .conditional import aqueryset_validators, finish, not_modified, representation
+
+
+def json_response(data, status: int = 200) -> HttpResponse:
+    response = HttpResponse(JSONRenderer().render(data), status=status, content_type="application/json")
+    patch_vary_headers(response, ("Accept", "Cookie"))
+    return response
+
+
+class AsyncReadView(View, metaclass=ABCMeta):
+    """
+    Base class: subclasses implement `async def get()` and set `fallback` to the
+    sync DRF view callable (e.g. `PostViewSet.as_view({"get": "list", "post": "create"})`).
+    """
+    fallback = None
+    serve_params: frozenset = frozenset({"format"})
+    # Set to answer conditional GETs like the fallback's ConditionalGetMixin (see common.conditional).
+    conditional_fields = None
+    conditional_tag_scope = None
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        # Fail when the URLconf is loaded rather than on the first request.
+        if cls.__abstractmethods__:
+            raise ImproperlyConfigured(f"{cls.__name__} must implement {', '.join(sorted(cls.__abstractmethods__))}().")
+        if cls.fallback is None:
+            raise ImproperlyConfigured(f"{cls.__name__} must set fallback.")
+        # DRF views are CSRF-exempt (session auth enforces CSRF itself); keep that for delegated writes.
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method == "GET" and await self.can_serve(request):
+            validators = await self.get_validators(request, *args, **kwargs)
+            if validators is None:
+                return await self.get(request, *args, **kwargs)
+            etag, last_modified = validators
+            response = not_modified(request, etag, last_modified)
+            if response is None:
+                response = await self.get(request, *args, **kwargs)
+            return finish(response, etag, last_modified, private=settings.SESSION_COOKIE_NAME in request.COOKIES)
+        return await self.delegate(request, *args, **kwargs)
+
+    async def get_validators(self, request, *args, **kwargs):
+        """(etag, last_modified) for the response get() would produce, or None for no conditional handling."""
+        return None
+
+    async def delegate(self, request, *args, **kwargs):
+        # Read it off the class: through the instance the plain view function would be bound to self.
+        fallback = type(self).fallback
+        return await sync_to_async(fallback)(request, *args, **kwargs)
+
+    async def can_serve(self, request) -> bool:
+        if not set(request.GET) <= self.serve_params or request.GET.get("format", "json") != "json":
+            return False
+        if "HTTP_AUTHORIZATION" in request.META or "text/html" in request.headers.get("Accept", ""):
+            return False
+        if settings.SESSION_COOKIE_NAME in request.COOKIES:
+            # Staff see drafts through the DRF views; only pay for the session lookup when there is one.
+            user = await request.auser()
+            if user.is_staff:
+                return False
+        return True
+
+    @abstractmethod
+    async def get(self, request, *args, **kwargs):
+        ...
+
+
+class AsyncPublicListView(AsyncReadView):
+    """
+    Paginated list with the same payload as DRF's PageNumberPagination
+    ({"count", "next", "previous", "results"}). Subclasses set `serializer_class` and
+    implement get_queryset(), or override get_page() (and get_validators()) to serve
+    rows from elsewhere.
+    """
+    serializer_class = None
+    serve_params = frozenset({"page", "format"})
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        if cls.serializer_class is None:
+            raise ImproperlyConfigured(f"{cls.__name__} must set serializer_class.")
+        if not hasattr(cls, "get_queryset") and cls.get_page is AsyncPublicListView.get_page:
+            raise ImproperlyConfigured(f"{cls.__name__} must implement get_queryset() or override get_page().")
+        return super().as_view(**initkwargs)
+
+    async def get_validators(self, request, *args, **kwargs):
+        if self.conditional_fields is None:
+            return None
+        # Same parts as the DRF view's anonymous JSON response, so either can answer the other's ETag.
+        extra = representation(request, False, "application/json")
+        return await aqueryset_validators(
+            self.get_queryset(), self.conditional_fields, *extra, tag_scope=self.conditional_tag_scope,
+        )
+
+    async def get_page(self, offset: int, limit: int) -> tuple[int, list]:
+        """(total count, objects of the page) via the async ORM."""
+        qs = self.get_queryset()
+        count = await qs.acount()
+        if offset >= count:
+            return count, []
+        return count, [obj async for obj in qs[offset:offset + limit]]
+
+    async def get(self, request, *args, **kwargs):
+        raw_page = request.GET.get("page", "1")
+        if not raw_page.isdigit() or int(raw_page) < 1:
+            # "last", garbage, ...: let DRF produce its exact answer.
+            return await self.delegate(request, *args, **kwargs)
+
+        page, size = int(raw_page), api_settings.PAGE_SIZE
+        count, objects = await self.get_page((page - 1) * size, size)
+        if page > 1 and not objects:
+            return json_response({"detail": "Invalid page."}, status=404)
+
+        url = request.build_absolute_uri()
+        has_next = page * size < count
+        if page == 1:
+            previous = None
+        elif page == 2:
+            previous = remove_query_param(url, "page")
+        else:
+            previous = replace_query_param(url, "page", page - 1)
+
+        return json_response({
+            "count": count,
+            "next": replace_query_param(url, "page", page + 1) if has_next else None,
+            "previous": previous,
+            "results": self.serializer_class(objects, many=True, context={"request": request}).data,
+        })
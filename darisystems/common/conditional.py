@@ -0,0 +1,134 @@
+"""
+Conditional GET helpers (ETag / Last-Modified).
+
+Validators are derived from cheap aggregates (MAX(updated_at) + row count) so a
+revalidating client costs one indexed query and gets a 304 before anything is
+serialized. Representations embedding a scope's tags add one more aggregate over
+that scope's tags, so renaming a tag changes them too; it is a separate query
+rather than a join, which would multiply the row count.
+"""
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from typing import Optional, Sequence, Union
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from .models import Tag
+
+
+def make_etag(*parts) -> str:
+    raw = "|".join("" if p is None else str(p) for p in parts)
+    return quote_etag(hashlib.sha1(raw.encode()).hexdigest())
+
+
+def _aggregates(fields: Sequence[str]) -> dict:
+    aggregates = {f"last_{i}": Max(f) for i, f in enumerate(fields)}
+    aggregates["count"] = Count("pk")
+    return aggregates
+
+
+def _from_aggregates(agg: dict, fields: Sequence[str], extra, tags: Optional[dict] = None) -> tuple[str, Optional[datetime]]:
+    lasts = [agg[f"last_{i}"] for i in range(len(fields))]
+    counts = [agg["count"]]
+    if tags is not None:
+        lasts.append(tags["last_0"])
+        counts.append(tags["count"])
+    present = [v for v in lasts if v is not None]
+    etag = make_etag(*(v and v.isoformat() for v in lasts), *counts, *extra)
+    return etag, max(present) if present else None
+
+
+def _tags(scope: str):
+    return Tag.objects.filter(scope=scope).order_by()
+
+
+def queryset_validators(
+    queryset, field: Union[str, Sequence[str]] = "updated_at", *extra, tag_scope: Optional[str] = None,
+) -> tuple[str, Optional[datetime]]:
+    """
+    (etag, last_modified) for a collection: MAX(field) and COUNT(*) in one aggregate.
+    The count catches rows leaving the set (deletes, status changes) that do not move the max.
+    `field` may be several timestamps (e.g. of a joined one-to-one row); Last-Modified is the latest.
+    `extra` is mixed into the ETag, e.g. the query string of a filtered list.
+    `tag_scope` (a TagScope) adds MAX(updated_at) and COUNT(*) of that scope's tags.
+    """
+    fields = (field,) if isinstance(field, str) else tuple(field)
+    tags = _tags(tag_scope).aggregate(**_aggregates(("updated_at",))) if tag_scope else None
+    return _from_aggregates(queryset.order_by().aggregate(**_aggregates(fields)), fields, extra, tags)
+
+
+async def aqueryset_validators(
+    queryset, field: Union[str, Sequence[str]] = "updated_at", *extra, tag_scope: Optional[str] = None,
+):
+    """queryset_validators() through the async ORM."""
+    fields = (field,) if isinstance(field, str) else tuple(field)
+    tags = await _tags(tag_scope).aaggregate(**_aggregates(("updated_at",))) if tag_scope else None
+    return _from_aggregates(await queryset.order_by().aaggregate(**_aggregates(fields)), fields, extra, tags)
+
+
+def representation(request, is_staff: bool, media_type: str) -> tuple:
+    """ETag parts telling apart the responses one URL can have (page/filters, drafts shown, renderer)."""
+    return request.get_full_path(), is_staff, media_type
+
+
+def not_modified(request, etag: Optional[str], last_modified: Optional[datetime]):
+    """The 304/412 response if the request's preconditions say so, else None."""
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+
+
+def set_validators(response, etag: Optional[str], last_modified: Optional[datetime]):
+    if etag and not response.has_header("ETag"):
+        response["ETag"] = etag
+    if last_modified and not response.has_header("Last-Modified"):
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
+
+
+def finish(response, etag: Optional[str], last_modified: Optional[datetime], private: bool):
+    """Validators on a full 200 response, and a Cache-Control that makes caches revalidate instead of guessing."""
+    if response.status_code != 200:
+        return response
+    if not response.has_header("Cache-Control"):
+        patch_cache_control(response, no_cache=True, **({"private": True} if private else {"public": True}))
+    return set_validators(response, etag, last_modified)
+
+
+class ConditionalGetMixin:
+    """
+    ViewSet mixin: list/retrieve answer If-None-Match / If-Modified-Since with a 304
+    after one aggregate over the (filtered) queryset, before any row is loaded or
+    serialized. Set `conditional_tag_scope` when the items embed their tags; override
+    get_validators() when the representation depends on anything else.
+    """
+    conditional_fields: Sequence[str] = ("updated_at",)
+    conditional_tag_scope: Optional[str] = None
+
+    def get_validators(self, request, queryset) -> tuple[Optional[str], Optional[datetime]]:
+        extra = representation(request, bool(request.user and request.user.is_staff), request.accepted_media_type)
+        return queryset_validators(queryset, self.conditional_fields, *extra, tag_scope=self.conditional_tag_scope)
+
+    def _conditional(self, request, queryset, render):
+        etag, last_modified = self.get_validators(request, queryset)
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            response = render()
+        return finish(response, etag, last_modified, private=bool(request.user and request.user.is_authenticated))
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self._conditional(request, queryset, lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+        return self._conditional(
+            request, queryset, lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs),
+        )
@@ -0,0 +1,46 @@
+"""
+Cross-process invalidation for in-process snapshot caches (booking.catalog, common.suggest).
+
+Each cache remembers the CacheGeneration value its snapshot was built under. Writers
+bump the counter once their transaction commits; readers compare it with the row at
+most every CACHE_GENERATION_CHECK_SECONDS (one primary-key read) and rebuild when it
+moved, so an edit reaches every worker process within that interval instead of the
+cache's TTL.
+"""
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import CacheGeneration
+
+
+class SharedGeneration:
+    def __init__(self, name: str):
+        self.name = name
+        self._checked_at = float("-inf")
+
+    def _due(self) -> bool:
+        return time.monotonic() - self._checked_at >= getattr(settings, "CACHE_GENERATION_CHECK_SECONDS", 1)
+
+    def current(self) -> int:
+        """The value to build a snapshot under (read before loading: a bump during the load triggers another)."""
+        self._checked_at = time.monotonic()
+        return CacheGeneration.current(self.name)
+
+    def moved(self, generation: int) -> bool:
+        """Whether another writer bumped the counter since `generation` (only asks the database when a check is due)."""
+        if not self._due():
+            return False
+        return self.current() != generation
+
+    async def amoved(self, generation: int) -> bool:
+        if not self._due():
+            return False
+        self._checked_at = time.monotonic()
+        return await CacheGeneration.acurrent(self.name) != generation
+
+    def bump_on_commit(self) -> None:
+        transaction.on_commit(lambda: CacheGeneration.bump(self.name))
@@ -0,0 +1,78 @@
+"""
+`Idempotency-Key` support for public POST endpoints.
+
+A client that retries a write with the same key gets the stored response of the
+first successful attempt back, without the view (validation, inserts) running
+again. Requests without the header behave exactly as before.
+"""
+from __future__ import annotations
+
+import json
+from functools import wraps
+
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import IdempotencyKey
+
+HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+
+
+def canonical_body(request) -> str:
+    """
+    The parsed request data in a stable form. The raw body cannot be used: the
+    throttles read `request.data` first, which consumes the stream.
+    """
+    data = request.data
+    if hasattr(data, "lists"):
+        data = dict(data.lists())  # QueryDict (form posts): keep repeated fields
+    return json.dumps(data, sort_keys=True, default=str)
+
+
+def idempotent(handler):
+    """
+    Decorate an APIView handler (e.g. `post`). Only 2xx responses are stored;
+    anything else releases the key so the client can retry with it.
+    """
+    @wraps(handler)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if not key:
+            return handler(self, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {"detail": f"{HEADER} must be at most {MAX_KEY_LENGTH} characters."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        scope = f"{type(self).__module__}.{type(self).__qualname__}"
+        request_hash = IdempotencyKey.digest(request.content_type, canonical_body(request))
+        record, created = IdempotencyKey.reserve(IdempotencyKey.digest(scope, key), request_hash)
+
+        if not created:
+            if record.request_hash != request_hash:
+                return Response(
+                    {"detail": f"{HEADER} was already used with a different request."},
+                    status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                )
+            if record.status_code is None:
+                return Response(
+                    {"detail": f"A request with this {HEADER} is still being processed."},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            return Response(record.response_body, status=record.status_code, headers={"Idempotent-Replayed": "true"})
+
+        try:
+            response = handler(self, request, *args, **kwargs)
+        except BaseException:
+            record.delete()
+            raise
+
+        if 200 <= response.status_code < 300:
+            record.complete(response.status_code, response.data)
+        else:
+            record.delete()
+        return response
+
+    return wrapper
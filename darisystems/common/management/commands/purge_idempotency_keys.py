@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from common.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = "Delete expired Idempotency-Key records in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows deleted per statement (default: 1000).")
+
+    def handle(self, *args, **opts):
+        deleted = IdempotencyKey.purge_expired(batch_size=opts["batch_size"])
+        self.stdout.write(f"Purged {deleted} expired idempotency key(s).")
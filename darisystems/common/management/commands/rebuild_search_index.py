@@ -0,0 +1,32 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from common import search
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-index the full-text search documents of every registered model (or the given ones, as "
+        "app_label.Model). Saves and deletes keep the index current; run this after bulk imports or "
+        "QuerySet.update() calls, which skip the signals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("models", nargs="*", help="Models to re-index, e.g. content.Post (default: all registered).")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **opts):
+        models = []
+        for label in opts["models"]:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError):
+                raise CommandError(f"Unknown model {label!r}.")
+            if search.indexed_fields(model) is None:
+                raise CommandError(f"{label} is not registered for full-text search.")
+            models.append(model)
+
+        with transaction.atomic():
+            indexed = search.rebuild(models or None, batch_size=opts["batch_size"])
+        self.stdout.write(f"Indexed {indexed} document(s).")
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Full-text index over common_searchdocument (see common.search). Other backends have
+# no index and SearchFilter falls back to icontains lookups.
+POSTGRES_INDEX = [
+    """
+    ALTER TABLE common_searchdocument ADD COLUMN vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', title), 'A') || setweight(to_tsvector('english', body), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX common_searchdoc_vector ON common_searchdocument USING gin (vector)",
+]
+POSTGRES_INDEX_REVERSE = [
+    "DROP INDEX IF EXISTS common_searchdoc_vector",
+    "ALTER TABLE common_searchdocument DROP COLUMN IF EXISTS vector",
+]
+
+# External-content FTS5 table: the text is stored once (in common_searchdocument) and the
+# triggers keep the index in step with every insert/update/delete of a document row.
+SQLITE_INDEX = [
+    """
+    CREATE VIRTUAL TABLE common_searchdocument_fts USING fts5(
+        title, body, content='common_searchdocument', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER common_searchdoc_ai AFTER INSERT ON common_searchdocument BEGIN
+        INSERT INTO common_searchdocument_fts(rowid, title, body) VALUES (NEW.id, NEW.title, NEW.body);
+    END
+    """,
+    """
+    CREATE TRIGGER common_searchdoc_ad AFTER DELETE ON common_searchdocument BEGIN
+        INSERT INTO common_searchdocument_fts(common_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', OLD.id, OLD.title, OLD.body);
+    END
+    """,
+    """
+    CREATE TRIGGER common_searchdoc_au AFTER UPDATE ON common_searchdocument BEGIN
+        INSERT INTO common_searchdocument_fts(common_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', OLD.id, OLD.title, OLD.body);
+        INSERT INTO common_searchdocument_fts(rowid, title, body) VALUES (NEW.id, NEW.title, NEW.body);
+    END
+    """,
+]
+SQLITE_INDEX_REVERSE = [
+    "DROP TRIGGER IF EXISTS common_searchdoc_ai",
+    "DROP TRIGGER IF EXISTS common_searchdoc_ad",
+    "DROP TRIGGER IF EXISTS common_searchdoc_au",
+    "DROP TABLE IF EXISTS common_searchdocument_fts",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for sql in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0002_idempotency_key'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.TextField(blank=True, default='')),
+                ('body', models.TextField(blank=True, default='')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'object_id'), name='uq_searchdoc_object')],
+            },
+        ),
+        migrations.RunPython(
+            _run({"postgresql": POSTGRES_INDEX, "sqlite": SQLITE_INDEX}),
+            _run({"postgresql": POSTGRES_INDEX_REVERSE, "sqlite": SQLITE_INDEX_REVERSE}),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0003_search_document'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThrottleBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key_hash', models.CharField(max_length=64, unique=True)),
+                ('tokens', models.FloatField()),
+                ('stamp', models.FloatField()),
+                ('expires_at', models.FloatField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['expires_at'], name='idx_throttle_expires')],
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+from django.db import migrations
+
+# Rows written before full-text search existed (common 0003) have no document, and
+# FullTextSearchFilter would never find them: index them once here. Later saves and
+# deletes keep the documents in step (common.search); rebuild_search_index redoes it all.
+
+# The fields registered in the apps' ready() when this migration was written (the first one is the title).
+INDEXED = {
+    ("content", "Post"): ("title", "excerpt", "content"),
+    ("portfolio", "Project"): ("title", "summary", "content", "industry", "client_name"),
+    ("assets", "Asset"): ("title", "description"),
+}
+BATCH_SIZE = 500
+
+
+def backfill(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    SearchDocument = apps.get_model("common", "SearchDocument")
+    for (app_label, name), fields in INDEXED.items():
+        model = apps.get_model(app_label, name)
+        content_type, _ = ContentType.objects.get_or_create(app_label=app_label, model=name.lower())
+        batch = []
+        for obj in model.objects.only("pk", *fields).iterator(chunk_size=BATCH_SIZE):
+            # Same layout as common.search._document().
+            values = [str(getattr(obj, f) or "") for f in fields]
+            batch.append(SearchDocument(
+                content_type=content_type, object_id=obj.pk,
+                title=values[0], body="\n".join(v for v in values[1:] if v),
+            ))
+            if len(batch) >= BATCH_SIZE:
+                SearchDocument.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+        SearchDocument.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0004_throttle_bucket'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('content', '0002_reading_stats'),
+        ('portfolio', '0002_reading_stats'),
+        ('assets', '0002_reading_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
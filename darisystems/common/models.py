@@ -1,15 +1,24 @@
 
 from __future__ import annotations
 
+import hashlib
+import math
+import re
 import secrets
 from datetime import timedelta
 from typing import Optional
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models, transaction
-from django.db.models import Q
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Least
+from django.db.models.lookups import GreaterThanOrEqual
 from django.utils import timezone
+from django.utils.html import strip_tags
+
+WORD = re.compile(r"\w+")
 
 
 # -----------------------------
@@ -27,6 +36,45 @@ class TimeStampedModel(models.Model):
         return super().save(*args, **kwargs)
 
 
+def reading_stats(*texts: Optional[str], excerpt_chars: int = 280) -> tuple[int, str]:
+    """(word count, plain-text excerpt) of markdown/html texts; the excerpt comes from the first non-empty one."""
+    plain = [" ".join(strip_tags(t).split()) for t in texts if t]
+    plain = [t for t in plain if t]
+    words = sum(len(WORD.findall(t)) for t in plain)
+    if not plain or len(plain[0]) <= excerpt_chars:
+        return words, plain[0] if plain else ""
+    cut = plain[0][:excerpt_chars + 1].rsplit(" ", 1)[0] or plain[0][:excerpt_chars]
+    return words, cut.rstrip(" ,.;:") + "…"
+
+
+class ReadingStatsModel(TimeStampedModel):
+    """
+    Stores the word count and a plain-text excerpt of the model's long text columns
+    (`reading_fields`), so list views can defer those columns and still show both.
+    """
+    reading_fields: tuple[str, ...] = ()
+
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    auto_excerpt = models.CharField(max_length=300, blank=True, default="", editable=False)
+
+    class Meta:
+        abstract = True
+
+    @property
+    def reading_minutes(self) -> int:
+        if not self.word_count:
+            return 0
+        return max(1, math.ceil(self.word_count / getattr(settings, "READING_WORDS_PER_MINUTE", 200)))
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or set(update_fields) & set(self.reading_fields):
+            self.word_count, self.auto_excerpt = reading_stats(*(getattr(self, f) for f in self.reading_fields))
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "word_count", "auto_excerpt"}
+        return super().save(*args, **kwargs)
+
+
 class PublishStatus(models.TextChoices):
     DRAFT = "DRAFT", "Draft"
     PUBLISHED = "PUBLISHED", "Published"
@@ -64,3 +112,185 @@ class Tag(TimeStampedModel):
     def __str__(self) -> str:
         return f"{self.scope}:{self.name}"
 
+
+
+# -----------------------------
+# Full-text search
+# -----------------------------
+class SearchDocument(models.Model):
+    """
+    Indexed text of one registered object (see common.search). The full-text index
+    itself lives beside this table: an FTS5 table kept in step by triggers on SQLite,
+    a generated tsvector column with a GIN index on Postgres (migration 0003).
+    """
+    content_type = models.ForeignKey("contenttypes.ContentType", on_delete=models.CASCADE, related_name="+")
+    object_id = models.PositiveBigIntegerField()
+    title = models.TextField(blank=True, default="")
+    body = models.TextField(blank=True, default="")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["content_type", "object_id"], name="uq_searchdoc_object"),
+        ]
+
+
+# -----------------------------
+# Idempotency keys
+# -----------------------------
+class IdempotencyKey(models.Model):
+    """
+    Outcome of a public write sent with an `Idempotency-Key` header.
+    Only hashes are stored: of (scope, key) for lookup and of the parsed request data
+    to detect a key being reused for a different payload.
+    A row with no status_code is a reservation for a request still in flight.
+    """
+    key_hash = models.CharField(max_length=64, unique=True)
+    request_hash = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["expires_at"], name="idx_idem_expires"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.key_hash[:12]} ({self.status_code or 'in flight'})"
+
+    @staticmethod
+    def digest(*parts) -> str:
+        h = hashlib.sha256()
+        for part in parts:
+            h.update(part if isinstance(part, bytes) else str(part).encode())
+            h.update(b"\0")
+        return h.hexdigest()
+
+    @classmethod
+    def ttl(cls) -> timedelta:
+        return timedelta(hours=getattr(settings, "IDEMPOTENCY_KEY_TTL_HOURS", 24))
+
+    @classmethod
+    def reserve(cls, key_hash: str, request_hash: str, now=None) -> tuple["IdempotencyKey", bool]:
+        """
+        Claim `key_hash` for a new request -> (row, True), or return the existing row -> (row, False).
+        Expired rows and in-flight reservations older than IDEMPOTENCY_KEY_LOCK_SECONDS
+        (a worker died mid-request) are taken over.
+        """
+        now = now or timezone.now()
+        stale_before = now - timedelta(seconds=getattr(settings, "IDEMPOTENCY_KEY_LOCK_SECONDS", 60))
+        for _ in range(2):
+            try:
+                with transaction.atomic():
+                    row = cls.objects.create(
+                        key_hash=key_hash, request_hash=request_hash, created_at=now, expires_at=now + cls.ttl(),
+                    )
+                return row, True
+            except IntegrityError:
+                pass
+            row = cls.objects.filter(key_hash=key_hash).first()
+            if row is None:
+                continue
+            abandoned = row.status_code is None and row.created_at < stale_before
+            if row.expires_at > now and not abandoned:
+                return row, False
+            cls.objects.filter(pk=row.pk, created_at=row.created_at).delete()
+        raise IntegrityError("Could not reserve idempotency key.")
+
+    def complete(self, status_code: int, body) -> None:
+        self.status_code = status_code
+        self.response_body = body
+        self.save(update_fields=["status_code", "response_body"])
+
+    @classmethod
+    def purge_expired(cls, batch_size: int = 1000, now=None) -> int:
+        """Delete expired rows in primary-key batches so no single statement holds long locks."""
+        now = now or timezone.now()
+        deleted = 0
+        while True:
+            pks = list(cls.objects.filter(expires_at__lte=now).values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                return deleted
+            deleted += cls.objects.filter(pk__in=pks).delete()[0]
+
+
+class ThrottleBucket(models.Model):
+    """
+    Token bucket of one throttle key (see common.throttling), shared by every worker
+    process through the database. Only a hash of the key (which may hold an email) is
+    stored. `tokens` is the level at `stamp` (Unix seconds); the bucket is full again
+    by `expires_at`, after which the row can be dropped.
+    """
+    key_hash = models.CharField(max_length=64, unique=True)
+    tokens = models.FloatField()
+    stamp = models.FloatField()
+    expires_at = models.FloatField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["expires_at"], name="idx_throttle_expires"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.key_hash[:12]} ({self.tokens:.2f})"
+
+    @classmethod
+    def take(cls, key: str, capacity: int, period: float, now: float) -> Optional[float]:
+        """
+        Spend one token of `key` (`capacity` tokens refilled per `period` seconds) -> None,
+        or the seconds until a token is available. Refill and spend are one conditional
+        UPDATE, so concurrent requests in any process never spend the same token twice.
+        """
+        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        rate = capacity / period
+        level = Least(Value(float(capacity)), F("tokens") + (Value(now) - F("stamp")) * Value(rate))
+        bucket = cls.objects.filter(key_hash=key_hash)
+        for _ in range(2):
+            if bucket.filter(GreaterThanOrEqual(level, 1.0)).update(tokens=level - 1, stamp=now, expires_at=now + period):
+                return None
+            row = bucket.values_list("tokens", "stamp").first()
+            if row is not None:
+                tokens = min(capacity, row[0] + (now - row[1]) * rate)
+                return max(0.0, (1 - tokens) / rate)
+            try:
+                with transaction.atomic():
+                    cls.objects.create(key_hash=key_hash, tokens=capacity - 1, stamp=now, expires_at=now + period)
+            except IntegrityError:
+                continue  # created concurrently: spend from that row
+            cls.purge_expired(now)
+            return None
+        return None
+
+    @classmethod
+    def purge_expired(cls, now: float, batch_size: int = 100) -> int:
+        """Drop one bounded batch of full buckets (run as new keys arrive, so the table stays small)."""
+        pks = list(cls.objects.filter(expires_at__lte=now).values_list("pk", flat=True)[:batch_size])
+        return cls.objects.filter(pk__in=pks).delete()[0] if pks else 0
+
+
+class CacheGeneration(models.Model):
+    """
+    Named counter of an in-process cache (see common.generations). Committed writes that
+    change what the cache holds bump it, so every worker process notices and reloads.
+    """
+    name = models.CharField(max_length=64, primary_key=True)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.value}"
+
+    @classmethod
+    def current(cls, name: str) -> int:
+        return cls.objects.filter(pk=name).values_list("value", flat=True).first() or 0
+
+    @classmethod
+    async def acurrent(cls, name: str) -> int:
+        return await cls.objects.filter(pk=name).values_list("value", flat=True).afirst() or 0
+
+    @classmethod
+    def bump(cls, name: str) -> None:
+        updated = cls.objects.filter(pk=name).update(value=F("value") + 1, updated_at=timezone.now())
+        if not updated:
+            cls.objects.get_or_create(pk=name, defaults={"value": 1})
@@ -0,0 +1,239 @@
+"""
+Default pagination for every list endpoint: page numbers, or keyset pages on request.
+
+Without `cursor` the responses are DRF's PageNumberPagination ones. `?cursor=` (empty
+for the first page) switches to keyset mode: the page is the next `page_size` rows
+after the last row of the previous page in the list's own ordering (plus the primary
+key as tie-breaker), selected with a WHERE on those columns instead of OFFSET, and
+there is no COUNT(*). Both cost the same on page 1 and page 10,000 as long as the
+ordering is indexed (the views order on indexed created_at / published_at columns).
+
+    {"next": "...?cursor=<opaque>", "previous": "...?cursor=<opaque>", "results": [...]}
+
+`?count=approx` adds "approximate_count": the planner's row estimate on PostgreSQL,
+an exact COUNT(*) elsewhere. Orderings that are not plain model columns (search
+relevance, annotations) cannot be keyed and keep page-number pages.
+"""
+from __future__ import annotations
+
+import base64
+import json
+from collections import OrderedDict
+from typing import Optional
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(PageNumberPagination):
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor."
+
+    @property
+    def max_page_size(self):
+        return getattr(settings, "PAGINATION_MAX_PAGE_SIZE", 100)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.cursor_query_param not in request.query_params:
+            return super().paginate_queryset(queryset, request, view)
+        keys = self._keys(queryset)
+        if keys is None:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.keyset = keys
+        self.page_size = self.get_page_size(request)
+        position, reverse = self._decode(request.query_params[self.cursor_query_param], keys)
+        self.approximate_count = (
+            self._approximate_count(queryset) if request.query_params.get(self.count_query_param) == "approx" else None
+        )
+
+        ordered = queryset.order_by(*(_flip(k) if reverse else k for k, _ in keys))
+        if position is not None:
+            ordered = ordered.filter(_after(keys, position, reverse, connections[queryset.db].vendor))
+        rows = list(ordered[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        # Going forward there is a previous page whenever we came from a cursor, and vice versa.
+        has_next = has_more if not reverse else position is not None
+        has_previous = position is not None if not reverse else has_more
+        self.next_position = _position(rows[-1], keys) if rows and has_next else None
+        self.previous_position = _position(rows[0], keys) if rows and has_previous else None
+        if not rows and position is not None:
+            # Past either end (rows deleted since): point back at where the client came from.
+            if reverse:
+                self.next_position = position
+            else:
+                self.previous_position = position
+        return rows
+
+    def get_paginated_response(self, data):
+        if self.keyset is None:
+            return super().get_paginated_response(data)
+        payload = OrderedDict([
+            ("next", self._link(self.next_position, reverse=False)),
+            ("previous", self._link(self.previous_position, reverse=True)),
+        ])
+        if self.approximate_count is not None:
+            payload["approximate_count"] = self.approximate_count
+        payload["results"] = data
+        return Response(payload)
+
+    def get_schema_operation_parameters(self, view):
+        params = super().get_schema_operation_parameters(view)
+        params.append({
+            "name": self.cursor_query_param,
+            "required": False,
+            "in": "query",
+            "description": "Keyset pagination: empty for the first page, then the cursor from next/previous.",
+            "schema": {"type": "string"},
+        })
+        params.append({
+            "name": self.count_query_param,
+            "required": False,
+            "in": "query",
+            "description": 'With cursor: "approx" adds an approximate_count.',
+            "schema": {"type": "string", "enum": ["approx"]},
+        })
+        return params
+
+    # -- keys ------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _keys(queryset) -> Optional[list[tuple[str, object]]]:
+        """[(ordering term, model field)] with the pk appended, or None when the ordering cannot be keyed."""
+        terms = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+        if queryset.query.extra_order_by or not all(isinstance(t, str) for t in terms):
+            return None
+        pk = queryset.model._meta.pk
+        keys = []
+        for term in terms:
+            path = term.lstrip("-")
+            if path in ("pk", pk.name):
+                # Unique already: later terms can never break a tie.
+                keys.append((term, pk))
+                return keys
+            field = _resolve(queryset.model, path)
+            if field is None:
+                return None
+            keys.append((term, field))
+        # The primary key breaks ties, in the direction of the last term.
+        keys.append(("-pk" if terms and terms[-1].startswith("-") else "pk", pk))
+        return keys
+
+    def _decode(self, raw: str, keys) -> tuple[Optional[list], bool]:
+        if not raw:
+            return None, False
+        try:
+            data = json.loads(base64.urlsafe_b64decode(raw.encode("ascii") + b"=" * (-len(raw) % 4)))
+            values, reverse = data["p"], bool(data.get("r"))
+            if len(values) != len(keys):
+                raise ValueError
+            position = [None if v is None else field.to_python(v) for v, (_, field) in zip(values, keys)]
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def _link(self, position, reverse: bool) -> Optional[str]:
+        if position is None:
+            return None
+        data = {"p": position}
+        if reverse:
+            data["r"] = 1
+        token = base64.urlsafe_b64encode(json.dumps(data, default=_encode, separators=(",", ":")).encode())
+        url = remove_query_param(self.request.build_absolute_uri(), self.count_query_param)
+        return replace_query_param(url, self.cursor_query_param, token.decode("ascii").rstrip("="))
+
+    @staticmethod
+    def _approximate_count(queryset) -> int:
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return queryset.count()
+        sql, params = queryset.order_by().values("pk").query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _resolve(model, path: str):
+    """The concrete field a (possibly related) ordering path ends on, or None."""
+    field = None
+    for part in path.split("__"):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        if field.is_relation:
+            if not field.many_to_one and not field.one_to_one:
+                return None
+            model = field.related_model
+    if field is not None and field.is_relation:
+        field = field.target_field
+    return field if field is not None and field.concrete else None
+
+
+def _encode(value):
+    # Full precision (DjangoJSONEncoder drops microseconds); field.to_python() reads it back.
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _flip(term: str) -> str:
+    return term[1:] if term.startswith("-") else f"-{term}"
+
+
+def _position(obj, keys) -> list:
+    values = []
+    for term, _ in keys:
+        value = obj
+        for part in term.lstrip("-").split("__"):
+            value = getattr(value, part, None) if value is not None else None
+        if hasattr(value, "_meta"):
+            value = value.pk
+        values.append(value)
+    return values
+
+
+def _after(keys, position, reverse: bool, vendor: str) -> Q:
+    """
+    Rows strictly after `position` in the (possibly reversed) ordering:
+    k1 > v1 OR (k1 = v1 AND (k2 > v2 OR (k2 = v2 AND ...))), with NULLs placed where
+    the database sorts them (largest on PostgreSQL, smallest elsewhere) so the
+    default ordering and its indexes are kept.
+    """
+    nulls_largest = vendor in ("postgresql", "oracle")
+    condition = None
+    for (term, field), value in reversed(list(zip(keys, position))):
+        path = term.lstrip("-")
+        descending = term.startswith("-") != reverse
+        beyond = _beyond(path, field, value, descending, nulls_largest)
+        equal = Q(**{f"{path}__isnull": True}) if value is None else Q(**{path: value})
+        condition = beyond if condition is None else beyond | (equal & condition)
+    return condition
+
+
+def _beyond(path: str, field, value, descending: bool, nulls_largest: bool) -> Q:
+    # Past `value` means smaller when descending, larger when ascending.
+    towards_nulls = descending != nulls_largest
+    if value is None:
+        return Q(pk__in=[]) if towards_nulls else Q(**{f"{path}__isnull": False})
+    beyond = Q(**{f"{path}__{'lt' if descending else 'gt'}": value})
+    if towards_nulls and field.null:
+        beyond |= Q(**{f"{path}__isnull": True})
+    return beyond
@@ -0,0 +1,195 @@
+"""
+Full-text search for the public content lists.
+
+Models register the fields they want indexed (apps' ready()); every save/delete of a
+registered object upserts/removes its row in common.SearchDocument, and the database
+keeps the full-text index of that table in step (SQLite: FTS5 table + triggers;
+Postgres: generated tsvector + GIN, see common migration 0003). Rows that predate
+the index were indexed by migration 0005.
+
+FullTextSearchFilter is a drop-in replacement for DRF's SearchFilter: views keep their
+`search_fields`, and when every one of them is indexed the `?search=` terms become one
+indexed MATCH / @@ join instead of a chain of icontains scans. Results are ordered by
+relevance (unless `?ordering=` is given) and carry `search_rank` / `search_snippet`
+annotations, which SearchHitMixin adds to the serialized objects. Anything else (other
+backends, unindexed fields, related lookups) falls back to the stock SearchFilter.
+"""
+from __future__ import annotations
+
+import re
+from typing import Iterable, Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections
+from django.db.models.signals import post_delete, post_save
+from django.utils.html import escape
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
+
+from .models import SearchDocument
+
+# Snippet highlight markers (private-use characters): the snippet is HTML-escaped first and
+# the markers become <mark> tags afterwards, so indexed text can never inject markup.
+MARK_START, MARK_END = "\ue000", "\ue001"
+WORD = re.compile(r"\w+")
+
+_REGISTRY: dict[type, tuple[str, ...]] = {}
+
+
+# -----------------------------
+# Indexing
+# -----------------------------
+def register(model, fields: Iterable[str]) -> None:
+    """Index `fields` of `model` (the first one ranks as the title) and keep the index in step on save/delete."""
+    _REGISTRY[model] = tuple(fields)
+    uid = f"common.search:{model._meta.label}"
+    post_save.connect(_saved, sender=model, dispatch_uid=uid)
+    post_delete.connect(_deleted, sender=model, dispatch_uid=uid)
+
+
+def indexed_fields(model) -> Optional[tuple[str, ...]]:
+    return _REGISTRY.get(model)
+
+
+def _document(model, obj) -> tuple[str, str]:
+    values = [str(getattr(obj, f) or "") for f in _REGISTRY[model]]
+    return values[0], "\n".join(v for v in values[1:] if v)
+
+
+def index(model, obj) -> None:
+    title, body = _document(model, obj)
+    content_type = ContentType.objects.get_for_model(model)
+    updated = SearchDocument.objects.filter(content_type=content_type, object_id=obj.pk).update(title=title, body=body)
+    if not updated:
+        SearchDocument.objects.bulk_create(
+            [SearchDocument(content_type=content_type, object_id=obj.pk, title=title, body=body)],
+            ignore_conflicts=True,
+        )
+
+
+def _saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not set(update_fields) & set(_REGISTRY[sender]):
+        return
+    index(sender, instance)
+
+
+def _deleted(sender, instance, **kwargs):
+    SearchDocument.objects.filter(content_type=ContentType.objects.get_for_model(sender), object_id=instance.pk).delete()
+
+
+def rebuild(models: Optional[Iterable[type]] = None, batch_size: int = 500) -> int:
+    """Re-index every object of the given registered models (all by default); returns the number indexed."""
+    total = 0
+    for model in models or list(_REGISTRY):
+        content_type = ContentType.objects.get_for_model(model)
+        SearchDocument.objects.filter(content_type=content_type).delete()
+        batch = []
+        for obj in model.objects.only("pk", *_REGISTRY[model]).iterator(chunk_size=batch_size):
+            title, body = _document(model, obj)
+            batch.append(SearchDocument(content_type=content_type, object_id=obj.pk, title=title, body=body))
+            if len(batch) >= batch_size:
+                total += len(SearchDocument.objects.bulk_create(batch))
+                batch = []
+        total += len(SearchDocument.objects.bulk_create(batch))
+    return total
+
+
+# -----------------------------
+# Querying
+# -----------------------------
+def _join(queryset, content_type_id: int) -> dict:
+    qn = connections[queryset.db].ops.quote_name
+    opts = queryset.model._meta
+    return {
+        "tables": ["common_searchdocument"],
+        "where": [
+            f"common_searchdocument.object_id = {qn(opts.db_table)}.{qn(opts.pk.column)}",
+            "common_searchdocument.content_type_id = %s",
+        ],
+        "params": [content_type_id],
+    }
+
+
+def _sqlite(queryset, words: list[str], content_type_id: int):
+    join = _join(queryset, content_type_id)
+    # Every word as a quoted prefix query (implicit AND), like the icontains terms it replaces.
+    match = " ".join(f'"{w}"*' for w in words)
+    return queryset.extra(
+        select={
+            # bm25() is lower-is-better; title matches weigh 10x.
+            "search_rank": "-bm25(common_searchdocument_fts, 10.0, 1.0)",
+            "search_snippet": "snippet(common_searchdocument_fts, -1, %s, %s, '…', 16)",
+        },
+        select_params=(MARK_START, MARK_END),
+        tables=join["tables"] + ["common_searchdocument_fts"],
+        where=join["where"] + [
+            "common_searchdocument_fts.rowid = common_searchdocument.id",
+            "common_searchdocument_fts MATCH %s",
+        ],
+        params=join["params"] + [match],
+    )
+
+
+def _postgresql(queryset, words: list[str], content_type_id: int):
+    join = _join(queryset, content_type_id)
+    query = " & ".join(f"{w}:*" for w in words)
+    return queryset.extra(
+        select={
+            "search_rank": "ts_rank(common_searchdocument.vector, to_tsquery('english', %s))",
+            "search_snippet": (
+                "ts_headline('english', common_searchdocument.title || ' ' || common_searchdocument.body, "
+                "to_tsquery('english', %s), %s)"
+            ),
+        },
+        select_params=(query, query, f"StartSel={MARK_START}, StopSel={MARK_END}, MinWords=8, MaxWords=24"),
+        tables=join["tables"],
+        where=join["where"] + ["common_searchdocument.vector @@ to_tsquery('english', %s)"],
+        params=join["params"] + [query],
+    )
+
+
+BACKENDS = {"sqlite": _sqlite, "postgresql": _postgresql}
+
+
+class FullTextSearchFilter(SearchFilter):
+    """Drop-in SearchFilter backed by the full-text index (see module docstring)."""
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return queryset
+
+        backend = BACKENDS.get(connections[queryset.db].vendor)
+        indexed = indexed_fields(queryset.model)
+        words = [w for term in search_terms for w in WORD.findall(term)]
+        plain = {field.lstrip("^=@$") for field in search_fields}
+        if backend is None or indexed is None or not words or not plain <= set(indexed):
+            return super().filter_queryset(request, queryset, view)
+
+        content_type = ContentType.objects.db_manager(queryset.db).get_for_model(queryset.model)
+        queryset = backend(queryset, words, content_type.pk)
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            # Most relevant first; the view's own ordering breaks ties.
+            queryset = queryset.order_by("-search_rank", *queryset.query.order_by)
+        return queryset
+
+
+def highlight(snippet: Optional[str]) -> Optional[str]:
+    """HTML-escaped snippet with the matches wrapped in <mark>."""
+    if snippet is None:
+        return None
+    return escape(snippet).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+
+
+class SearchHitMixin:
+    """Serializer mixin: objects found by FullTextSearchFilter get a "search": {"rank", "snippet"} entry."""
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        rank = getattr(instance, "search_rank", None)
+        if rank is not None:
+            data["search"] = {"rank": round(float(rank), 4), "snippet": highlight(getattr(instance, "search_snippet", None))}
+        return data
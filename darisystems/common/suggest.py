@@ -0,0 +1,172 @@
+"""
+In-memory prefix index behind the search box suggestions (GET /api/v1/suggest/?q=).
+
+Models register a label field (apps' ready()): post/project/asset titles, tag and
+technology names. Every label is indexed under each of its word starts
+("Scaling Django" answers both "sca" and "dja"), lower-cased and accent-folded,
+in one sorted list; a lookup is a bisect to the first key >= the prefix and a
+scan that stops at the first key that no longer starts with it, so queries never
+touch the database.
+
+Saves and deletes of a registered object re-index just that object on commit in
+the writing process and bump the shared "suggest" generation; other worker
+processes rebuild their copy within CACHE_GENERATION_CHECK_SECONDS (see
+common.generations), so an object that is hidden (unpublished, confidential) stops
+being suggested everywhere almost at once. Readers always see a complete snapshot:
+writers build the next sorted list aside and swap it in.
+"""
+from __future__ import annotations
+
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .generations import SharedGeneration
+
+WORD_START = re.compile(r"\b\w")
+# Word starts indexed per label: enough for titles, bounds the index for very long ones.
+MAX_KEYS_PER_LABEL = 12
+GENERATION = SharedGeneration("suggest")
+
+
+@dataclass(frozen=True)
+class Source:
+    kind: str
+    label: str
+    filters: dict
+    extra: tuple[str, ...]
+
+    def visible(self, obj) -> bool:
+        return all(getattr(obj, field) == value for field, value in self.filters.items())
+
+    def entry(self, obj) -> dict:
+        data = {"kind": self.kind, "label": getattr(obj, self.label), "slug": obj.slug}
+        data.update((field, getattr(obj, field)) for field in self.extra)
+        return data
+
+
+_SOURCES: dict[type, Source] = {}
+
+
+def normalize(text: str) -> str:
+    """Case- and accent-insensitive form used for keys and queries."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def keys_for(label: str) -> list[str]:
+    text = normalize(label)
+    return [text[m.start():] for m in WORD_START.finditer(text)][:MAX_KEYS_PER_LABEL]
+
+
+class SuggestIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (loaded_at, generation, sorted [(key, kind, pk)], {(kind, pk): (entry, keys)}) swapped as one tuple
+        self._snapshot: Optional[tuple[float, int, list, dict]] = None
+
+    def _stale(self, snapshot) -> bool:
+        return snapshot is None or time.monotonic() - snapshot[0] >= getattr(settings, "SUGGEST_TTL_SECONDS", 300)
+
+    def _load(self):
+        snapshot = self._snapshot
+        if self._stale(snapshot) or GENERATION.moved(snapshot[1]):
+            with self._lock:
+                if self._snapshot is snapshot or self._stale(self._snapshot):
+                    generation = GENERATION.current()
+                    rows, items = [], {}
+                    for model, source in _SOURCES.items():
+                        fields = {"pk", "slug", source.label, *source.extra}
+                        for obj in model.objects.filter(**source.filters).only(*fields):
+                            keys = keys_for(getattr(obj, source.label))
+                            items[(source.kind, obj.pk)] = (source.entry(obj), keys)
+                            rows.extend((key, source.kind, obj.pk) for key in keys)
+                    rows.sort()
+                    self._snapshot = (time.monotonic(), generation, rows, items)
+                snapshot = self._snapshot
+        return snapshot
+
+    def suggest(self, prefix: str, limit: int, kinds: Optional[Iterable[str]] = None) -> list[dict]:
+        """Up to `limit` entries with a word starting with `prefix`, in key order, each object once."""
+        prefix = normalize(prefix).strip()
+        if not prefix or limit <= 0:
+            return []
+        kinds = set(kinds) if kinds else None
+        _, _, rows, items = self._load()
+        found, seen = [], set()
+        for i in range(bisect_left(rows, (prefix,)), len(rows)):
+            key, kind, pk = rows[i]
+            if not key.startswith(prefix):
+                break
+            if (kind, pk) in seen or (kinds is not None and kind not in kinds):
+                continue
+            seen.add((kind, pk))
+            found.append(items[(kind, pk)][0])
+            if len(found) >= limit:
+                break
+        return found
+
+    def update(self, model, obj) -> None:
+        """Re-index one saved object (dropping it when it is no longer visible)."""
+        source = _SOURCES[model]
+        self._replace(source.kind, obj.pk, source, obj if source.visible(obj) else None)
+
+    def remove(self, model, pk) -> None:
+        self._replace(_SOURCES[model].kind, pk, None, None)
+
+    def _replace(self, kind: str, pk, source: Optional[Source], obj) -> None:
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None:
+                return  # nothing loaded yet; the first lookup reads the current rows
+            loaded_at, generation, rows, items = snapshot
+            rows, items = list(rows), dict(items)
+            old = items.pop((kind, pk), None)
+            if old is not None:
+                for key in old[1]:
+                    del rows[bisect_left(rows, (key, kind, pk))]
+            if obj is not None:
+                keys = keys_for(getattr(obj, source.label))
+                items[(kind, pk)] = (source.entry(obj), keys)
+                for key in keys:
+                    insort(rows, (key, kind, pk))
+            self._snapshot = (loaded_at, generation, rows, items)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+
+index = SuggestIndex()
+
+
+# -----------------------------
+# Registration
+# -----------------------------
+def register(model, kind: str, label: str = "title", filters: Optional[dict] = None, extra: Iterable[str] = ()) -> None:
+    """Suggest `model` objects matching `filters` by their `label` field; `extra` fields are returned as well."""
+    _SOURCES[model] = Source(kind=kind, label=label, filters=dict(filters or {}), extra=tuple(extra))
+    uid = f"common.suggest:{model._meta.label}"
+    post_save.connect(_saved, sender=model, dispatch_uid=uid)
+    post_delete.connect(_deleted, sender=model, dispatch_uid=uid)
+
+
+def _saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    transaction.on_commit(lambda: index.update(sender, instance))
+    GENERATION.bump_on_commit()
+
+
+def _deleted(sender, instance, **kwargs):
+    pk = instance.pk  # cleared on the instance once the delete completes
+    transaction.on_commit(lambda: index.remove(sender, pk))
+    GENERATION.bump_on_commit()
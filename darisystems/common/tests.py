@@ -1,3 +1,153 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from content.models import Post
+from content.serializers import PostListSerializer
+from content.views import PostListAsyncView, PostViewSet
+from portfolio.models import Project
+
+from .async_views import AsyncPublicListView, AsyncReadView
+from .models import CacheGeneration, PublishStatus, ThrottleBucket
+from .suggest import index
+
+
+class ThrottleBucketTests(TestCase):
+    def test_burst_then_refill(self):
+        now = 1_000_000.0
+        for _ in range(3):
+            self.assertIsNone(ThrottleBucket.take("k", capacity=3, period=60, now=now))
+        self.assertAlmostEqual(ThrottleBucket.take("k", capacity=3, period=60, now=now), 20.0)
+        self.assertAlmostEqual(ThrottleBucket.take("k", capacity=3, period=60, now=now + 15), 5.0)
+        self.assertIsNone(ThrottleBucket.take("k", capacity=3, period=60, now=now + 20))
+        self.assertIsNotNone(ThrottleBucket.take("k", capacity=3, period=60, now=now + 20))
+        self.assertIsNone(ThrottleBucket.take("other", capacity=3, period=60, now=now))
+
+    def test_refill_is_capped(self):
+        now = 1_000_000.0
+        ThrottleBucket.take("k", capacity=2, period=60, now=now)
+        # An hour idle refills to the capacity, not beyond.
+        for _ in range(2):
+            self.assertIsNone(ThrottleBucket.take("k", capacity=2, period=60, now=now + 3600))
+        self.assertIsNotNone(ThrottleBucket.take("k", capacity=2, period=60, now=now + 3600))
+
+    def test_full_buckets_are_purged_as_new_keys_arrive(self):
+        ThrottleBucket.take("old", capacity=1, period=60, now=0.0)
+        ThrottleBucket.take("new", capacity=1, period=60, now=1000.0)
+        self.assertEqual(ThrottleBucket.objects.count(), 1)
+
+
+class SuggestTests(TestCase):
+    def setUp(self):
+        index.invalidate()
+        self.client = APIClient()
+
+    def suggest(self, q: str, **params) -> list[str]:
+        response = self.client.get("/api/v1/suggest/", {"q": q, **params})
+        self.assertEqual(response.status_code, 200, response.content)
+        return [entry["slug"] for entry in response.json()["results"]]
+
+    def project(self, slug: str, **fields) -> Project:
+        return Project.objects.create(title=slug.replace("-", " ").title(), slug=slug, status=PublishStatus.PUBLISHED, **fields)
+
+    def test_word_prefixes_of_published_titles(self):
+        Post.objects.create(
+            title="Scaling Django", slug="scaling-django", content="x",
+            status=PublishStatus.PUBLISHED, published_at=timezone.now(),
+        )
+        Post.objects.create(title="Django drafts", slug="draft", content="x")
+        self.assertEqual(self.suggest("dja"), ["scaling-django"])
+        self.assertEqual(self.suggest("SCAL"), ["scaling-django"])
+        self.assertEqual(self.suggest("dja", kind="project"), [])
+
+    def test_hidden_projects_are_not_suggested(self):
+        self.project("zebra-public")
+        self.project("zebra-secret", is_confidential=True)
+        Project.objects.create(title="Zebra Draft", slug="zebra-draft")
+        self.assertEqual(self.suggest("zeb"), ["zebra-public"])
+
+    def test_saves_update_the_index(self):
+        project = self.project("zebra-public")
+        self.assertEqual(self.suggest("zeb"), ["zebra-public"])
+        with self.captureOnCommitCallbacks(execute=True):
+            project.is_confidential = True
+            project.save()
+        self.assertEqual(self.suggest("zeb"), [])
+        self.assertEqual(CacheGeneration.current("suggest"), 1)
+
+    @override_settings(CACHE_GENERATION_CHECK_SECONDS=0)
+    def test_changes_made_by_other_processes_are_picked_up(self):
+        project = self.project("zebra-public")
+        self.assertEqual(self.suggest("zeb"), ["zebra-public"])
+        # Another worker hides the project: this process gets no signal, only the bumped generation.
+        Project.objects.filter(pk=project.pk).update(is_confidential=True)
+        self.assertEqual(self.suggest("zeb"), ["zebra-public"])
+        CacheGeneration.bump("suggest")
+        self.assertEqual(self.suggest("zeb"), [])
+
+    def test_limit_is_validated(self):
+        self.assertEqual(self.client.get("/api/v1/suggest/", {"q": "a", "limit": 0}).status_code, 400)
+        self.assertEqual(self.client.get("/api/v1/suggest/", {"q": "a", "limit": "x"}).status_code, 400)
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        now = timezone.now()
+        # Pairs share a published_at, so pages must break ties on the primary key.
+        for i in range(7):
+            Post.objects.create(
+                title=f"Post {i}", slug=f"post-{i}", content="x",
+                status=PublishStatus.PUBLISHED, published_at=now - timedelta(days=i // 2),
+            )
+
+    def get(self, url, params=None) -> dict:
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def slugs(self, page) -> list[str]:
+        return [p["slug"] for p in page["results"]]
+
+    def test_forward_and_backward_walks(self):
+        expected = self.slugs(self.get("/api/v1/content/posts/", {"page_size": 100}))
+        page = self.get("/api/v1/content/posts/", {"cursor": "", "page_size": 3})
+        self.assertIsNone(page["previous"])
+        pages = [self.slugs(page)]
+        while page["next"]:
+            page = self.get(page["next"])
+            pages.append(self.slugs(page))
+        self.assertEqual([len(p) for p in pages], [3, 3, 1])
+        self.assertEqual(sum(pages, []), expected)
+
+        back = []
+        while page["previous"]:
+            page = self.get(page["previous"])
+            back.append(self.slugs(page))
+        self.assertEqual(back, pages[-2::-1])
+        self.assertNotIn("count", page)
+
+    def test_explicit_ordering_and_approximate_count(self):
+        page = self.get("/api/v1/content/posts/", {"cursor": "", "page_size": 4, "ordering": "title", "count": "approx"})
+        self.assertEqual(page["approximate_count"], 7)
+        self.assertEqual(self.slugs(page), ["post-0", "post-1", "post-2", "post-3"])
+        self.assertNotIn("count=", page["next"])
+        self.assertEqual(self.slugs(self.get(page["next"])), ["post-4", "post-5", "post-6"])
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get("/api/v1/content/posts/", {"cursor": "nope"}).status_code, 404)
+
+
+class AsyncReadViewTests(TestCase):
+    def test_incomplete_subclasses_fail_in_as_view(self):
+        fallback = PostViewSet.as_view({"get": "list"})
+        with self.assertRaisesMessage(ImproperlyConfigured, "must implement get()"):
+            type("NoGet", (AsyncReadView,), {"fallback": fallback}).as_view()
+        with self.assertRaisesMessage(ImproperlyConfigured, "must set fallback"):
+            type("NoFallback", (AsyncReadView,), {"get": PostListAsyncView.get}).as_view()
+        with self.assertRaisesMessage(ImproperlyConfigured, "get_queryset() or override get_page()"):
+            type("NoRows", (AsyncPublicListView,), {"fallback": fallback, "serializer_class": PostListSerializer}).as_view()
+        self.assertTrue(callable(PostListAsyncView.as_view()))
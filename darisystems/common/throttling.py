@@ -0,0 +1,65 @@
+"""
+Token-bucket throttles for the public write endpoints.
+
+Rates use DRF's "<burst>/<period>" format from DEFAULT_THROTTLE_RATES: the bucket
+holds <burst> tokens and refills continuously at <burst> per <period>, so clients
+get a short burst and then a steady rate instead of a fixed-window cliff.
+
+Buckets are rows of common.models.ThrottleBucket, shared by every worker process
+through the database (no external service): each request refills and spends with one
+conditional UPDATE, and a rejection adds one indexed read. Full buckets are dropped
+in small batches as new keys arrive. Throttles run in APIView.initial(), before the
+handler validates anything.
+"""
+from __future__ import annotations
+
+from rest_framework.exceptions import ParseError
+from rest_framework.throttling import SimpleRateThrottle
+
+from .models import ThrottleBucket
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        self.retry_after = ThrottleBucket.take(self.key, self.num_requests, self.duration, self.now)
+        return self.retry_after is None
+
+    def wait(self):
+        return getattr(self, "retry_after", None)
+
+
+class PublicWriteIPThrottle(TokenBucketThrottle):
+    """Per client IP (X-Forwarded-For aware through NUM_PROXIES)."""
+    scope = "public_write_ip"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class PublicWriteEmailThrottle(TokenBucketThrottle):
+    """
+    Per submitted email address and endpoint (the view's `throttle_scope`), so rotating
+    IPs does not help flood one inbox and subscribing does not use up the contact form.
+    """
+    scope = "public_write_email"
+
+    def get_cache_key(self, request, view):
+        try:
+            email = request.data.get("email")
+        except (ParseError, AttributeError):
+            # Unparseable or non-object bodies are left to the serializer to reject.
+            return None
+        if not isinstance(email, str) or not email.strip():
+            return None
+        endpoint = getattr(view, "throttle_scope", None) or type(view).__name__
+        return self.cache_format % {"scope": f"{self.scope}:{endpoint}", "ident": email.strip().lower()}
+
+
+PUBLIC_WRITE_THROTTLES = [PublicWriteIPThrottle, PublicWriteEmailThrottle]
@@ -1,3 +1,29 @@
-from django.shortcuts import render
+from django.conf import settings
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
 
-# Create your views here.
+from .suggest import index
+
+
+class SuggestView(GenericAPIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        """
+        GET /api/v1/suggest/?q=dja[&limit=8][&kind=post,tag]
+        Type-ahead suggestions from the in-memory prefix index (see common.suggest):
+        published post/project/asset titles, tag and technology names with a word starting with `q`.
+        """
+        max_limit = getattr(settings, "SUGGEST_MAX_LIMIT", 20)
+        try:
+            limit = int(request.query_params.get("limit", getattr(settings, "SUGGEST_DEFAULT_LIMIT", 8)))
+        except ValueError:
+            return Response({"detail": "limit must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+        if not 1 <= limit <= max_limit:
+            return Response({"detail": f"limit must be between 1 and {max_limit}."}, status=status.HTTP_400_BAD_REQUEST)
+
+        kinds = [k for k in request.query_params.get("kind", "").split(",") if k]
+        results = index.suggest(request.query_params.get("q", ""), limit, kinds)
+        return Response({"results": results}, status=status.HTTP_200_OK)
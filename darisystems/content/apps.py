@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class ContentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'content'
+
+    def ready(self):
+        from common import search, suggest
+        from common.models import PublishStatus
+        from .models import Post
+
+        # Must cover PostViewSet.search_fields for the full-text path to be used (else icontains).
+        search.register(Post, ["title", "excerpt", "content"])
+        suggest.register(Post, "post", filters={"status": PublishStatus.PUBLISHED})
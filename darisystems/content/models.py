@@ -11,12 +11,14 @@ from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.db.models import Q
 from django.utils import timezone
-from common.models import TimeStampedModel,TagScope, PublishStatus, _require_published_at_if_published
+from common.models import ReadingStatsModel, TimeStampedModel,TagScope, PublishStatus, _require_published_at_if_published
 
 
 # Crea
 # -----------------------------
-class Post(TimeStampedModel):
+class Post(ReadingStatsModel):
+    reading_fields = ("content",)
+
     title = models.CharField(max_length=200)
     slug = models.SlugField(max_length=220, unique=True)
     excerpt = models.CharField(max_length=500, blank=True, null=True)
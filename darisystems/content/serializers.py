@@ -1,14 +1,37 @@
 from rest_framework import serializers
+from common.search import SearchHitMixin
 from common.models import Tag, TagScope, PublishStatus
 from .models import Post, PostTagMap
 
-class PostReadSerializer(serializers.ModelSerializer):
+class PostListSerializer(SearchHitMixin, serializers.ModelSerializer):
+    """List item: no body; querysets defer Post.reading_fields (see PostViewSet)."""
+    excerpt = serializers.SerializerMethodField()
+    tags = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Post
+        fields = [
+            "id", "title", "slug", "excerpt",
+            "word_count", "reading_minutes",
+            "status", "published_at", "created_at", "updated_at",
+            "tags",
+        ]
+
+    def get_excerpt(self, obj):
+        return obj.excerpt or obj.auto_excerpt
+
+    def get_tags(self, obj):
+        return [{"name": t.name, "slug": t.slug} for t in obj.tags.all()]
+
+
+class PostReadSerializer(SearchHitMixin, serializers.ModelSerializer):
     tags = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
         fields = [
             "id", "title", "slug", "excerpt", "content",
+            "word_count", "reading_minutes",
             "status", "published_at", "created_at", "updated_at",
             "tags",
         ]
@@ -1,3 +1,105 @@
+from importlib import import_module
+
+from django.apps import apps
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from common.models import PublishStatus, SearchDocument, Tag, TagScope
+from common.search import FullTextSearchFilter
+
+from .models import Post, PostTagMap
+
+
+def publish(title: str, slug: str, content: str, **extra) -> Post:
+    return Post.objects.create(
+        title=title, slug=slug, content=content, status=PublishStatus.PUBLISHED, published_at=timezone.now(), **extra,
+    )
+
+
+class PostSearchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        publish("Scaling Django", "scaling-django", "Partitioning large tables", excerpt="Sharding notes")
+        publish("Hiring", "hiring", "Interviews and take-home tasks")
+
+    def search(self, q: str) -> list[dict]:
+        return self.client.get("/api/v1/content/posts/", {"search": q}).json()["results"]
+
+    def test_matches_word_prefixes(self):
+        [hit] = self.search("partition")
+        self.assertEqual(hit["slug"], "scaling-django")
+        self.assertIn("<mark>Partitioning</mark>", hit["search"]["snippet"])
+
+    def test_every_word_must_match(self):
+        self.assertEqual([h["slug"] for h in self.search("scaling shard")], ["scaling-django"])
+        self.assertEqual(self.search("scaling interviews"), [])
+
+    def test_title_matches_rank_first(self):
+        publish("Notes", "notes", "A word on scaling teams")
+        self.assertEqual([h["slug"] for h in self.search("scaling")], ["scaling-django", "notes"])
+
+    def test_index_follows_saves_and_deletes(self):
+        post = Post.objects.get(slug="hiring")
+        post.content = "Onboarding checklists"
+        post.save()
+        self.assertEqual([h["slug"] for h in self.search("onboard")], ["hiring"])
+        post.delete()
+        self.assertEqual(self.search("onboard"), [])
+
+    def test_backfill_migration_indexes_existing_rows(self):
+        SearchDocument.objects.all().delete()
+        self.assertEqual(self.search("partition"), [])
+        import_module("common.migrations.0005_backfill_search_documents").backfill(apps, None)
+        self.assertEqual([h["slug"] for h in self.search("partition")], ["scaling-django"])
+
+    def test_unindexed_fields_fall_back_to_search_filter(self):
+        view = type("View", (), {"search_fields": ["slug"]})()
+        request = Request(APIRequestFactory().get("/", {"search": "hiring"}))
+        queryset = FullTextSearchFilter().filter_queryset(request, Post.objects.all(), view)
+        self.assertEqual([p.slug for p in queryset], ["hiring"])
+        self.assertNotIn("search_rank", queryset.query.extra_select)
+
+
+class PostListConditionalGetTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.post = publish("Scaling Django", "scaling-django", "Partitioning large tables")
+        self.tag = Tag.objects.create(name="Django", slug="django", scope=TagScope.POST)
+        PostTagMap.objects.create(post=self.post, tag=self.tag)
+
+    def revalidate(self, etag: str):
+        return self.client.get("/api/v1/content/posts/", HTTP_IF_NONE_MATCH=etag)
+
+    def etag(self) -> str:
+        response = self.client.get("/api/v1/content/posts/")
+        self.assertEqual(response.status_code, 200)
+        return response["ETag"]
+
+    def test_unchanged_list_is_not_modified(self):
+        etag = self.etag()
+        response = self.revalidate(etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        # A different page is a different representation.
+        self.assertEqual(
+            self.client.get("/api/v1/content/posts/", {"page_size": 5}, HTTP_IF_NONE_MATCH=etag).status_code, 200,
+        )
+
+    def test_edits_change_the_etag(self):
+        etag = self.etag()
+        self.post.title = "Scaling Django, again"
+        self.post.save()
+        response = self.revalidate(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"][0]["title"], "Scaling Django, again")
+
+        etag = response["ETag"]
+        self.tag.name = "Django ORM"
+        self.tag.save()
+        self.assertEqual(self.revalidate(etag).status_code, 200)
 
-# Create your tests here.
+        etag = self.etag()
+        self.post.delete()
+        self.assertEqual(self.revalidate(etag).status_code, 200)
@@ -1,7 +1,12 @@
+from django.conf import settings
+from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import PostViewSet
+from .views import PostViewSet, PostListAsyncView
 
 router = DefaultRouter()
 router.register(r"posts", PostViewSet, basename="posts")
 
 urlpatterns = router.urls
+
+if settings.ASYNC_PUBLIC_VIEWS:
+    urlpatterns = [path("posts/", PostListAsyncView.as_view(), name="posts-list-async")] + urlpatterns
@@ -3,19 +3,23 @@ from django.shortcuts import render
 # Create your views here.
 from rest_framework.viewsets import ModelViewSet
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.filters import OrderingFilter
 
-from common.models import PublishStatus
+from common.async_views import AsyncPublicListView
+from common.conditional import ConditionalGetMixin
+from common.search import FullTextSearchFilter
+from common.models import PublishStatus, TagScope
 from .models import Post
-from .serializers import PostReadSerializer, PostWriteSerializer
+from .serializers import PostListSerializer, PostReadSerializer, PostWriteSerializer
 from .permissions import IsAdminOrReadOnly
 from .filters import PostFilter
 
-class PostViewSet(ModelViewSet):
+class PostViewSet(ConditionalGetMixin, ModelViewSet):
     permission_classes = [IsAdminOrReadOnly]
+    conditional_tag_scope = TagScope.POST
     lookup_field = "slug"  # slug-based detail URLs
 
-    filter_backends = [DjangoFilterBackend, OrderingFilter, SearchFilter]
+    filter_backends = [DjangoFilterBackend, OrderingFilter, FullTextSearchFilter]
     filterset_class = PostFilter
     ordering_fields = ["published_at", "created_at", "updated_at", "title"]
     search_fields = ["title", "excerpt", "content"]
@@ -25,9 +29,30 @@ class PostViewSet(ModelViewSet):
         user = self.request.user
         if not (user and user.is_staff):
             qs = qs.filter(status=PublishStatus.PUBLISHED)
+        if self.action == "list":
+            # List items carry the stored excerpt/word count; the bodies are never loaded.
+            qs = qs.defer(*Post.reading_fields)
         return qs.order_by("-published_at", "-created_at")
 
     def get_serializer_class(self):
         if self.request.method in ("POST", "PUT", "PATCH"):
             return PostWriteSerializer
+        if self.action == "list":
+            return PostListSerializer
         return PostReadSerializer
+
+
+class PostListAsyncView(AsyncPublicListView):
+    """Async published post list (ASGI); see common.async_views."""
+    fallback = PostViewSet.as_view({"get": "list", "post": "create"})
+    serializer_class = PostListSerializer
+    conditional_fields = ("updated_at",)
+    conditional_tag_scope = TagScope.POST
+
+    def get_queryset(self):
+        return (
+            Post.objects.filter(status=PublishStatus.PUBLISHED)
+            .defer(*Post.reading_fields)
+            .prefetch_related("tags")
+            .order_by("-published_at", "-created_at")
+        )
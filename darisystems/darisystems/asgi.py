@@ -12,5 +12,11 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'darisystems.settings')
+# Serve the hot public reads with their native async views (see common.async_views).
+os.environ.setdefault('DARISYSTEMS_ASYNC_VIEWS', '1')
 
 application = get_asgi_application()
+
+from booking.lifecycle import start_periodic_sweeper  # noqa: E402  (needs the app registry)
+
+start_periodic_sweeper()
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -57,13 +58,19 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.AllowAny",
     ),
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    # Page numbers by default, keyset pages with ?cursor= (common.pagination).
+    "DEFAULT_PAGINATION_CLASS": "common.pagination.KeysetPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
         "rest_framework.filters.OrderingFilter",
         "rest_framework.filters.SearchFilter",
     ],
+    # Token buckets for the public POST endpoints (common.throttling): "<burst>/<period>".
+    "DEFAULT_THROTTLE_RATES": {
+        "public_write_ip": "20/min",
+        "public_write_email": "5/hour",
+    },
 }
 
 
@@ -111,6 +118,10 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'darisystems.wsgi.application'
 
+# Mount the native async public read views (common.async_views). asgi.py switches this on;
+# under WSGI they would only add an async_to_sync hop per request.
+ASYNC_PUBLIC_VIEWS = os.environ.get('DARISYSTEMS_ASYNC_VIEWS') == '1'
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
@@ -119,9 +130,27 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # Take the write lock at BEGIN so concurrent writers queue on the busy
+            # timeout instead of failing on a read->write lock upgrade.
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+        },
     }
 }
 
+# Local Postgres (e.g. for `manage.py bench_booking` comparisons): set POSTGRES_DB and friends.
+# Needs psycopg (see requirements.txt).
+if os.environ.get('POSTGRES_DB'):
+    DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ['POSTGRES_DB'],
+        'USER': os.environ.get('POSTGRES_USER', 'postgres'),
+        'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+        'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+        'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -163,3 +192,68 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Booking
+# Seconds a computed availability window stays cached (also bounds lead-time drift).
+BOOKING_AVAILABILITY_CACHE_TIMEOUT = 60
+# Minutes a new booking request holds its requested time while the requester checks out.
+BOOKING_HOLD_MINUTES = 10
+# Local days that max_bookings_per_day and the day counters refer to.
+BOOKING_CALENDAR_TIMEZONE = TIME_ZONE
+# Seconds between full reloads of the published-service catalog (edits reach other processes via CACHE_GENERATION_CHECK_SECONDS).
+BOOKING_CATALOG_TTL_SECONDS = 60
+# Seconds between in-process lifecycle sweeps per server process (0 = off; use manage.py sweep_bookings).
+BOOKING_LIFECYCLE_SWEEP_SECONDS = 0
+# Days after their last change that closed bookings move to the archive tables (manage.py archive_bookings).
+BOOKING_ARCHIVE_AFTER_DAYS = 180
+# Free start times kept per service and duration for the services list, and how far ahead to look for them.
+BOOKING_NEXT_SLOTS_COUNT = 5
+BOOKING_NEXT_SLOTS_HORIZON_DAYS = 30
+# Capacity report (admin/reports/capacity/): days back and ahead of today, and seconds a computed report is served from cache.
+BOOKING_REPORT_PAST_DAYS = 365
+BOOKING_REPORT_AHEAD_DAYS = 92
+BOOKING_REPORT_CACHE_TIMEOUT = 3600
+# Booking notifications: attempts before an outbox event is marked FAILED, and the retry backoff
+# (BACKOFF * 2^(attempt-1) seconds, capped). LEASE is how long a claimed batch is hidden from other workers.
+BOOKING_OUTBOX_MAX_ATTEMPTS = 8
+BOOKING_OUTBOX_BACKOFF_SECONDS = 30
+BOOKING_OUTBOX_MAX_BACKOFF_SECONDS = 3600
+BOOKING_OUTBOX_LEASE_SECONDS = 300
+
+
+# Email
+# Local SMTP stand-in for development, e.g. `python -m aiosmtpd -n -l localhost:1025`.
+EMAIL_HOST = "localhost"
+EMAIL_PORT = 1025
+DEFAULT_FROM_EMAIL = "bookings@darisystems.local"
+
+
+# Pagination
+# Largest ?page_size= a client may ask for on list endpoints.
+PAGINATION_MAX_PAGE_SIZE = 100
+
+
+# Content lists
+# Reading speed behind the reading_minutes of posts, projects and assets.
+READING_WORDS_PER_MINUTE = 200
+
+
+# Search suggestions (GET /api/v1/suggest/)
+# Seconds between full rebuilds of the suggestion index (edits reach other processes via CACHE_GENERATION_CHECK_SECONDS).
+SUGGEST_TTL_SECONDS = 300
+# Suggestions returned per query by default, and the most a client may ask for with ?limit=.
+SUGGEST_DEFAULT_LIMIT = 8
+SUGGEST_MAX_LIMIT = 20
+
+
+# In-process caches (service catalog, suggestion index)
+# Seconds another worker process may serve a cache after an edit, before checking its shared generation row.
+CACHE_GENERATION_CHECK_SECONDS = 1
+
+
+# Idempotency keys
+# Hours a stored Idempotency-Key response can be replayed (purge_idempotency_keys removes older rows).
+IDEMPOTENCY_KEY_TTL_HOURS = 24
+# Seconds after which an unfinished request's key reservation is considered abandoned.
+IDEMPOTENCY_KEY_LOCK_SECONDS = 60
@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'darisystems.settings')
 
 application = get_wsgi_application()
+
+from booking.lifecycle import start_periodic_sweeper  # noqa: E402  (needs the app registry)
+
+start_periodic_sweeper()
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.11 on 2026-10-17 19:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactsubmission',
+            index=models.Index(fields=['created_at', 'id'], name='idx_contact_created'),
+        ),
+        migrations.AddIndex(
+            model_name='subscriber',
+            index=models.Index(fields=['created_at', 'id'], name='idx_subscriber_created'),
+        ),
+    ]
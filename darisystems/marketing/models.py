@@ -23,6 +23,7 @@ class ContactSubmission(TimeStampedModel):
         indexes = [
             models.Index(fields=["status", "created_at"], name="idx_contact_status_created"),
             models.Index(fields=["email", "created_at"], name="idx_contact_email_created"),
+            models.Index(fields=["created_at", "id"], name="idx_contact_created"),
         ]
 
 
@@ -40,6 +41,7 @@ class Subscriber(TimeStampedModel):
     class Meta:
         indexes = [
             models.Index(fields=["status"], name="idx_subscriber_status"),
+            models.Index(fields=["created_at", "id"], name="idx_subscriber_created"),
         ]
 
     def unsubscribe(self):
@@ -1,3 +1,84 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from .models import ContactSubmission, Subscriber
+
+
+class IdempotentPublicWriteTests(TestCase):
+    """Public writes sent with an Idempotency-Key (the throttles read the body first)."""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def post(self, url, data, key):
+        return self.client.post(url, data, format="json", HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_contact_with_key(self):
+        data = {"full_name": "Ada", "email": "ada@example.com", "subject": "Hi", "message": "Hello"}
+        first = self.post("/api/v1/marketing/contact/", data, "contact-1")
+        self.assertEqual(first.status_code, 201, first.content)
+        again = self.post("/api/v1/marketing/contact/", data, "contact-1")
+        self.assertEqual(again.status_code, 201)
+        self.assertEqual(again["Idempotent-Replayed"], "true")
+        self.assertEqual(again.json(), first.json())
+        self.assertEqual(ContactSubmission.objects.count(), 1)
+
+    def test_subscribe_with_key(self):
+        first = self.post("/api/v1/marketing/subscribe/", {"email": "sub@example.com"}, "subscribe-1")
+        self.assertEqual(first.status_code, 200, first.content)
+        again = self.post("/api/v1/marketing/subscribe/", {"email": "sub@example.com"}, "subscribe-1")
+        self.assertEqual(again["Idempotent-Replayed"], "true")
+        self.assertEqual(Subscriber.objects.count(), 1)
+
+    def test_key_reused_with_a_different_body(self):
+        self.post("/api/v1/marketing/subscribe/", {"email": "one@example.com"}, "subscribe-2")
+        response = self.post("/api/v1/marketing/subscribe/", {"email": "two@example.com"}, "subscribe-2")
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(list(Subscriber.objects.values_list("email", flat=True)), ["one@example.com"])
+
+    def test_form_encoded_replay(self):
+        data = {"full_name": "Ada", "email": "ada@example.com", "subject": "Hi", "message": "Hello"}
+        first = self.client.post("/api/v1/marketing/contact/", data, HTTP_IDEMPOTENCY_KEY="form-1")
+        self.assertEqual(first.status_code, 201, first.content)
+        again = self.client.post("/api/v1/marketing/contact/", data, HTTP_IDEMPOTENCY_KEY="form-1")
+        self.assertEqual(again["Idempotent-Replayed"], "true")
+        self.assertEqual(ContactSubmission.objects.count(), 1)
+
+    def test_failed_attempt_releases_the_key(self):
+        rejected = self.post("/api/v1/marketing/subscribe/", {"email": "not an email"}, "subscribe-3")
+        self.assertEqual(rejected.status_code, 400)
+        retried = self.post("/api/v1/marketing/subscribe/", {"email": "fixed@example.com"}, "subscribe-3")
+        self.assertEqual(retried.status_code, 200)
+        self.assertNotIn("Idempotent-Replayed", retried)
+
+    def test_overlong_key(self):
+        response = self.post("/api/v1/marketing/subscribe/", {"email": "sub@example.com"}, "k" * 256)
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Subscriber.objects.exists())
+
+
+class PublicWriteThrottleTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def subscribe(self, email, ip="10.0.0.1"):
+        return self.client.post("/api/v1/marketing/subscribe/", {"email": email}, format="json", REMOTE_ADDR=ip)
+
+    def test_ip_bucket_rejects_before_validation(self):
+        for i in range(20):
+            self.assertEqual(self.subscribe(f"user{i}@example.com").status_code, 200)
+        response = self.client.post("/api/v1/marketing/subscribe/", {"email": "not an email"}, format="json", REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response["Retry-After"]), 0)
+        self.assertEqual(self.subscribe("other@example.com", ip="10.0.0.2").status_code, 200)
+
+    def test_email_bucket_is_per_endpoint(self):
+        for i in range(5):
+            self.assertEqual(self.subscribe("flood@example.com", ip=f"10.0.1.{i}").status_code, 200)
+        self.assertEqual(self.subscribe("flood@example.com", ip="10.0.1.9").status_code, 429)
+        contact = self.client.post(
+            "/api/v1/marketing/contact/",
+            {"full_name": "F", "email": "Flood@example.com", "subject": "S", "message": "M"},
+            format="json", REMOTE_ADDR="10.0.2.1",
+        )
+        self.assertEqual(contact.status_code, 201)
@@ -6,6 +6,9 @@ from rest_framework.permissions import AllowAny
 from rest_framework.filters import OrderingFilter, SearchFilter
 from django_filters.rest_framework import DjangoFilterBackend
 
+from common.idempotency import idempotent
+from common.throttling import PUBLIC_WRITE_THROTTLES
+
 from .models import ContactSubmission, Subscriber, SubscriberStatus
 from .serializers import (
     ContactSubmissionCreateSerializer,
@@ -24,7 +27,10 @@ from .filters import ContactSubmissionFilter, SubscriberFilter
 class ContactSubmissionCreateView(GenericAPIView):
     permission_classes = [AllowAny]
     serializer_class = ContactSubmissionCreateSerializer
+    throttle_classes = PUBLIC_WRITE_THROTTLES
+    throttle_scope = "contact"
 
+    @idempotent
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -35,7 +41,10 @@ class ContactSubmissionCreateView(GenericAPIView):
 class SubscribeView(GenericAPIView):
     permission_classes = [AllowAny]
     serializer_class = SubscribeSerializer
+    throttle_classes = PUBLIC_WRITE_THROTTLES
+    throttle_scope = "subscribe"
 
+    @idempotent
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -56,6 +65,8 @@ class SubscribeView(GenericAPIView):
 class UnsubscribeView(GenericAPIView):
     permission_classes = [AllowAny]
     serializer_class = UnsubscribeSerializer
+    throttle_classes = PUBLIC_WRITE_THROTTLES
+    throttle_scope = "unsubscribe"
 
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
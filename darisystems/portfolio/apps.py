@@ -4,3 +4,13 @@ from django.apps import AppConfig
 class PortfolioConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'portfolio'
+
+    def ready(self):
+        from common import search, suggest
+        from common.models import PublishStatus
+        from .models import Project, Technology
+
+        # Must cover ProjectViewSet.search_fields for the full-text path to be used (else icontains).
+        search.register(Project, ["title", "summary", "content", "industry", "client_name"])
+        suggest.register(Project, "project", filters={"status": PublishStatus.PUBLISHED, "is_confidential": False})
+        suggest.register(Technology, "technology", label="name")
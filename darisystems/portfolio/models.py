@@ -11,14 +11,17 @@ from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.db.models import Q
 from django.utils import timezone
-from common.models import TimeStampedModel,TagScope, PublishStatus, _require_published_at_if_published
+from common.models import ReadingStatsModel, TimeStampedModel,TagScope, PublishStatus, _require_published_at_if_published
 
 
 
 # -----------------------------
 # Portfolio
 # -----------------------------
-class Project(TimeStampedModel):
+class Project(ReadingStatsModel):
+    # The write-up columns: deferred on list pages, counted into word_count.
+    reading_fields = ("content", "problem_statement", "solution_overview", "impact")
+
     title = models.CharField(max_length=200)
     slug = models.SlugField(max_length=220, unique=True)
     summary = models.CharField(max_length=500, blank=True, null=True)
@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from common.search import SearchHitMixin
 from .models import Project
 
 class ProjectSerializer(serializers.ModelSerializer):
@@ -7,12 +8,32 @@ class ProjectSerializer(serializers.ModelSerializer):
         fields = ["id", "title", "slug", "summary", "content", "is_featured", "published_at"]
 
 
-class ProjectReadSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(SearchHitMixin, serializers.ModelSerializer):
+    """List item: no write-up; querysets defer Project.reading_fields (see ProjectViewSet)."""
+    excerpt = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Project
+        fields = [
+            "id", "title", "slug", "summary", "excerpt",
+            "word_count", "reading_minutes",
+            "client_name", "industry",
+            "is_confidential", "is_featured",
+            "status", "published_at",
+            "created_at", "updated_at",
+        ]
+
+    def get_excerpt(self, obj):
+        return obj.summary or obj.auto_excerpt
+
+
+class ProjectReadSerializer(SearchHitMixin, serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = [
             "id", "title", "slug", "summary", "content",
             "problem_statement", "solution_overview", "impact",
+            "word_count", "reading_minutes",
             "client_name", "industry",
             "is_confidential", "is_featured",
             "status", "published_at",
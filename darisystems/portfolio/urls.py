@@ -1,8 +1,12 @@
+from django.conf import settings
+from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import ProjectViewSet
+from .views import ProjectViewSet, ProjectListAsyncView
 
 router = DefaultRouter()
 router.register(r"projects", ProjectViewSet, basename="projects")
 
 urlpatterns = router.urls
 
+if settings.ASYNC_PUBLIC_VIEWS:
+    urlpatterns = [path("projects/", ProjectListAsyncView.as_view(), name="projects-list-async")] + urlpatterns
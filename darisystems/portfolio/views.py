@@ -1,14 +1,17 @@
 from django.shortcuts import render
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.filters import OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 # Create your views here.
 from rest_framework.generics import ListAPIView
 from rest_framework.viewsets import ModelViewSet
 
+from common.async_views import AsyncPublicListView
+from common.conditional import ConditionalGetMixin
+from common.search import FullTextSearchFilter
 from common.models import PublishStatus  # or wherever your PublishStatus lives
-from common.models import PublishStatus
+from common.models import PublishStatus, TagScope
 from .models import Project
-from .serializers import ProjectReadSerializer, ProjectWriteSerializer, ProjectSerializer
+from .serializers import ProjectListSerializer, ProjectReadSerializer, ProjectWriteSerializer, ProjectSerializer
 from .permissions import IsAdminOrReadOnly
 
 
@@ -28,9 +31,10 @@ class ProjectListView(ListAPIView):
 
 
 
-class ProjectViewSet(ModelViewSet):
+class ProjectViewSet(ConditionalGetMixin, ModelViewSet):
     permission_classes = [IsAdminOrReadOnly]
-    filter_backends = [DjangoFilterBackend, OrderingFilter, SearchFilter]
+    conditional_tag_scope = TagScope.PROJECT
+    filter_backends = [DjangoFilterBackend, OrderingFilter, FullTextSearchFilter]
 
     filterset_fields = ["is_featured", "status", "industry"]
     ordering_fields = ["published_at", "created_at", "updated_at", "title"]
@@ -44,9 +48,29 @@ class ProjectViewSet(ModelViewSet):
         if not (user and user.is_staff):
             qs = qs.filter(status=PublishStatus.PUBLISHED, is_confidential=False)
 
+        if self.action == "list":
+            # List items carry the stored excerpt/word count; the write-up columns are never loaded.
+            qs = qs.defer(*Project.reading_fields)
         return qs.order_by("-published_at", "-created_at")
 
     def get_serializer_class(self):
         if self.request.method in ("POST", "PUT", "PATCH"):
             return ProjectWriteSerializer
+        if self.action == "list":
+            return ProjectListSerializer
         return ProjectReadSerializer
+
+
+class ProjectListAsyncView(AsyncPublicListView):
+    """Async published project list (ASGI); see common.async_views."""
+    fallback = ProjectViewSet.as_view({"get": "list", "post": "create"})
+    serializer_class = ProjectListSerializer
+    conditional_fields = ("updated_at",)
+    conditional_tag_scope = TagScope.PROJECT
+
+    def get_queryset(self):
+        return (
+            Project.objects.filter(status=PublishStatus.PUBLISHED, is_confidential=False)
+            .defer(*Project.reading_fields)
+            .order_by("-published_at", "-created_at")
+        )